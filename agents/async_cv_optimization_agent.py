@@ -0,0 +1,205 @@
+import asyncio
+import logging
+import time
+from typing import AsyncIterator, Iterable, List, Optional
+
+from openai import AsyncOpenAI, OpenAI, OpenAIError
+from pydantic import BaseModel
+
+from agents.cv_optimization_agent import OpenAICVOptimizationAgent
+from agents.retry_policy import RetryPolicy
+from agents.prompt_builder import PromptBuilder
+from agents.optimization_response import (
+    OptimizationResponseError,
+    completion_content,
+    parse_optimization_response,
+)
+from models.cv import CV
+from models.job import Job
+from models.optimized_cv import OptimizedCV
+from storage.optimization_cache import OptimizationCache
+
+logger = logging.getLogger(__name__)
+
+
+class OptimizationOutcome(BaseModel):
+    """
+    Result of optimizing one job in a batch. Exactly one of
+    optimized_cv / error is set.
+    """
+
+    job: Job
+    optimized_cv: Optional[OptimizedCV] = None
+    error: Optional[str] = None
+    elapsed_seconds: float = 0.0
+
+
+class AsyncRateLimiter:
+    """
+    Spaces request starts so that at most requests_per_minute are sent.
+    """
+
+    def __init__(self, requests_per_minute: int):
+        self.interval = 60.0 / requests_per_minute
+        self._next_slot = 0.0
+
+    async def wait(self) -> None:
+        now = time.monotonic()
+        slot = max(now, self._next_slot)
+        self._next_slot = slot + self.interval
+
+        if slot > now:
+            await asyncio.sleep(slot - now)
+
+
+class AsyncOpenAICVOptimizationAgent(OpenAICVOptimizationAgent):
+    """
+    OpenAI CV optimizer that can tailor a CV to many jobs concurrently.
+
+    optimize_many() runs up to max_concurrency requests at once, paces them
+    to requests_per_minute and yields outcomes as they complete. Prompts,
+    caching and the synchronous optimize() are inherited unchanged, so the
+    graph can keep using this agent one job at a time.
+    """
+
+    def __init__(
+        self,
+        cache: Optional[OptimizationCache] = None,
+        max_concurrency: int = 16,
+        requests_per_minute: Optional[int] = 500,
+        async_client: Optional[AsyncOpenAI] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+        prompt_builder: Optional[PromptBuilder] = None,
+        client: Optional[OpenAI] = None,
+        base_url: Optional[str] = None,
+    ):
+        super().__init__(
+            cache=cache,
+            retry_policy=retry_policy,
+            prompt_builder=prompt_builder,
+            client=client,
+            base_url=base_url,
+        )
+        self.max_concurrency = max_concurrency
+        self.requests_per_minute = requests_per_minute
+        self.async_client = async_client
+        self._owns_async_client = async_client is None
+
+    async def optimize_many(self, cv: CV, jobs: Iterable[Job]) -> AsyncIterator[OptimizationOutcome]:
+        """
+        Optimize cv for every job, yielding outcomes in completion order.
+        A failing job yields an outcome with error set; it never aborts the batch.
+        """
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+        limiter = AsyncRateLimiter(self.requests_per_minute) if self.requests_per_minute else None
+
+        async def run_one(job: Job) -> OptimizationOutcome:
+            started = time.perf_counter()
+            try:
+                optimized_cv = await self.optimize_async(cv, job, semaphore, limiter)
+                return OptimizationOutcome(
+                    job=job,
+                    optimized_cv=optimized_cv,
+                    elapsed_seconds=time.perf_counter() - started,
+                )
+            except Exception as e:
+                return OptimizationOutcome(
+                    job=job,
+                    error=str(e),
+                    elapsed_seconds=time.perf_counter() - started,
+                )
+
+        tasks = [asyncio.ensure_future(run_one(job)) for job in jobs]
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                yield await next_done
+        finally:
+            for task in tasks:
+                task.cancel()
+
+    def optimize_all(self, cv: CV, jobs: Iterable[Job]) -> List[OptimizationOutcome]:
+        """
+        Blocking wrapper around optimize_many() for synchronous callers.
+        """
+
+        async def collect() -> List[OptimizationOutcome]:
+            try:
+                return [outcome async for outcome in self.optimize_many(cv, jobs)]
+            finally:
+                await self.aclose()
+
+        started = time.perf_counter()
+        outcomes = asyncio.run(collect())
+
+        failed = sum(1 for outcome in outcomes if outcome.error)
+        logger.info(
+            "Batch optimization done | jobs=%d | failed=%d | elapsed=%.1fs",
+            len(outcomes),
+            failed,
+            time.perf_counter() - started,
+        )
+        return outcomes
+
+    async def optimize_async(
+        self,
+        cv: CV,
+        job: Job,
+        semaphore: Optional[asyncio.Semaphore] = None,
+        limiter: Optional[AsyncRateLimiter] = None,
+    ) -> OptimizedCV:
+        cache_key, cached = self._cache_lookup(cv, job)
+        if cached is not None:
+            return cached
+
+        semaphore = semaphore or asyncio.Semaphore(1)
+
+        async def call_openai():
+            # Backoff sleeps happen outside the semaphore so a
+            # throttled job does not hold a concurrency slot
+            async with semaphore:
+                if limiter is not None:
+                    await limiter.wait()
+                return await self._get_async_client().chat.completions.create(
+                    **self._request_params(cv, job)
+                )
+
+        logger.info(
+            "Optimizing CV (async) | job=%s | company=%s",
+            job.title,
+            job.company,
+        )
+
+        async def call_and_parse() -> OptimizedCV:
+            response = await call_openai()
+            self._log_usage(job, response)
+            return parse_optimization_response(cv, job, completion_content(response.choices[0].message))
+
+        try:
+            optimized_cv = await self.retry_policy.acall(call_and_parse)
+        except (OpenAIError, OptimizationResponseError) as e:
+            logger.error(
+                "CV optimization failed | job=%s | company=%s | error=%s",
+                job.title,
+                job.company,
+                str(e),
+            )
+            raise
+
+        if self.cache is not None:
+            self.cache.put(cache_key, optimized_cv.model_dump_json())
+
+        return optimized_cv
+
+    async def aclose(self) -> None:
+        """
+        Close the async client created by this agent. A new one is created
+        on next use, so the agent can be reused from another event loop.
+        """
+        if self._owns_async_client and self.async_client is not None:
+            await self.async_client.close()
+            self.async_client = None
+
+    def _get_async_client(self) -> AsyncOpenAI:
+        if self.async_client is None:
+            self.async_client = AsyncOpenAI(base_url=self.base_url, max_retries=0)
+        return self.async_client
@@ -0,0 +1,183 @@
+import hashlib
+import json
+import logging
+import os
+from typing import Dict, Iterable, List, Optional
+
+from agents.cv_optimization_agent import OpenAICVOptimizationAgent
+from agents.optimization_response import OptimizationResponseError, parse_optimization_response
+from models.cv import CV
+from models.durable_job_queue import job_key
+from models.job import Job
+from models.optimized_cv import OptimizedCV
+
+logger = logging.getLogger(__name__)
+
+CHAT_COMPLETIONS_URL = "/v1/chat/completions"
+
+
+def batch_custom_id(job: Job) -> str:
+    """
+    Stable Batch API custom_id for a job, derived from its id when present.
+    """
+    if job.id:
+        return f"job-{job.id}"
+    return "job-" + hashlib.sha1(job_key(job).encode("utf-8")).hexdigest()[:16]
+
+
+def manifest_path_for(requests_path: str) -> str:
+    return requests_path + ".manifest.jsonl"
+
+
+class BatchCVOptimizer:
+    """
+    Offline OpenAI Batch API mode for an OpenAICVOptimizationAgent.
+
+    write_requests() turns every pending job into one Batch API request line
+    (same parameters as the agent's synchronous call) plus a manifest line
+    mapping its custom_id back to the job. Once the batch has finished,
+    ingest_results() rebuilds OptimizedCV objects from the result file and
+    stores them in the agent's cache, where the graph picks them up without
+    calling OpenAI again.
+    """
+
+    def __init__(self, agent: OpenAICVOptimizationAgent):
+        self.agent = agent
+
+    def write_requests(self, cv: CV, jobs: Iterable[Job], path: str) -> int:
+        """
+        Write Batch API requests for every job not already cached.
+        Returns the number of requests written.
+        """
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        written = 0
+        seen = set()
+        with open(path, "w", encoding="utf-8") as requests_file, open(
+            manifest_path_for(path), "w", encoding="utf-8"
+        ) as manifest_file:
+            for job in jobs:
+                custom_id = batch_custom_id(job)
+                if custom_id in seen:
+                    continue
+                seen.add(custom_id)
+
+                cache_key, cached = self.agent._cache_lookup(cv, job)
+                if cached is not None:
+                    continue
+
+                requests_file.write(json.dumps({
+                    "custom_id": custom_id,
+                    "method": "POST",
+                    "url": CHAT_COMPLETIONS_URL,
+                    "body": self.agent._request_params(cv, job),
+                }) + "\n")
+                manifest_file.write(json.dumps({
+                    "custom_id": custom_id,
+                    "cache_key": cache_key,
+                    "job": job.model_dump(mode="json"),
+                }) + "\n")
+                written += 1
+
+        logger.info("Batch requests written | path=%s | requests=%d", path, written)
+        return written
+
+    def submit(self, path: str, completion_window: str = "24h") -> str:
+        """
+        Upload a request file and start an OpenAI batch. Returns the batch id.
+        """
+        client = self.agent.client
+        with open(path, "rb") as f:
+            input_file = client.files.create(file=f, purpose="batch")
+
+        batch = client.batches.create(
+            input_file_id=input_file.id,
+            endpoint=CHAT_COMPLETIONS_URL,
+            completion_window=completion_window,
+        )
+        logger.info("Batch submitted | batch_id=%s | input=%s", batch.id, path)
+        return batch.id
+
+    def download_results(self, batch_id: str, output_path: str) -> bool:
+        """
+        Save the output file of a finished batch. Returns False while it is still running.
+        """
+        client = self.agent.client
+        batch = client.batches.retrieve(batch_id)
+        if batch.status != "completed" or not batch.output_file_id:
+            logger.info("Batch not ready | batch_id=%s | status=%s", batch_id, batch.status)
+            return False
+
+        content = client.files.content(batch.output_file_id)
+        with open(output_path, "wb") as f:
+            f.write(content.read())
+        return True
+
+    def ingest_results(
+        self,
+        cv: CV,
+        results_path: str,
+        requests_path: str,
+    ) -> Dict[str, OptimizedCV]:
+        """
+        Turn a Batch API result file into OptimizedCV objects keyed by custom_id.
+        Successful results are written to the agent's cache; failed requests
+        are logged and left out, so those jobs fall back to a live call.
+        """
+        manifest: Dict[str, dict] = {}
+        with open(manifest_path_for(requests_path), "r", encoding="utf-8") as f:
+            for line in f:
+                if line.strip():
+                    entry = json.loads(line)
+                    manifest[entry["custom_id"]] = entry
+
+        optimized: Dict[str, OptimizedCV] = {}
+        failed: List[str] = []
+
+        with open(results_path, "r", encoding="utf-8") as f:
+            for line in f:
+                if not line.strip():
+                    continue
+                result = json.loads(line)
+                custom_id = result.get("custom_id")
+                entry = manifest.get(custom_id)
+
+                content = self._completion_content(result)
+                if entry is None or content is None:
+                    failed.append(custom_id)
+                    continue
+
+                try:
+                    optimized_cv = parse_optimization_response(
+                        cv, Job.model_validate(entry["job"]), content
+                    )
+                except OptimizationResponseError:
+                    failed.append(custom_id)
+                    continue
+                optimized[custom_id] = optimized_cv
+
+                if self.agent.cache is not None and entry.get("cache_key"):
+                    self.agent.cache.put(entry["cache_key"], optimized_cv.model_dump_json())
+
+        if failed:
+            logger.warning("Batch results failed | count=%d | ids=%s", len(failed), failed[:10])
+        logger.info(
+            "Batch results ingested | optimized=%d | failed=%d", len(optimized), len(failed)
+        )
+        return optimized
+
+    @staticmethod
+    def _completion_content(result: dict) -> Optional[str]:
+        if result.get("error"):
+            return None
+
+        response = result.get("response") or {}
+        if response.get("status_code") != 200:
+            return None
+
+        try:
+            return response["body"]["choices"][0]["message"]["content"]
+        except (KeyError, IndexError, TypeError, AttributeError):
+            return None
@@ -1,11 +1,20 @@
 import logging
-import time
 from abc import ABC, abstractmethod
+from typing import Optional, Tuple
 from openai import OpenAI, OpenAIError
 
 from models.cv import CV
 from models.job import Job
 from models.optimized_cv import OptimizedCV
+from storage.optimization_cache import OptimizationCache
+from agents.retry_policy import RetryPolicy
+from agents.prompt_builder import PromptBuilder
+from agents.optimization_response import (
+    RESPONSE_FORMAT,
+    OptimizationResponseError,
+    completion_content,
+    parse_optimization_response,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -35,84 +44,177 @@ class OpenAICVOptimizationAgent(CVOptimizationAgent):
     """
     CV optimization agent using OpenAI.
     Responsible for tailoring a CV to a specific job description using OpenAI.
-    """
 
-    def __init__(self):
-        self.client = OpenAI()
+    A single JSON-schema constrained call returns every tailored section
+    and the cover letter (see agents.optimization_response).
 
-    def optimize(self, cv: CV, job: Job) -> OptimizedCV:
-        max_retries = 3
-        delay = 2  # seconds
-
-        for attempt in range(1, max_retries + 1):
-            try:
-                logger.info(
-                    "Optimizing CV | attempt=%d | job=%s | company=%s",
-                    attempt,
-                    job.title,
-                    job.company,
-                )
-
-                full_text = self._call_openai(cv, job)
-
-                return OptimizedCV(
-                    original_cv=cv,
-                    job=job,
-                    full_text=full_text,
-                )
-
-            except OpenAIError as e:
-                logger.warning(
-                    "OpenAI failure | attempt=%d | job=%s | error=%s",
-                    attempt,
-                    job.title,
-                    str(e),
-                )
-
-                if attempt == max_retries:
-                    logger.error(
-                        "CV optimization failed after retries | job=%s | company=%s",
-                        job.title,
-                        job.company,
-                    )
-                    raise
-
-                time.sleep(delay)
+    If a cache is provided, results are looked up by a hash of every input
+    that influences the completion, so re-runs and retries cost no tokens.
 
-    def _call_openai(self, cv: CV, job: Job) -> str:
-        """
-        Low-level OpenAI call. This is the ONLY place that talks to OpenAI.
-        """
+    The prompt is built by prompt_builder, which keeps it within a token
+    budget by dropping the least relevant description paragraphs.
+
+    Failed calls are retried by retry_policy; pass the run's shared policy so
+    the agent and the graph draw from one retry budget.
+    """
 
-        prompt = f"""
+    MODEL = "gpt-4o-mini"
+    TEMPERATURE = 0.3
+    SYSTEM_PROMPT = "You optimize resumes for job applications."
+    PROMPT_TEMPLATE = """
 You are a professional resume writer.
 
 JOB TITLE:
-{job.title}
+{job_title}
 
 COMPANY:
-{job.company}
+{company}
 
 JOB DESCRIPTION:
-{job.description}
+{description}
 
 CANDIDATE SUMMARY:
-{cv.summary}
+{summary}
 
 SKILLS:
-{", ".join(cv.skills)}
+{skills}
+
+EXPERIENCE:
+{experience}
 
 Rewrite the CV to best match this role.
 Focus on relevance, keywords, and clarity.
+Return every tailored CV section and a concise cover letter for this
+role and company. Do not invent experience the candidate does not have.
 """
 
-        response = self.client.chat.completions.create(
-            model="gpt-4o-mini",
-            messages=[
-                {"role": "system", "content": "You optimize resumes for job applications."},
+    def __init__(
+        self,
+        cache: Optional[OptimizationCache] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+        prompt_builder: Optional[PromptBuilder] = None,
+        client: Optional[OpenAI] = None,
+        base_url: Optional[str] = None,
+    ):
+        # Retries are owned by retry_policy, not the SDK's built-in loop.
+        # base_url points the client elsewhere, e.g. scripts/fake_openai_server.py
+        self.base_url = base_url
+        self.client = client or OpenAI(base_url=base_url, max_retries=0)
+        self.cache = cache
+        self.retry_policy = retry_policy or RetryPolicy()
+        self.prompt_builder = prompt_builder or PromptBuilder(self.MODEL)
+
+    def optimize(self, cv: CV, job: Job) -> OptimizedCV:
+        cache_key, cached = self._cache_lookup(cv, job)
+        if cached is not None:
+            return cached
+
+        optimized_cv = self._optimize_uncached(cv, job)
+
+        if self.cache is not None:
+            self.cache.put(cache_key, optimized_cv.model_dump_json())
+
+        return optimized_cv
+
+    def _cache_lookup(self, cv: CV, job: Job) -> Tuple[Optional[str], Optional[OptimizedCV]]:
+        """
+        Returns (cache_key, cached result). Both are None without a cache.
+        """
+        if self.cache is None:
+            return None, None
+
+        cache_key = self._cache_key(cv, job)
+        cached = self.cache.get(cache_key)
+        if cached is None:
+            return cache_key, None
+
+        logger.info(
+            "Optimization cache hit | job=%s | company=%s",
+            job.title,
+            job.company,
+        )
+        return cache_key, OptimizedCV.model_validate_json(cached).model_copy(
+            update={"original_cv": cv, "job": job}
+        )
+
+    def _optimize_uncached(self, cv: CV, job: Job) -> OptimizedCV:
+        logger.info(
+            "Optimizing CV | job=%s | company=%s",
+            job.title,
+            job.company,
+        )
+
+        try:
+            return self.retry_policy.call(
+                lambda: parse_optimization_response(cv, job, self._call_openai(cv, job))
+            )
+        except (OpenAIError, OptimizationResponseError) as e:
+            logger.error(
+                "CV optimization failed | job=%s | company=%s | error=%s",
+                job.title,
+                job.company,
+                str(e),
+            )
+            raise
+
+    def _call_openai(self, cv: CV, job: Job) -> str:
+        """
+        Low-level OpenAI call. This is the ONLY place that talks to OpenAI.
+        """
+        response = self.client.chat.completions.create(**self._request_params(cv, job))
+        self._log_usage(job, response)
+
+        return completion_content(response.choices[0].message).strip()
+
+    def _request_params(self, cv: CV, job: Job) -> dict:
+        """
+        Chat completion parameters for one job. Shared with the async agent.
+        """
+        prompt = self.prompt_builder.build(self.PROMPT_TEMPLATE, cv, job)
+
+        return {
+            "model": self.MODEL,
+            "messages": [
+                {"role": "system", "content": self.SYSTEM_PROMPT},
                 {"role": "user", "content": prompt},
             ],
-            temperature=0.3,
+            "temperature": self.TEMPERATURE,
+            "response_format": RESPONSE_FORMAT,
+        }
+
+    @staticmethod
+    def _log_usage(job: Job, response) -> None:
+        usage = getattr(response, "usage", None)
+        if usage is None:
+            return
+
+        logger.info(
+            "OpenAI usage | job=%s | company=%s | input_tokens=%d | output_tokens=%d",
+            job.title,
+            job.company,
+            usage.prompt_tokens,
+            usage.completion_tokens,
         )
 
-        return response.choices[0].message.content.strip()
+    def _cache_key(self, cv: CV, job: Job) -> str:
+        """
+        Hash of every input that can change the completion.
+        """
+        return OptimizationCache.make_key(
+            {
+                "summary": cv.summary,
+                "skills": cv.skills,
+                "experience": [e.model_dump() for e in cv.experience],
+                "job_title": job.title,
+                "company": job.company,
+                "description": job.description,
+                "model": self.MODEL,
+                "system_prompt": self.SYSTEM_PROMPT,
+                "prompt_template": self.PROMPT_TEMPLATE,
+                "temperature": self.TEMPERATURE,
+                "response_format": RESPONSE_FORMAT,
+                "max_prompt_tokens": self.prompt_builder.max_prompt_tokens,
+                # Budgets trim the description differently per tokenizer
+                "tokenizer": self.prompt_builder.counter.mode,
+            }
+        )
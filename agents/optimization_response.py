@@ -0,0 +1,104 @@
+import json
+from typing import List
+
+from pydantic import BaseModel, ValidationError
+
+from models.cv import CV
+from models.job import Job
+from models.optimized_cv import OptimizedCV
+
+
+class OptimizationResponseError(ValueError):
+    """
+    The model returned something that does not match RESPONSE_SCHEMA.
+    """
+
+
+class OptimizationResponse(BaseModel):
+    """
+    Structured output of a single optimization call.
+    """
+
+    tailored_summary: str
+    tailored_skills: List[str]
+    tailored_experience: str
+    full_text: str
+    cover_letter: str
+
+
+RESPONSE_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "tailored_summary": {
+            "type": "string",
+            "description": "Professional summary rewritten for this role (2-4 sentences).",
+        },
+        "tailored_skills": {
+            "type": "array",
+            "items": {"type": "string"},
+            "description": "Candidate skills relevant to the role, most relevant first.",
+        },
+        "tailored_experience": {
+            "type": "string",
+            "description": "Experience section rewritten to emphasise relevant work.",
+        },
+        "full_text": {
+            "type": "string",
+            "description": "The complete tailored CV as plain text.",
+        },
+        "cover_letter": {
+            "type": "string",
+            "description": "A concise cover letter for this role and company.",
+        },
+    },
+    "required": [
+        "tailored_summary",
+        "tailored_skills",
+        "tailored_experience",
+        "full_text",
+        "cover_letter",
+    ],
+    "additionalProperties": False,
+}
+
+RESPONSE_FORMAT = {
+    "type": "json_schema",
+    "json_schema": {
+        "name": "optimized_cv",
+        "strict": True,
+        "schema": RESPONSE_SCHEMA,
+    },
+}
+
+
+def completion_content(message) -> str:
+    """
+    Content of a completion message. Refusals and filtered completions
+    (content is None) raise OptimizationResponseError, like invalid JSON.
+    """
+    refusal = getattr(message, "refusal", None)
+    if refusal:
+        raise OptimizationResponseError(f"Optimization refused: {refusal}")
+    if message.content is None:
+        raise OptimizationResponseError("Invalid optimization response: no content")
+    return message.content
+
+
+def parse_optimization_response(cv: CV, job: Job, content: str) -> OptimizedCV:
+    """
+    Build an OptimizedCV from the JSON content of a completion.
+    """
+    try:
+        response = OptimizationResponse.model_validate(json.loads(content))
+    except (json.JSONDecodeError, ValidationError, TypeError) as e:
+        raise OptimizationResponseError(f"Invalid optimization response: {e}") from e
+
+    return OptimizedCV(
+        original_cv=cv,
+        job=job,
+        tailored_summary=response.tailored_summary.strip(),
+        tailored_skills=[skill.strip() for skill in response.tailored_skills if skill.strip()],
+        tailored_experience=response.tailored_experience.strip(),
+        full_text=response.full_text.strip(),
+        cover_letter=response.cover_letter.strip(),
+    )
@@ -0,0 +1,156 @@
+import logging
+import math
+import re
+from typing import List
+
+from models.cv import CV
+from models.job import Job
+
+try:
+    import tiktoken
+except ImportError:  # optional - falls back to a ~4 chars/token estimate
+    tiktoken = None
+
+logger = logging.getLogger(__name__)
+
+# Headings that usually introduce the parts of a posting worth keeping
+_SECTION_HINTS = re.compile(
+    r"\b(requirements?|qualifications?|responsibilities|what you.ll do|you have|must have|skills)\b",
+    re.IGNORECASE,
+)
+
+
+class TokenCounter:
+    """
+    Local token counting. Uses tiktoken when installed, otherwise an
+    approximation of 4 characters per token.
+    """
+
+    CHARS_PER_TOKEN = 4
+
+    def __init__(self, model: str):
+        self.model = model
+        self._encoding = None
+
+        if tiktoken is not None:
+            try:
+                self._encoding = tiktoken.encoding_for_model(model)
+            except KeyError:
+                self._encoding = tiktoken.get_encoding("o200k_base")
+
+    @property
+    def mode(self) -> str:
+        """
+        How tokens are counted, e.g. "tiktoken:o200k_base" or "chars/4".
+        """
+        if self._encoding is not None:
+            return f"tiktoken:{self._encoding.name}"
+        return f"chars/{self.CHARS_PER_TOKEN}"
+
+    def count(self, text: str) -> int:
+        if not text:
+            return 0
+        if self._encoding is not None:
+            return len(self._encoding.encode(text))
+        return math.ceil(len(text) / self.CHARS_PER_TOKEN)
+
+    def truncate(self, text: str, max_tokens: int) -> str:
+        if self._encoding is not None:
+            return self._encoding.decode(self._encoding.encode(text)[:max_tokens])
+        return text[: max_tokens * self.CHARS_PER_TOKEN]
+
+
+class PromptBuilder:
+    """
+    Builds the optimization prompt within a token budget.
+
+    If the formatted prompt would exceed max_prompt_tokens, the job
+    description is split into paragraphs, ranked by how many of the CV's
+    skills (and job title words) they mention, and the best paragraphs are
+    kept - in their original order - until the budget is used up.
+    """
+
+    def __init__(self, model: str, max_prompt_tokens: int = 2500):
+        self.max_prompt_tokens = max_prompt_tokens
+        self.counter = TokenCounter(model)
+
+    def build(self, template: str, cv: CV, job: Job) -> str:
+        fields = {
+            "job_title": job.title,
+            "company": job.company,
+            "summary": cv.summary,
+            "skills": ", ".join(cv.skills),
+            "experience": self.format_experience(cv),
+        }
+        description = job.description or ""
+
+        prompt = template.format(description=description, **fields)
+        prompt_tokens = self.counter.count(prompt)
+        if prompt_tokens <= self.max_prompt_tokens:
+            return prompt
+
+        base_tokens = self.counter.count(template.format(description="", **fields))
+        budget = max(0, self.max_prompt_tokens - base_tokens)
+        trimmed = self.fit_description(description, cv.skills + job.title.split(), budget)
+
+        logger.info(
+            "Description trimmed to budget | job=%s | company=%s | tokens=%d->%d",
+            job.title,
+            job.company,
+            prompt_tokens,
+            base_tokens + self.counter.count(trimmed),
+        )
+        return template.format(description=trimmed, **fields)
+
+    @staticmethod
+    def format_experience(cv: CV) -> str:
+        lines = []
+        for item in cv.experience:
+            period = " - ".join(p for p in (item.start_date, item.end_date) if p)
+            header = f"{item.role} at {item.company}" + (f" ({period})" if period else "")
+            lines.append(header + (f": {item.description}" if item.description else ""))
+        return "\n".join(lines) or "Not provided"
+
+    def fit_description(self, description: str, keywords: List[str], budget: int) -> str:
+        paragraphs = self._paragraphs(description)
+        if not paragraphs or budget <= 0:
+            return ""
+
+        patterns = [
+            re.compile(r"(?<!\w)" + re.escape(keyword) + r"(?!\w)", re.IGNORECASE)
+            for keyword in {k.strip() for k in keywords if len(k.strip()) > 1}
+        ]
+
+        ranked = sorted(
+            range(len(paragraphs)),
+            key=lambda i: (-self._score(paragraphs[i], patterns), i),
+        )
+
+        kept: List[int] = []
+        used = 0
+        for i in ranked:
+            tokens = self.counter.count(paragraphs[i]) + 1  # paragraph separator
+            if used + tokens <= budget:
+                kept.append(i)
+                used += tokens
+
+        if not kept:
+            # Even the best paragraph is over budget - cut it
+            return self.counter.truncate(paragraphs[ranked[0]], budget)
+
+        return "\n\n".join(paragraphs[i] for i in sorted(kept))
+
+    @staticmethod
+    def _paragraphs(description: str) -> List[str]:
+        parts = re.split(r"\n\s*\n", description.strip())
+        if len(parts) == 1:
+            parts = description.strip().splitlines()
+        return [p.strip() for p in parts if p.strip()]
+
+    @staticmethod
+    def _score(paragraph: str, patterns: List[re.Pattern]) -> float:
+        score = sum(2 for pattern in patterns if pattern.search(paragraph))
+        if _SECTION_HINTS.search(paragraph):
+            score += 1
+        return score
+
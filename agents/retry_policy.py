@@ -0,0 +1,220 @@
+import asyncio
+import logging
+import random
+import threading
+import time
+from email.utils import parsedate_to_datetime
+from typing import Any, Awaitable, Callable, Dict, Optional, Type, TypeVar
+
+import openai
+from pydantic import BaseModel
+
+from agents.optimization_response import OptimizationResponseError
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+class RetryRule(BaseModel):
+    """
+    How one class of errors is retried. Unset fields fall back to the policy.
+    """
+
+    retry: bool = True
+    max_attempts: Optional[int] = None
+    base_delay: Optional[float] = None
+    honor_retry_after: bool = True
+
+
+# Rules are matched against the exception's MRO, most specific class first
+OPENAI_RETRY_RULES: Dict[Type[BaseException], RetryRule] = {
+    openai.RateLimitError: RetryRule(max_attempts=5, base_delay=2.0),
+    openai.APITimeoutError: RetryRule(max_attempts=3),
+    openai.APIConnectionError: RetryRule(),
+    openai.InternalServerError: RetryRule(),
+    openai.ConflictError: RetryRule(max_attempts=2),
+    openai.AuthenticationError: RetryRule(retry=False),
+    openai.PermissionDeniedError: RetryRule(retry=False),
+    openai.BadRequestError: RetryRule(retry=False),
+    openai.NotFoundError: RetryRule(retry=False),
+    openai.UnprocessableEntityError: RetryRule(retry=False),
+    openai.OpenAIError: RetryRule(),
+    # Malformed structured output - one more sample usually fixes it
+    OptimizationResponseError: RetryRule(max_attempts=2, base_delay=0.0),
+    Exception: RetryRule(retry=False),
+}
+
+
+def retry_after_seconds(error: BaseException) -> Optional[float]:
+    """
+    Server-requested delay from retry-after-ms / Retry-After headers, if any.
+    """
+    response = getattr(error, "response", None)
+    headers = getattr(response, "headers", None)
+    if not headers:
+        return None
+
+    retry_after_ms = headers.get("retry-after-ms")
+    if retry_after_ms:
+        try:
+            return float(retry_after_ms) / 1000
+        except ValueError:
+            pass
+
+    retry_after = headers.get("retry-after")
+    if not retry_after:
+        return None
+
+    try:
+        return float(retry_after)
+    except ValueError:
+        pass
+
+    try:
+        return max(0.0, parsedate_to_datetime(retry_after).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
+
+
+class RetryBudget:
+    """
+    Retry budget shared by every job in a run.
+
+    Each retry spends one token and each success earns refill_per_success
+    back (up to capacity). While an upstream is down nothing succeeds, the
+    budget drains and further failures are surfaced immediately instead of
+    multiplying load on the service.
+    """
+
+    def __init__(self, capacity: float = 20, refill_per_success: float = 0.2):
+        self.capacity = capacity
+        self.refill_per_success = refill_per_success
+        self.tokens = capacity
+        self.exhausted_count = 0
+        self._lock = threading.Lock()
+
+    def try_spend(self) -> bool:
+        with self._lock:
+            if self.tokens >= 1:
+                self.tokens -= 1
+                return True
+            self.exhausted_count += 1
+            return False
+
+    def record_success(self) -> None:
+        with self._lock:
+            self.tokens = min(self.capacity, self.tokens + self.refill_per_success)
+
+
+class RetryPolicy:
+    """
+    Single retry policy for a run: exponential backoff with full jitter,
+    Retry-After support, per-error-class rules and a shared RetryBudget.
+
+    attempt numbers are 1-based: attempt 1 is the first call.
+    """
+
+    def __init__(
+        self,
+        max_attempts: int = 3,
+        base_delay: float = 1.0,
+        max_delay: float = 30.0,
+        max_retry_after: float = 120.0,
+        jitter: bool = True,
+        rules: Optional[Dict[Type[BaseException], RetryRule]] = None,
+        budget: Optional[RetryBudget] = None,
+        sleep: Callable[[float], None] = time.sleep,
+    ):
+        self.max_attempts = max_attempts
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.max_retry_after = max_retry_after
+        self.jitter = jitter
+        self.rules = rules if rules is not None else OPENAI_RETRY_RULES
+        self.budget = budget if budget is not None else RetryBudget()
+        self.sleep = sleep
+
+    def rule_for(self, error: BaseException) -> RetryRule:
+        for cls in type(error).__mro__:
+            if cls in self.rules:
+                return self.rules[cls]
+        return RetryRule()
+
+    def should_retry(self, error: BaseException, attempt: int) -> bool:
+        """
+        Whether a call that failed on `attempt` may be tried again.
+        Spends a budget token when it may.
+        """
+        rule = self.rule_for(error)
+        if not rule.retry:
+            return False
+
+        max_attempts = rule.max_attempts or self.max_attempts
+        if attempt >= max_attempts:
+            return False
+
+        if not self.budget.try_spend():
+            logger.warning("Retry budget exhausted | error=%s", type(error).__name__)
+            return False
+
+        return True
+
+    def delay_for(self, error: BaseException, attempt: int) -> float:
+        rule = self.rule_for(error)
+
+        if rule.honor_retry_after:
+            retry_after = retry_after_seconds(error)
+            if retry_after is not None:
+                return min(retry_after, self.max_retry_after)
+
+        base = rule.base_delay if rule.base_delay is not None else self.base_delay
+        delay = min(self.max_delay, base * 2 ** (attempt - 1))
+        return random.uniform(0, delay) if self.jitter else delay
+
+    def record_success(self) -> None:
+        self.budget.record_success()
+
+    def call(self, fn: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+        attempt = 1
+        while True:
+            try:
+                result = fn(*args, **kwargs)
+            except Exception as e:
+                if not self.should_retry(e, attempt):
+                    raise
+                delay = self.delay_for(e, attempt)
+                self._log_retry(e, attempt, delay)
+                self.sleep(delay)
+                attempt += 1
+                continue
+
+            self.record_success()
+            return result
+
+    async def acall(self, fn: Callable[..., Awaitable[T]], *args: Any, **kwargs: Any) -> T:
+        attempt = 1
+        while True:
+            try:
+                result = await fn(*args, **kwargs)
+            except Exception as e:
+                if not self.should_retry(e, attempt):
+                    raise
+                delay = self.delay_for(e, attempt)
+                self._log_retry(e, attempt, delay)
+                await asyncio.sleep(delay)
+                attempt += 1
+                continue
+
+            self.record_success()
+            return result
+
+    @staticmethod
+    def _log_retry(error: BaseException, attempt: int, delay: float) -> None:
+        logger.warning(
+            "Retrying after failure | attempt=%d | delay=%.2fs | error=%s: %s",
+            attempt,
+            delay,
+            type(error).__name__,
+            str(error),
+        )
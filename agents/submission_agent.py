@@ -56,10 +56,11 @@ class SubmissionAgent:
                     job.company,
                     str(e),
                 )
-                result_store.record_failure(job.company, job.title, str(e))
+                result_store.record_failure(job.company, job.title, e)
                 continue
 
         result_store.save()
+        result_store.close()
 
         logger.info(
             "Submission process completed | candidate=%s | jobs_processed=%d",
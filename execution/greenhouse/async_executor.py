@@ -0,0 +1,200 @@
+# execution/greenhouse/async_executor.py
+
+import asyncio
+import logging
+import time
+from typing import Any, Awaitable, Callable, Iterable, List, Optional, TypeVar
+
+from playwright.async_api import Browser, BrowserContext, Page, async_playwright
+from pydantic import BaseModel
+
+from execution.greenhouse.resource_blocking import (
+    AsyncResourceBlocker,
+    BlockingProfile,
+    DEFAULT_BLOCKING_PROFILE,
+)
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+class TabResult(BaseModel):
+    """
+    Outcome of one job handled in its own tab.
+    """
+
+    job_url: str
+    ok: bool
+    value: Any = None
+    error: Optional[str] = None
+    timed_out: bool = False
+    elapsed_seconds: float = 0.0
+
+
+class AsyncGreenhouseExecutor:
+    """
+    One Greenhouse job page in its own context of a shared async browser.
+    Same surface as GreenhouseExecutor: get_page() / close() - close is a coroutine.
+    """
+
+    def __init__(self, job_url: str, browser: "AsyncGreenhouseBrowser"):
+        self.job_url = job_url
+        self.browser = browser
+        self.context: Optional[BrowserContext] = None
+        self.page: Optional[Page] = None
+
+    async def start(self) -> "AsyncGreenhouseExecutor":
+        self.context = await self.browser.new_context()
+        self.page = await self.context.new_page()
+        self.page.set_default_timeout(self.browser.action_timeout_ms)
+
+        # open job page
+        await self.page.goto(self.job_url, wait_until="domcontentloaded")
+        return self
+
+    def get_page(self) -> Page:
+        if self.page is None:
+            raise RuntimeError("Executor page not initialized")
+        return self.page
+
+    async def close(self):
+        if self.context:
+            await self.context.close()
+            self.context = None
+            self.page = None
+
+
+class AsyncGreenhouseBrowser:
+    """
+    A single async Chromium that serves many job tabs at once.
+
+    Standalone: the graph runners still drive the sync executor; this is
+    used by run_async_tabs.py for tab-level batch work.
+
+    run_jobs() opens up to max_tabs jobs concurrently, each in its own
+    context, and gives every job tab_timeout seconds. A slow or hung board
+    is cancelled and reported as timed out while the other tabs continue.
+    """
+
+    def __init__(
+        self,
+        headless: bool = True,
+        max_tabs: int = 4,
+        tab_timeout: float = 90.0,
+        action_timeout_ms: int = 15000,
+        block_resources: Optional[bool] = None,
+        blocking_profile: BlockingProfile = DEFAULT_BLOCKING_PROFILE,
+    ):
+        self.headless = headless
+        self.max_tabs = max_tabs
+        self.tab_timeout = tab_timeout
+        self.action_timeout_ms = action_timeout_ms
+
+        # Block images / fonts / trackers by default in headless runs
+        self.block_resources = headless if block_resources is None else block_resources
+        self.resource_blocker = AsyncResourceBlocker(blocking_profile) if self.block_resources else None
+
+        self.playwright = None
+        self.browser: Optional[Browser] = None
+        # Tabs start the browser lazily - only one of them may launch it
+        self._start_lock = asyncio.Lock()
+
+    async def start(self) -> "AsyncGreenhouseBrowser":
+        async with self._start_lock:
+            if self.browser is None:
+                self.playwright = await async_playwright().start()
+                self.browser = await self.playwright.chromium.launch(headless=self.headless)
+        return self
+
+    async def new_context(self) -> BrowserContext:
+        if self.browser is None:
+            await self.start()
+
+        context = await self.browser.new_context()
+        if self.resource_blocker is not None:
+            await self.resource_blocker.install(context)
+        return context
+
+    async def open_job(self, job_url: str) -> AsyncGreenhouseExecutor:
+        return await AsyncGreenhouseExecutor(job_url, self).start()
+
+    async def run_jobs(
+        self,
+        job_urls: Iterable[str],
+        handler: Callable[[AsyncGreenhouseExecutor], Awaitable[T]],
+    ) -> List[TabResult]:
+        """
+        Open every job in its own tab and run handler(executor) on it.
+        Results are returned in input order.
+        """
+
+        async def run_one(job_url: str):
+            executor = AsyncGreenhouseExecutor(job_url, self)
+            try:
+                await executor.start()
+                return await handler(executor)
+            finally:
+                await executor.close()
+
+        return await run_with_tab_limits(job_urls, run_one, self.max_tabs, self.tab_timeout)
+
+    async def close(self):
+        if self.resource_blocker is not None:
+            logger.info("Resource blocking | %s", self.resource_blocker.stats())
+        if self.browser:
+            await self.browser.close()
+            self.browser = None
+        if self.playwright:
+            await self.playwright.stop()
+            self.playwright = None
+
+    async def __aenter__(self) -> "AsyncGreenhouseBrowser":
+        return await self.start()
+
+    async def __aexit__(self, *exc_info):
+        await self.close()
+
+
+async def run_with_tab_limits(
+    job_urls: Iterable[str],
+    worker: Callable[[str], Awaitable[T]],
+    max_tabs: int,
+    tab_timeout: float,
+) -> List[TabResult]:
+    """
+    Run worker(job_url) for every URL with at most max_tabs in flight and
+    a per-job timeout. Failures and timeouts are captured per job.
+    """
+    semaphore = asyncio.Semaphore(max_tabs)
+
+    async def guarded(job_url: str) -> TabResult:
+        async with semaphore:
+            started = time.perf_counter()
+            try:
+                value = await asyncio.wait_for(worker(job_url), timeout=tab_timeout)
+                return TabResult(
+                    job_url=job_url,
+                    ok=True,
+                    value=value,
+                    elapsed_seconds=time.perf_counter() - started,
+                )
+            except asyncio.TimeoutError:
+                logger.warning("Job tab timed out | url=%s | timeout=%.0fs", job_url, tab_timeout)
+                return TabResult(
+                    job_url=job_url,
+                    ok=False,
+                    error=f"Timed out after {tab_timeout:.0f}s",
+                    timed_out=True,
+                    elapsed_seconds=time.perf_counter() - started,
+                )
+            except Exception as e:
+                logger.warning("Job tab failed | url=%s | error=%s", job_url, e)
+                return TabResult(
+                    job_url=job_url,
+                    ok=False,
+                    error=str(e),
+                    elapsed_seconds=time.perf_counter() - started,
+                )
+
+    return list(await asyncio.gather(*(guarded(url) for url in job_urls)))
@@ -0,0 +1,244 @@
+# execution/greenhouse/board_api.py
+
+import logging
+import threading
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, Iterable, List, Optional
+
+import httpx
+
+from execution.greenhouse.urls import parse_greenhouse_job_url
+from models.submission.form_field import FormField
+from models.submission.form_field_type import FormFieldType
+from models.submission.form_schema import SubmissionFormSchema
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_BASE_URL = "https://boards-api.greenhouse.io/v1"
+DEFAULT_JOB_BOARD_URL = "https://job-boards.greenhouse.io"
+
+# Fingerprint stored with board API schemas in SchemaCache. They are
+# trusted as they are; FILL_FORM only checks that the filled ids exist.
+BOARD_API_FINGERPRINT = "board_api"
+
+# Upload questions we hold a file for; other upload questions (cover
+# letter) are answered through their "_text" textarea alternative
+_FILE_UPLOAD_FIELDS = {"resume"}
+
+# Board API field types -> FormFieldType (selects are filled as text, like
+# the DOM extractor does)
+_FIELD_TYPES = {
+    "input_file": FormFieldType.FILE,
+    "textarea": FormFieldType.TEXTAREA,
+    "input_text": FormFieldType.TEXT,
+    "multi_value_single_select": FormFieldType.TEXT,
+    "multi_value_multi_select": FormFieldType.TEXT,
+}
+
+
+def schema_from_job_json(data: Dict[str, Any], form_url: str) -> SubmissionFormSchema:
+    """
+    Convert a board API job (fetched with questions=true) into a schema.
+
+    Every question has one or more inputs and one of them becomes the
+    field: the file input for the resume, the paste-in textarea for other
+    upload questions (the cover letter is generated as text), otherwise
+    the first usable input.
+    """
+    fields: List[FormField] = []
+
+    for question in data.get("questions") or []:
+        label = (question.get("label") or "").strip()
+        candidates = [
+            (c["name"], _FIELD_TYPES[c.get("type")])
+            for c in question.get("fields") or []
+            if c.get("name") and c.get("type") in _FIELD_TYPES  # skips input_hidden
+        ]
+        if not candidates:
+            continue
+
+        name, field_type = _pick_candidate(candidates)
+        fields.append(
+            FormField(
+                field_id=name,
+                label=label or name,
+                type=_refine_type(name, field_type),
+                required=bool(question.get("required")),
+            )
+        )
+
+    return SubmissionFormSchema(
+        ats_type="greenhouse",
+        form_url=form_url,
+        fields=fields,
+    )
+
+
+def _pick_candidate(candidates):
+    name, field_type = candidates[0]
+    if field_type is FormFieldType.FILE and name not in _FILE_UPLOAD_FIELDS:
+        for alt_name, alt_type in candidates[1:]:
+            if alt_type is FormFieldType.TEXTAREA:
+                return alt_name, alt_type
+    return name, field_type
+
+
+def _refine_type(name: str, field_type: FormFieldType) -> FormFieldType:
+    if field_type is not FormFieldType.TEXT:
+        return field_type
+    if "email" in name:
+        return FormFieldType.EMAIL
+    if "phone" in name:
+        return FormFieldType.PHONE
+    return field_type
+
+
+class GreenhouseBoardApi:
+    """
+    Schema provider backed by the public Greenhouse job board API.
+
+    One pooled keep-alive client serves every request, so looking up the
+    questions of a job costs a single small JSON GET instead of a Chromium
+    page load. fetch_board_schemas() discovers a whole board in bulk.
+    """
+
+    def __init__(
+        self,
+        base_url: str = DEFAULT_BASE_URL,
+        job_board_url: str = DEFAULT_JOB_BOARD_URL,
+        timeout: float = 10.0,
+        max_connections: int = 20,
+        client: Optional[httpx.Client] = None,
+    ):
+        self.base_url = base_url.rstrip("/")
+        self.job_board_url = job_board_url.rstrip("/")
+        self._owns_client = client is None
+        self._client = client or httpx.Client(
+            timeout=timeout,
+            limits=httpx.Limits(
+                max_connections=max_connections,
+                max_keepalive_connections=max_connections,
+            ),
+            headers={"Accept": "application/json"},
+        )
+
+        self._lock = threading.Lock()
+        self.requests = 0
+        self.failures = 0
+
+    def fetch_job(self, board: str, job_id: str) -> Dict[str, Any]:
+        return self._get(f"/boards/{board}/jobs/{job_id}", {"questions": "true"})
+
+    def list_jobs(self, board: str) -> Dict[str, str]:
+        """
+        {job_id: posting URL} for every open job on a board.
+        """
+        data = self._get(f"/boards/{board}/jobs")
+        return {
+            str(job["id"]): job.get("absolute_url") or f"{self.job_board_url}/{board}/jobs/{job['id']}"
+            for job in data.get("jobs") or []
+            if job.get("id") is not None
+        }
+
+    def list_job_ids(self, board: str) -> List[str]:
+        return list(self.list_jobs(board))
+
+    def fetch_schema(self, job_url: str) -> Optional[SubmissionFormSchema]:
+        """
+        Schema for a Greenhouse job URL, or None if the URL is not one.
+        Raises httpx.HTTPError when the API call fails.
+        """
+        key = parse_greenhouse_job_url(job_url)
+        if key is None:
+            return None
+
+        board, job_id = key
+        schema = schema_from_job_json(self.fetch_job(board, job_id), job_url)
+        logger.info(
+            "Schema from board API | board=%s | job_id=%s | fields=%d",
+            board,
+            job_id,
+            len(schema.fields),
+        )
+        return schema
+
+    def fetch_board_schemas(
+        self,
+        board: str,
+        job_ids: Optional[Iterable[str]] = None,
+        max_workers: int = 8,
+    ) -> Dict[str, SubmissionFormSchema]:
+        """
+        Schemas for every open job on a board (or only job_ids), keyed by
+        job id. Jobs whose lookup fails or that are not open are left out.
+        """
+        jobs = self.list_jobs(board)
+        if job_ids is not None:
+            wanted = set(job_ids)
+            jobs = {job_id: url for job_id, url in jobs.items() if job_id in wanted}
+        if not jobs:
+            return {}
+
+        def fetch(job_id: str):
+            url = jobs[job_id]
+            try:
+                return job_id, schema_from_job_json(self.fetch_job(board, job_id), url)
+            except httpx.HTTPError as e:
+                logger.warning("Board API lookup failed | board=%s | job_id=%s | error=%s", board, job_id, e)
+                return job_id, None
+
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(jobs))) as pool:
+            results = list(pool.map(fetch, jobs))
+
+        return {job_id: schema for job_id, schema in results if schema is not None}
+
+    def warm_schema_cache(self, schema_cache, job_urls: Iterable[str]) -> int:
+        """
+        Fetch the schemas of job_urls board by board (one listing plus
+        concurrent job lookups) into schema_cache, before any browser
+        starts. Jobs already cached are skipped. Returns how many were stored.
+        """
+        wanted = defaultdict(set)
+        for url in job_urls:
+            key = parse_greenhouse_job_url(url or "")
+            if key is not None:
+                wanted[key[0]].add(key[1])
+
+        stored = 0
+        for board, job_ids in wanted.items():
+            job_ids -= schema_cache.job_ids(board)
+            if not job_ids:
+                continue
+            try:
+                schemas = self.fetch_board_schemas(board, job_ids)
+            except httpx.HTTPError as e:
+                logger.warning("Board listing failed | board=%s | error=%s", board, e)
+                continue
+            for job_id, schema in schemas.items():
+                schema_cache.put(board, job_id, BOARD_API_FINGERPRINT, schema)
+            stored += len(schemas)
+
+        logger.info("Schema cache warmed from board API | boards=%d | schemas=%d", len(wanted), stored)
+        return stored
+
+    def stats(self) -> Dict[str, int]:
+        return {"requests": self.requests, "failures": self.failures}
+
+    def close(self) -> None:
+        if self._owns_client:
+            self._client.close()
+
+    # ---------- helpers ----------
+
+    def _get(self, path: str, params: Optional[Dict[str, str]] = None) -> Dict[str, Any]:
+        with self._lock:
+            self.requests += 1
+        try:
+            response = self._client.get(f"{self.base_url}{path}", params=params)
+            response.raise_for_status()
+            return response.json()
+        except httpx.HTTPError:
+            with self._lock:
+                self.failures += 1
+            raise
@@ -0,0 +1,297 @@
+# execution/greenhouse/browser_pool.py
+
+import logging
+import os
+import signal
+import threading
+from typing import Dict, Optional
+
+from playwright.sync_api import sync_playwright, BrowserContext, Page
+
+from execution.greenhouse.resource_blocking import (
+    BlockingProfile,
+    DEFAULT_BLOCKING_PROFILE,
+    ResourceBlocker,
+)
+
+logger = logging.getLogger(__name__)
+
+try:
+    import psutil
+except ImportError:  # optional - the memory ceiling needs it (pip install psutil)
+    psutil = None
+
+
+class _BrowserSlot:
+    def __init__(self, playwright, browser, driver_pid: Optional[int] = None):
+        self.owner = threading.current_thread().name
+        self.playwright = playwright
+        self.browser = browser
+        # Playwright driver of this slot; its process tree is this slot's browser
+        self.driver_pid = driver_pid
+        self.contexts_served = 0
+        self.open_contexts = 0
+        self.recycles = 0
+
+
+class BrowserPool:
+    """
+    Shared Chromium browsers for a whole run.
+
+    Sync Playwright objects are bound to the thread that created them, so the
+    pool keeps one browser per worker thread (with ConcurrentJobRunner that is
+    max_concurrency browsers). Every job gets a fresh BrowserContext from its
+    thread's browser.
+
+    A browser is relaunched once it has served max_contexts_per_browser
+    contexts, or when its own process tree (the slot's Playwright driver and
+    the browser under it) exceeds max_memory_mb. The ceiling is per browser -
+    other threads' browsers don't count - and needs psutil; without it a
+    warning is logged and only the context limit applies.
+
+    Contexts get the resource-blocking route installed (on by default when
+    headless).
+    """
+
+    def __init__(
+        self,
+        headless: bool = True,
+        max_contexts_per_browser: int = 50,
+        max_memory_mb: Optional[int] = 2048,
+        block_resources: Optional[bool] = None,
+        blocking_profile: BlockingProfile = DEFAULT_BLOCKING_PROFILE,
+    ):
+        self.headless = headless
+        self.max_contexts_per_browser = max_contexts_per_browser
+        self.max_memory_mb = max_memory_mb
+
+        block = headless if block_resources is None else block_resources
+        self.resource_blocker = ResourceBlocker(blocking_profile) if block else None
+
+        self._slots: Dict[int, _BrowserSlot] = {}
+        self._lock = threading.Lock()
+        self.recycles = 0
+
+        if max_memory_mb is not None and psutil is None:
+            logger.warning(
+                "Browser memory ceiling of %d MB can't be enforced - psutil is not installed",
+                max_memory_mb,
+            )
+
+    # ---------- contexts ----------
+
+    def acquire_context(self) -> BrowserContext:
+        slot = self._slot_for_current_thread()
+
+        if slot.open_contexts == 0 and self._needs_recycle(slot):
+            self._recycle(slot)
+
+        context = slot.browser.new_context()
+        if self.resource_blocker is not None:
+            self.resource_blocker.install(context)
+
+        slot.contexts_served += 1
+        slot.open_contexts += 1
+        return context
+
+    def release_context(self, context: BrowserContext) -> None:
+        slot = self._slots.get(threading.get_ident())
+
+        try:
+            context.close()
+        except Exception as e:
+            logger.warning(f"Error closing browser context: {e}")
+
+        if slot is not None and slot.open_contexts > 0:
+            slot.open_contexts -= 1
+
+    # ---------- lifecycle ----------
+
+    def close_current_thread(self) -> None:
+        """
+        Close the browser owned by the calling thread.
+        Worker threads call this before exiting.
+        """
+        with self._lock:
+            slot = self._slots.pop(threading.get_ident(), None)
+
+        if slot is not None:
+            self._shutdown(slot)
+
+    def close(self) -> None:
+        """
+        Close every browser of the pool. The calling thread's browser is
+        closed through Playwright. Browsers still owned by other threads
+        can't be (sync Playwright is thread-bound), so their driver process
+        tree is terminated instead.
+        """
+        self.close_current_thread()
+
+        with self._lock:
+            leftover = list(self._slots.values())
+            self._slots.clear()
+
+        for slot in leftover:
+            logger.info("Terminating browser of thread %s", slot.owner)
+            self._terminate(slot)
+
+        if self.resource_blocker is not None:
+            logger.info("Resource blocking | %s", self.resource_blocker.stats())
+        logger.info("Browser pool | recycles=%d | terminated=%d", self.recycles, len(leftover))
+
+    # ---------- internals ----------
+
+    def _slot_for_current_thread(self) -> _BrowserSlot:
+        thread_id = threading.get_ident()
+
+        slot = self._slots.get(thread_id)
+        if slot is None:
+            slot = self._launch()
+            with self._lock:
+                self._slots[thread_id] = slot
+        return slot
+
+    def _launch(self) -> _BrowserSlot:
+        playwright = sync_playwright().start()
+        driver_pid = _driver_pid(playwright)
+        if driver_pid is None and self.max_memory_mb is not None and psutil is not None:
+            logger.warning("Playwright driver pid unknown - memory ceiling off for this browser")
+
+        browser = playwright.chromium.launch(headless=self.headless)
+        logger.info(
+            "Browser launched | thread=%s | headless=%s",
+            threading.current_thread().name,
+            self.headless,
+        )
+        return _BrowserSlot(playwright, browser, driver_pid)
+
+    def _needs_recycle(self, slot: _BrowserSlot) -> bool:
+        if slot.contexts_served >= self.max_contexts_per_browser:
+            logger.info("Recycling browser | contexts_served=%d", slot.contexts_served)
+            return True
+
+        memory_mb = self._browser_memory_mb(slot)
+        if (
+            self.max_memory_mb is not None
+            and memory_mb is not None
+            and memory_mb > self.max_memory_mb
+        ):
+            logger.info("Recycling browser | memory_mb=%.0f", memory_mb)
+            return True
+
+        return False
+
+    def _recycle(self, slot: _BrowserSlot) -> None:
+        try:
+            slot.browser.close()
+        except Exception as e:
+            logger.warning(f"Error closing browser during recycle: {e}")
+
+        slot.browser = slot.playwright.chromium.launch(headless=self.headless)
+        slot.contexts_served = 0
+        slot.recycles += 1
+        with self._lock:
+            self.recycles += 1
+
+    @staticmethod
+    def _browser_memory_mb(slot: _BrowserSlot) -> Optional[float]:
+        """
+        RSS of the slot's process tree (its Playwright driver and the
+        browser it launched), in MB. None if it can't be measured.
+        """
+        if psutil is None or slot.driver_pid is None:
+            return None
+
+        try:
+            driver = psutil.Process(slot.driver_pid)
+            processes = [driver] + driver.children(recursive=True)
+        except psutil.Error:
+            return None
+
+        total = 0
+        for process in processes:
+            try:
+                total += process.memory_info().rss
+            except psutil.Error:
+                continue
+
+        return total / (1024 * 1024)
+
+    @staticmethod
+    def _terminate(slot: _BrowserSlot) -> None:
+        """
+        SIGTERM the slot's browser processes and then its driver.
+        """
+        if slot.driver_pid is None:
+            logger.warning("Browser of thread %s has no known driver pid - left running", slot.owner)
+            return
+
+        pids = []
+        if psutil is not None:
+            try:
+                pids = [p.pid for p in psutil.Process(slot.driver_pid).children(recursive=True)]
+            except psutil.Error:
+                pass
+        pids.append(slot.driver_pid)
+
+        for pid in pids:
+            try:
+                os.kill(pid, signal.SIGTERM)
+            except OSError:
+                continue
+
+    @staticmethod
+    def _shutdown(slot: _BrowserSlot) -> None:
+        try:
+            slot.browser.close()
+        except Exception as e:
+            logger.warning(f"Error closing browser: {e}")
+        try:
+            slot.playwright.stop()
+        except Exception as e:
+            logger.warning(f"Error stopping playwright: {e}")
+
+
+def _driver_pid(playwright) -> Optional[int]:
+    """
+    Pid of the driver process this Playwright instance started (read from
+    its pipe transport), or None if the internals are not as expected.
+    """
+    try:
+        return playwright._impl_obj._connection._transport._proc.pid
+    except AttributeError:
+        return None
+
+
+class PooledGreenhouseExecutor:
+    """
+    GreenhouseExecutor counterpart that borrows a context from a BrowserPool.
+    close() only returns the context - the browser stays up for the next job.
+    """
+
+    def __init__(self, job_url: str, pool: BrowserPool):
+        self.job_url = job_url
+        self.pool = pool
+
+        self.context: BrowserContext | None = None
+        self.page: Page | None = None
+
+        self._start()
+
+    def _start(self):
+        self.context = self.pool.acquire_context()
+        self.page = self.context.new_page()
+
+        # open job page
+        self.page.goto(self.job_url, wait_until="domcontentloaded")
+
+    def get_page(self) -> Page:
+        if self.page is None:
+            raise RuntimeError("Executor page not initialized")
+        return self.page
+
+    def close(self):
+        if self.context:
+            self.pool.release_context(self.context)
+            self.context = None
+            self.page = None
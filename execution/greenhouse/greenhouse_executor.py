@@ -1,13 +1,35 @@
 # execution/greenhouse/greenhouse_executor.py
 
+import logging
+from typing import Optional
+
 from playwright.sync_api import sync_playwright, Page
 
+from execution.greenhouse.resource_blocking import (
+    BlockingProfile,
+    DEFAULT_BLOCKING_PROFILE,
+    ResourceBlocker,
+)
+
+logger = logging.getLogger(__name__)
+
 
 class GreenhouseExecutor:
-    def __init__(self, job_url: str, headless: bool = True):
+    def __init__(
+        self,
+        job_url: str,
+        headless: bool = True,
+        block_resources: Optional[bool] = None,
+        blocking_profile: BlockingProfile = DEFAULT_BLOCKING_PROFILE,
+    ):
         self.job_url = job_url
         self.headless = headless
 
+        # Block images / fonts / trackers by default in headless runs
+        self.block_resources = headless if block_resources is None else block_resources
+        self.blocking_profile = blocking_profile
+        self.resource_blocker: Optional[ResourceBlocker] = None
+
         self.playwright = None
         self.browser = None
         self.context = None
@@ -21,6 +43,10 @@ class GreenhouseExecutor:
             headless=self.headless
         )
         self.context = self.browser.new_context()
+
+        if self.block_resources:
+            self.resource_blocker = ResourceBlocker(self.blocking_profile).install(self.context)
+
         self.page = self.context.new_page()
 
         # open job page
@@ -32,6 +58,8 @@ class GreenhouseExecutor:
         return self.page
 
     def close(self):
+        if self.resource_blocker:
+            logger.info("Resource blocking | %s", self.resource_blocker.stats())
         if self.context:
             self.context.close()
         if self.browser:
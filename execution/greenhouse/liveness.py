@@ -0,0 +1,173 @@
+# execution/greenhouse/liveness.py
+
+import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Iterable, List, Optional, Tuple
+
+import httpx
+from pydantic import BaseModel
+
+from execution.greenhouse.urls import parse_greenhouse_job_url
+from models.job import Job
+
+logger = logging.getLogger(__name__)
+
+# Servers that refuse HEAD get a streamed GET instead (body is not read)
+_HEAD_UNSUPPORTED = {403, 405, 501}
+_DEAD_STATUSES = {404, 410}
+
+
+class LivenessResult(BaseModel):
+    """
+    Outcome of the pre-flight check of one posting URL.
+    """
+
+    url: str
+    alive: bool
+    status_code: Optional[int] = None
+    final_url: Optional[str] = None
+    redirects: int = 0
+    reason: str = "ok"
+    elapsed_seconds: float = 0.0
+
+
+class PostingLivenessChecker:
+    """
+    Cheap HTTP pre-flight for application URLs.
+
+    Closed Greenhouse postings answer 404/410 or redirect back to the board
+    page; both are reported dead before any browser is launched. Network
+    errors and 5xx answers are treated as alive - the browser gets to try.
+    Results are memoized per URL, so a batch check up front makes later
+    per-job checks free.
+    """
+
+    def __init__(
+        self,
+        timeout: float = 10.0,
+        max_connections: int = 20,
+        max_workers: int = 16,
+        client: Optional[httpx.Client] = None,
+    ):
+        self.max_workers = max_workers
+        self._owns_client = client is None
+        self._client = client or httpx.Client(
+            timeout=timeout,
+            follow_redirects=True,
+            limits=httpx.Limits(
+                max_connections=max_connections,
+                max_keepalive_connections=max_connections,
+            ),
+        )
+
+        self._lock = threading.Lock()
+        self._memo: Dict[str, LivenessResult] = {}
+        self.checked = 0
+        self.dead = 0
+
+    def check(self, url: str) -> LivenessResult:
+        with self._lock:
+            cached = self._memo.get(url)
+        if cached is not None:
+            return cached
+
+        result = self._check_uncached(url)
+
+        with self._lock:
+            self._memo[url] = result
+            self.checked += 1
+            if not result.alive:
+                self.dead += 1
+
+        if not result.alive:
+            logger.info(
+                "Posting not live | url=%s | reason=%s | status=%s | final_url=%s",
+                url,
+                result.reason,
+                result.status_code,
+                result.final_url,
+            )
+        return result
+
+    def check_many(self, urls: Iterable[str]) -> Dict[str, LivenessResult]:
+        unique = list(dict.fromkeys(u for u in urls if u))
+        if not unique:
+            return {}
+
+        with ThreadPoolExecutor(max_workers=min(self.max_workers, len(unique))) as pool:
+            return dict(zip(unique, pool.map(self.check, unique)))
+
+    def filter_jobs(self, jobs: List[Job]) -> Tuple[List[Job], List[Tuple[Job, LivenessResult]]]:
+        """
+        Split jobs into (live, dead). Jobs without an application_url are
+        kept - SUBMIT_START handles them.
+        """
+        results = self.check_many(job.application_url for job in jobs)
+
+        live: List[Job] = []
+        dead: List[Tuple[Job, LivenessResult]] = []
+        for job in jobs:
+            result = results.get(job.application_url)
+            if result is None or result.alive:
+                live.append(job)
+            else:
+                dead.append((job, result))
+        return live, dead
+
+    def stats(self) -> Dict[str, int]:
+        return {"checked": self.checked, "dead": self.dead}
+
+    def close(self) -> None:
+        if self._owns_client:
+            self._client.close()
+
+    # ---------- helpers ----------
+
+    def _check_uncached(self, url: str) -> LivenessResult:
+        started = time.perf_counter()
+        try:
+            response = self._client.head(url)
+            if response.status_code in _HEAD_UNSUPPORTED:
+                with self._client.stream("GET", url) as streamed:
+                    response = streamed
+        except httpx.HTTPError as e:
+            return LivenessResult(
+                url=url,
+                alive=True,
+                reason=f"unreachable: {type(e).__name__}",
+                elapsed_seconds=time.perf_counter() - started,
+            )
+
+        final_url = str(response.url)
+        result = LivenessResult(
+            url=url,
+            alive=True,
+            status_code=response.status_code,
+            final_url=final_url,
+            redirects=len(response.history),
+            elapsed_seconds=time.perf_counter() - started,
+        )
+
+        if response.status_code in _DEAD_STATUSES:
+            result.alive = False
+            result.reason = "not_found"
+        elif response.history and _left_posting(url, final_url):
+            result.alive = False
+            result.reason = "redirected_to_board"
+        elif response.status_code >= 500:
+            result.reason = f"server_error_{response.status_code}"
+
+        return result
+
+
+def _left_posting(url: str, final_url: str) -> bool:
+    """
+    True if a redirect took a Greenhouse job URL away from that job
+    (closed postings bounce to the board index).
+    """
+    original = parse_greenhouse_job_url(url)
+    if original is None:
+        return False
+    return parse_greenhouse_job_url(final_url) != original
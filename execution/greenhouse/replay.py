@@ -0,0 +1,157 @@
+# execution/greenhouse/replay.py
+
+import logging
+import os
+import re
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, Optional
+
+from playwright.sync_api import sync_playwright
+
+from execution.greenhouse.greenhouse_executor import GreenhouseExecutor
+from execution.greenhouse.steps.open_job import open_job
+from execution.greenhouse.urls import parse_greenhouse_job_url
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_RECORDINGS_DIR = "recordings"
+
+_SCRIPT_TAG = re.compile(r"<script\b[^>]*>.*?</script>", re.IGNORECASE | re.DOTALL)
+
+
+def recording_name(job_url: str) -> str:
+    key = parse_greenhouse_job_url(job_url)
+    if key is None:
+        raise ValueError(f"Not a Greenhouse job URL: {job_url}")
+    board, job_id = key
+    return f"{board}_{job_id}"
+
+
+def static_snapshot(html: str) -> str:
+    """
+    Rendered DOM without scripts, so replaying it never re-hydrates or
+    reaches out to the network.
+    """
+    return _SCRIPT_TAG.sub("", html)
+
+
+def record_job_page(
+    job_url: str,
+    out_dir: str = DEFAULT_RECORDINGS_DIR,
+    headless: bool = True,
+) -> Dict[str, str]:
+    """
+    Load a live job page once and save both replay formats:
+    <board>_<job_id>.har (every response, embedded) and
+    <board>_<job_id>.html (static snapshot of the rendered form).
+    """
+    os.makedirs(out_dir, exist_ok=True)
+    name = recording_name(job_url)
+    har_path = os.path.join(out_dir, f"{name}.har")
+    html_path = os.path.join(out_dir, f"{name}.html")
+
+    with sync_playwright() as pw:
+        browser = pw.chromium.launch(headless=headless)
+        context = browser.new_context(record_har_path=har_path, record_har_content="embed")
+        page = context.new_page()
+
+        open_job(page, job_url)
+        page.wait_for_load_state("networkidle", timeout=15000)
+
+        with open(html_path, "w", encoding="utf-8") as f:
+            f.write(static_snapshot(page.content()))
+
+        # The HAR is written when the context closes
+        context.close()
+        browser.close()
+
+    logger.info("Recorded job page | url=%s | har=%s | html=%s", job_url, har_path, html_path)
+    return {"har": har_path, "html": html_path}
+
+
+class ReplayGreenhouseExecutor(GreenhouseExecutor):
+    """
+    GreenhouseExecutor that serves the job page from a recorded HAR through
+    context.route_from_har. Requests missing from the recording are aborted,
+    so runs are offline and deterministic.
+    """
+
+    def __init__(self, job_url: str, har_path: str, headless: bool = True, **kwargs):
+        self.har_path = har_path
+        super().__init__(job_url, headless=headless, block_resources=False, **kwargs)
+
+    def _start(self):
+        self.playwright = sync_playwright().start()
+        self.browser = self.playwright.chromium.launch(headless=self.headless)
+        self.context = self.browser.new_context()
+        self.context.route_from_har(self.har_path, not_found="abort")
+
+        self.page = self.context.new_page()
+        self.page.goto(self.job_url, wait_until="domcontentloaded")
+
+
+class SnapshotServer:
+    """
+    Local HTTP server for static snapshots.
+
+    Serves <root>/<board>_<job_id>.html at /<board>/jobs/<job_id>, so a
+    recorded Greenhouse URL maps to a local one via url_for().
+    """
+
+    def __init__(self, root: str = DEFAULT_RECORDINGS_DIR, host: str = "127.0.0.1", port: int = 0):
+        self.root = root
+        self._httpd = ThreadingHTTPServer((host, port), self._handler_class())
+        self._httpd.daemon_threads = True
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def base_url(self) -> str:
+        host, port = self._httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def url_for(self, job_url: str) -> str:
+        board, job_id = parse_greenhouse_job_url(job_url)
+        return f"{self.base_url}/{board}/jobs/{job_id}"
+
+    def start(self) -> "SnapshotServer":
+        self._thread = threading.Thread(target=self._httpd.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self._httpd.shutdown()
+        self._httpd.server_close()
+
+    def __enter__(self) -> "SnapshotServer":
+        return self.start()
+
+    def __exit__(self, *exc_info):
+        self.stop()
+
+    def _handler_class(self):
+        root = self.root
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                parts = [p for p in self.path.split("?")[0].split("/") if p]
+                path = None
+                if len(parts) == 3 and parts[1] == "jobs":
+                    path = os.path.join(root, f"{parts[0]}_{parts[2]}.html")
+
+                if path is None or not os.path.isfile(path):
+                    self.send_error(404)
+                    return
+
+                with open(path, "rb") as f:
+                    body = f.read()
+                self.send_response(200)
+                self.send_header("Content-Type", "text/html; charset=utf-8")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                pass
+
+        return Handler
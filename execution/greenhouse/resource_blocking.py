@@ -0,0 +1,148 @@
+# execution/greenhouse/resource_blocking.py
+
+import logging
+import threading
+from typing import Dict, List, Optional
+from urllib.parse import urlparse
+
+from pydantic import BaseModel, Field
+
+logger = logging.getLogger(__name__)
+
+
+class BlockingProfile(BaseModel):
+    """
+    Which requests to abort while loading Greenhouse pages.
+
+    Stylesheets and scripts stay allowed - the form is a React app and
+    visibility checks depend on CSS. reCAPTCHA hosts are never listed.
+
+    Host rules never apply to host_exempt_types (navigations and frames),
+    nor to xhr / fetch calls back to the page's own site.
+    """
+
+    resource_types: List[str] = Field(
+        default_factory=lambda: ["image", "media", "font"]
+    )
+    blocked_hosts: List[str] = Field(
+        default_factory=lambda: [
+            "google-analytics.com",
+            "googletagmanager.com",
+            "doubleclick.net",
+            "facebook.net",
+            "facebook.com",
+            "connect.facebook.net",
+            "hotjar.com",
+            "segment.io",
+            "segment.com",
+            "linkedin.com",
+            "licdn.com",
+            "bing.com",
+            "clarity.ms",
+            "mixpanel.com",
+            "fullstory.com",
+            "intercom.io",
+            "optimizely.com",
+        ]
+    )
+    host_exempt_types: List[str] = Field(default_factory=lambda: ["document"])
+
+
+DEFAULT_BLOCKING_PROFILE = BlockingProfile()
+
+
+def _site(host: str) -> str:
+    # Last two labels - good enough to tell first- from third-party here
+    return ".".join(host.split(".")[-2:])
+
+
+class ResourceBlocker:
+    """
+    page.route / context.route handler that aborts non-essential requests
+    and counts what it blocked.
+    """
+
+    def __init__(self, profile: BlockingProfile = DEFAULT_BLOCKING_PROFILE):
+        self.profile = profile
+        self._resource_types = set(profile.resource_types)
+        self._hosts = tuple(h.lower() for h in profile.blocked_hosts)
+        self._host_exempt_types = set(profile.host_exempt_types)
+
+        self._lock = threading.Lock()
+        self.allowed = 0
+        self.blocked: Dict[str, int] = {}
+
+    def install(self, target) -> "ResourceBlocker":
+        """
+        Attach to a BrowserContext or Page.
+        """
+        target.route("**/*", self._handle)
+        return self
+
+    def should_block(self, resource_type: str, url: str, page_url: Optional[str] = None) -> bool:
+        if resource_type in self._resource_types:
+            return True
+        if resource_type in self._host_exempt_types:
+            return False
+
+        host = (urlparse(url).hostname or "").lower()
+        if resource_type in ("xhr", "fetch") and page_url:
+            if _site(host) == _site((urlparse(page_url).hostname or "").lower()):
+                return False
+
+        return any(host == h or host.endswith("." + h) for h in self._hosts)
+
+    @staticmethod
+    def _page_url(request) -> Optional[str]:
+        try:
+            return request.frame.url
+        except Exception:
+            return None  # service worker requests have no frame
+
+    def _handle(self, route):
+        request = route.request
+
+        if self.should_block(request.resource_type, request.url, self._page_url(request)):
+            with self._lock:
+                self.blocked[request.resource_type] = (
+                    self.blocked.get(request.resource_type, 0) + 1
+                )
+            route.abort()
+            return
+
+        with self._lock:
+            self.allowed += 1
+        route.continue_()
+
+    def stats(self) -> Dict[str, object]:
+        with self._lock:
+            return {
+                "allowed": self.allowed,
+                "blocked": sum(self.blocked.values()),
+                "blocked_by_type": dict(self.blocked),
+            }
+
+
+class AsyncResourceBlocker(ResourceBlocker):
+    """
+    ResourceBlocker for playwright.async_api contexts and pages.
+    """
+
+    async def install(self, target) -> "AsyncResourceBlocker":
+        await target.route("**/*", self._handle)
+        return self
+
+    async def _handle(self, route):
+        request = route.request
+
+        if self.should_block(request.resource_type, request.url, self._page_url(request)):
+            with self._lock:
+                self.blocked[request.resource_type] = (
+                    self.blocked.get(request.resource_type, 0) + 1
+                )
+            await route.abort()
+            return
+
+        with self._lock:
+            self.allowed += 1
+        await route.continue_()
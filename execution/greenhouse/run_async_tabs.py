@@ -0,0 +1,39 @@
+"""
+Open several Greenhouse jobs concurrently in one async browser and extract
+their application schemas.
+
+Usage: python -m execution.greenhouse.run_async_tabs [job_url ...]
+"""
+
+import asyncio
+import sys
+import time
+
+from execution.greenhouse.async_executor import AsyncGreenhouseBrowser
+from execution.greenhouse.steps.extract_schema import extract_schema_from_page_async
+from execution.greenhouse.steps.open_job import open_job_async
+
+JOB_URLS = [
+    "https://job-boards.greenhouse.io/rhinofederatedcomputing/jobs/4079601009",
+]
+
+
+async def _extract(executor):
+    page = executor.get_page()
+    await open_job_async(page, executor.job_url)
+    return len((await extract_schema_from_page_async(page)).fields)
+
+
+async def main(job_urls):
+    started = time.perf_counter()
+    async with AsyncGreenhouseBrowser(headless=True, max_tabs=4, tab_timeout=60) as browser:
+        results = await browser.run_jobs(job_urls, _extract)
+
+    for result in results:
+        status = f"{result.value} fields" if result.ok else f"FAILED ({result.error})"
+        print(f"{result.elapsed_seconds:6.2f}s  {status:<40} {result.job_url}")
+    print(f"\nTotal: {time.perf_counter() - started:.2f}s for {len(results)} jobs")
+
+
+if __name__ == "__main__":
+    asyncio.run(main(sys.argv[1:] or JOB_URLS))
@@ -3,6 +3,7 @@ from execution.greenhouse.steps.extract_schema import extract_schema_from_page
 from execution.greenhouse.steps.dry_run_fill import dry_run_fill_form
 from mapping.map_profile_to_schema import map_profile_to_schema
 from user.profile import UserProfile
+from execution.greenhouse.wait_timing import wait_timings
 
 JOB_URL = "https://job-boards.greenhouse.io/rhinofederatedcomputing/jobs/4079601009"
 
@@ -35,6 +36,9 @@ def main():
 
     dry_run_fill_form(page, mapping)
 
+    for step, entry in wait_timings.report().items():
+        print(f"⏱ {step}: {entry['total_ms']:.0f}ms over {entry['count']} waits")
+
     input("\n🛑 Inspect the filled form. Press ENTER to close.")
     session.browser.close()
 
@@ -0,0 +1,60 @@
+"""
+Benchmark bulk vs per-element Greenhouse schema extraction.
+
+Loads the job page once, then times both extractors over several rounds
+and checks they produce the same schema.
+
+Usage: python -m execution.greenhouse.run_extract_schema_benchmark [job_url] [rounds]
+"""
+
+import sys
+import time
+import statistics
+
+from execution.greenhouse.session import start_session
+from execution.greenhouse.steps.open_job import open_job
+from execution.greenhouse.steps.extract_schema import (
+    extract_schema_from_page,
+    extract_schema_from_page_per_element,
+)
+
+JOB_URL = "https://job-boards.greenhouse.io/rhinofederatedcomputing/jobs/4079601009"
+
+
+def _time_extractor(extractor, page, rounds: int):
+    timings = []
+    schema = None
+    for _ in range(rounds):
+        started = time.perf_counter()
+        schema = extractor(page)
+        timings.append((time.perf_counter() - started) * 1000)
+    return schema, timings
+
+
+def main():
+    job_url = sys.argv[1] if len(sys.argv) > 1 else JOB_URL
+    rounds = int(sys.argv[2]) if len(sys.argv) > 2 else 10
+
+    session = start_session(headless=True)
+    page = session.page
+
+    print("🔍 Opening job page...")
+    open_job(page, job_url)
+
+    bulk_schema, bulk_ms = _time_extractor(extract_schema_from_page, page, rounds)
+    legacy_schema, legacy_ms = _time_extractor(
+        extract_schema_from_page_per_element, page, rounds
+    )
+
+    print(f"\n=== SCHEMA EXTRACTION ({len(bulk_schema.fields)} fields, {rounds} rounds) ===\n")
+    print(f"per-element: median={statistics.median(legacy_ms):.1f}ms  min={min(legacy_ms):.1f}ms")
+    print(f"bulk:        median={statistics.median(bulk_ms):.1f}ms  min={min(bulk_ms):.1f}ms")
+    print(f"speedup:     {statistics.median(legacy_ms) / statistics.median(bulk_ms):.1f}x")
+    print(f"identical schemas: {bulk_schema == legacy_schema}")
+
+    session.context.close()
+    session.browser.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,138 @@
+"""
+Offline benchmark / regression run of the Greenhouse steps on a recorded job page.
+
+Record once (network needed):
+    python -m execution.greenhouse.run_replay_benchmark record <job_url>
+
+Replay as often as needed, with no network and no manual pauses:
+    python -m execution.greenhouse.run_replay_benchmark bench <job_url> --mode har --rounds 10
+    python -m execution.greenhouse.run_replay_benchmark bench <job_url> --mode snapshot
+
+har      - every recorded response replayed through context.route_from_har
+snapshot - the rendered form, scripts stripped, served by a local HTTP server
+
+Times extract_schema_from_page, dry_run_fill_form and fill_form_node per round
+and prints the per-step wait timings.
+"""
+
+import argparse
+import os
+import statistics
+import tempfile
+import time
+
+from execution.greenhouse.greenhouse_executor import GreenhouseExecutor
+from execution.greenhouse.replay import (
+    DEFAULT_RECORDINGS_DIR,
+    ReplayGreenhouseExecutor,
+    SnapshotServer,
+    record_job_page,
+    recording_name,
+)
+from execution.greenhouse.steps.dry_run_fill import dry_run_fill_form
+from execution.greenhouse.steps.extract_schema import extract_schema_from_page
+from execution.greenhouse.steps.open_job import open_job
+from execution.greenhouse.wait_timing import wait_timings
+from graph.nodes_submission import fill_form_node
+from graph.state import GraphState
+from mapping.map_profile_to_schema import map_profile_to_schema
+from models.job import Job
+from user.profile import UserProfile
+
+JOB_URL = "https://job-boards.greenhouse.io/rhinofederatedcomputing/jobs/4079601009"
+
+
+def _profile(resume_path: str) -> UserProfile:
+    return UserProfile(
+        first_name="Replay",
+        last_name="User",
+        email="replay@example.com",
+        phone="+15555550100",
+        country="United States",
+        resume_path=resume_path,
+        linkedin="https://linkedin.com/in/replay-user",
+        website="https://example.com",
+    )
+
+
+def _timed(timings, name, fn, *args):
+    started = time.perf_counter()
+    result = fn(*args)
+    timings.setdefault(name, []).append((time.perf_counter() - started) * 1000)
+    return result
+
+
+def bench(job_url: str, mode: str, rounds: int, recordings_dir: str) -> None:
+    name = recording_name(job_url)
+    server = None
+
+    if mode == "har":
+        executor = ReplayGreenhouseExecutor(job_url, os.path.join(recordings_dir, f"{name}.har"))
+        page_url = job_url
+    else:
+        server = SnapshotServer(recordings_dir).start()
+        page_url = server.url_for(job_url)
+        executor = GreenhouseExecutor(page_url, headless=True, block_resources=False)
+
+    timings = {}
+    with tempfile.NamedTemporaryFile(suffix=".pdf") as resume:
+        profile = _profile(resume.name)
+        job = Job(id=name, title="Replay", company="Replay", application_url=job_url)
+
+        try:
+            page = executor.get_page()
+            for _ in range(rounds):
+                _timed(timings, "open_job", open_job, page, page_url)
+                schema = _timed(timings, "extract_schema", extract_schema_from_page, page)
+                mapping = map_profile_to_schema(schema, profile)
+                _timed(timings, "dry_run_fill_form", dry_run_fill_form, page, mapping)
+
+                # Fresh page for the graph node so it fills an empty form
+                page.goto(page_url, wait_until="domcontentloaded")
+                state = GraphState(
+                    current_job=job,
+                    executor=executor,
+                    form_schema=schema,
+                    field_mapping={m.field_id: m.value for m in mapping.mapped_fields},
+                )
+                _timed(timings, "fill_form_node", fill_form_node, state)
+        finally:
+            executor.close()
+            if server is not None:
+                server.stop()
+
+    print(f"\n=== REPLAY BENCHMARK ({mode}, {rounds} rounds, {len(schema.fields)} fields) ===\n")
+    for step, values in timings.items():
+        print(f"{step:<18} median={statistics.median(values):8.1f}ms  min={min(values):8.1f}ms")
+
+    print()
+    for step, entry in sorted(wait_timings.report().items()):
+        print(f"⏱ {step}: {entry['total_ms']:.0f}ms over {entry['count']} waits")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Record and replay Greenhouse job pages offline")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    record = sub.add_parser("record", help="Record HAR + static snapshot of a live job page")
+    record.add_argument("job_url", nargs="?", default=JOB_URL)
+    record.add_argument("--out", default=DEFAULT_RECORDINGS_DIR)
+    record.add_argument("--headed", action="store_true")
+
+    run = sub.add_parser("bench", help="Time the Greenhouse steps against a recording")
+    run.add_argument("job_url", nargs="?", default=JOB_URL)
+    run.add_argument("--mode", choices=("har", "snapshot"), default="har")
+    run.add_argument("--rounds", type=int, default=5)
+    run.add_argument("--recordings", default=DEFAULT_RECORDINGS_DIR)
+
+    args = parser.parse_args()
+
+    if args.command == "record":
+        paths = record_job_page(args.job_url, args.out, headless=not args.headed)
+        print(f"📼 HAR: {paths['har']}\n📄 Snapshot: {paths['html']}")
+    else:
+        bench(args.job_url, args.mode, args.rounds, args.recordings)
+
+
+if __name__ == "__main__":
+    main()
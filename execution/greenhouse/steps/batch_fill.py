@@ -0,0 +1,67 @@
+import logging
+from typing import Any, Dict
+from playwright.sync_api import Page
+
+logger = logging.getLogger(__name__)
+
+
+# Sets every value through the native value setter (so React's value
+# tracker sees the change), fires the events React listens to, and reports
+# what actually ended up in each field - all in one round trip.
+_BATCH_FILL_JS = """
+(values) => {
+    const setters = {
+        INPUT: Object.getOwnPropertyDescriptor(HTMLInputElement.prototype, "value").set,
+        TEXTAREA: Object.getOwnPropertyDescriptor(HTMLTextAreaElement.prototype, "value").set,
+    };
+
+    const resolve = (id) => {
+        const el = document.getElementById(id);
+        if (!el) return null;
+        if (setters[el.tagName]) return el;
+        // Wrapper element - look for the real input inside
+        return el.querySelector("input, textarea");
+    };
+
+    const results = {};
+    for (const [id, value] of Object.entries(values)) {
+        const el = resolve(id);
+        if (!el) {
+            results[id] = { status: "missing", actual: null };
+            continue;
+        }
+
+        el.focus();
+        setters[el.tagName].call(el, value);
+        el.dispatchEvent(new Event("input", { bubbles: true }));
+        el.dispatchEvent(new Event("change", { bubbles: true }));
+        el.dispatchEvent(new FocusEvent("blur"));
+        el.dispatchEvent(new FocusEvent("focusout", { bubbles: true }));
+
+        results[id] = {
+            status: el.value === value ? "filled" : "mismatch",
+            actual: el.value,
+        };
+    }
+    return results;
+}
+"""
+
+
+def batch_fill_text_fields(page: Page, values: Dict[str, str]) -> Dict[str, Dict[str, Any]]:
+    """
+    Fill many text-like fields (input / textarea) by id in a single call.
+
+    Returns {field_id: {"status": "filled" | "mismatch" | "missing",
+                        "actual": <value read back>}}.
+    File inputs and React-Select widgets are NOT handled here.
+    """
+    if not values:
+        return {}
+
+    results = page.evaluate(_BATCH_FILL_JS, values)
+
+    filled = sum(1 for r in results.values() if r["status"] == "filled")
+    logger.info("Batch fill | filled=%d/%d", filled, len(values))
+
+    return results
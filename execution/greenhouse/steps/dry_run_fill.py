@@ -1,13 +1,16 @@
 from playwright.sync_api import Page
 from mapping.mapping_models import FieldMappingResult
 from models.submission.form_field_type import FormFieldType
-import time
+from execution.greenhouse.wait_timing import wait_timings
+
+RESUME_ATTACH_TIMEOUT_MS = 5000
 
 def wait_for_additional_questions(page: Page):
-    page.wait_for_selector(
-        ".application--questions >> text=LinkedIn Profile",
-        timeout=15000
-    )
+    with wait_timings.measure("dry_run_fill.additional_questions"):
+        page.wait_for_selector(
+            ".application--questions >> text=LinkedIn Profile",
+            timeout=15000
+        )
 
 
 def gentle_scroll(page):
@@ -16,7 +19,6 @@ def gentle_scroll(page):
             window.scrollBy(0, 250);
         }
     """)
-    time.sleep(0.3)
 
 def find_real_input(page: Page, field_id: str):
     # try direct id
@@ -53,20 +55,33 @@ def dry_run_fill_form(page: Page, mapping: FieldMappingResult):
 
         # ⏳ LinkedIn / Website מופיעים אחרי טעינה דינמית
         if field_id.startswith("question_"):
-            page.wait_for_selector(f"#{field_id}", timeout=15000)
+            with wait_timings.measure("dry_run_fill.question_field"):
+                page.wait_for_selector(f"#{field_id}", timeout=15000)
 
         # ===================== FILE (Resume) =====================
         if field_type == FormFieldType.FILE:
             file_input = page.locator("input[type='file']")
             file_input.set_input_files(value)
 
+            # Wait until the file is actually attached instead of sleeping
+            try:
+                with wait_timings.measure("dry_run_fill.resume_attached"):
+                    page.wait_for_function(
+                        "el => el.files.length > 0",
+                        arg=file_input.first.element_handle(),
+                        timeout=RESUME_ATTACH_TIMEOUT_MS,
+                    )
+            except Exception:
+                print("⚠️ Resume not attached in time – continuing")
+                continue
+
             print("📎 Resume uploaded – skipping further actions on this field")
-            time.sleep(1)
             continue  # 🚨 חובה – לא לגעת בזה יותר
 
         # ===================== TEXT / EMAIL / PHONE =====================
         el = page.locator(f"#{field_id}")
-        el.wait_for(state="visible", timeout=15000)
+        with wait_timings.measure("dry_run_fill.field_visible"):
+            el.wait_for(state="visible", timeout=15000)
         el.scroll_into_view_if_needed()
 
         # 🔥 Greenhouse חייב fill (לא type)
@@ -74,7 +89,6 @@ def dry_run_fill_form(page: Page, mapping: FieldMappingResult):
         el.dispatch_event("blur")
 
         highlight(el)
-        time.sleep(0.4)
 
     page.evaluate("window.scrollTo(0, 0)")
     print("✅ Dry-Run Fill completed (NO SUBMIT)")
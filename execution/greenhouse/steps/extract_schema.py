@@ -1,4 +1,6 @@
+import hashlib
 import logging
+from typing import Any, Dict, List, Optional, Tuple
 from playwright.sync_api import Page
 
 from models.submission.form_schema import SubmissionFormSchema
@@ -8,50 +10,204 @@ from models.submission.form_field_type import FormFieldType
 logger = logging.getLogger(__name__)
 
 
+# Label lookup shared by both scripts, so the fingerprint of the signature
+# read equals the fingerprint of a full extraction
+_LABEL_FOR_JS = """
+    const labelFor = (el) => {
+        if (el.id) {
+            const label = document.querySelector(`label[for="${el.id}"]`);
+            if (label) return label.innerText.trim();
+        }
+        return el.getAttribute("aria-label") ||
+               el.getAttribute("placeholder") ||
+               el.id;
+    };
+"""
+
+# Collects everything the schema needs for every form element in ONE
+# page.evaluate call (one CDP round trip instead of ~8 per element).
+_BULK_EXTRACT_JS = """
+() => {
+    const form = document.querySelector("form#application-form");
+    if (!form) return null;
+""" + _LABEL_FOR_JS + """
+    const parentRequired = (el) => {
+        let node = el.parentElement;
+        while (node) {
+            if (node.getAttribute && node.getAttribute("aria-required") === "true") {
+                return true;
+            }
+            node = node.parentElement;
+        }
+        return false;
+    };
+
+    return Array.from(form.querySelectorAll("input, textarea, select")).map(el => ({
+        id: el.getAttribute("id"),
+        type: el.getAttribute("type"),
+        tag: el.tagName,
+        label: labelFor(el),
+        aria_label: el.getAttribute("aria-label"),
+        aria_required: el.getAttribute("aria-required"),
+        required_attr: el.getAttribute("required"),
+        parent_required: parentRequired(el),
+    }));
+}
+"""
+
+# Only what the fingerprint hashes - no ancestor walks, no required flags
+_SIGNATURE_JS = """
+() => {
+    const form = document.querySelector("form#application-form");
+    if (!form) return null;
+""" + _LABEL_FOR_JS + """
+    return Array.from(form.querySelectorAll("input, textarea, select")).map(el => ({
+        id: el.getAttribute("id"),
+        type: el.getAttribute("type"),
+        tag: el.tagName,
+        label: labelFor(el),
+    }));
+}
+"""
+
+_FINGERPRINT_KEYS = ("tag", "id", "type", "label")
+
+
+def fingerprint_elements(elements: List[Dict[str, Any]]) -> str:
+    """
+    Signature of the form: tag / id / type / label per element.
+    Labels are included because mapping hints are inferred from them.
+    """
+    signature = "|".join(
+        ":".join(str(attrs.get(key) or "") for key in _FINGERPRINT_KEYS)
+        for attrs in elements
+    )
+    return hashlib.sha256(signature.encode("utf-8")).hexdigest()
+
+
+def read_form_signature(page: Page) -> Optional[List[Dict[str, Any]]]:
+    """
+    Id / tag / type / label of every form element, or None without a form.
+    Much cheaper than a full extraction; enough for fingerprint_elements.
+    """
+    return page.evaluate(_SIGNATURE_JS)
+
+
+def _schema_from_elements(elements: Optional[List[Dict[str, Any]]], url: str) -> SubmissionFormSchema:
+    """
+    Schema from the result of _BULK_EXTRACT_JS (None when there is no form).
+    Shared by the sync, async and fingerprinting entry points.
+    """
+    if elements is None:
+        raise RuntimeError("❌ Greenhouse application form not found")
+
+    return SubmissionFormSchema(
+        ats_type="greenhouse",
+        form_url=url,
+        fields=_build_fields(elements),
+    )
+
+
+def extract_schema_with_fingerprint(page: Page) -> Tuple[SubmissionFormSchema, str]:
+    """
+    extract_schema_from_page plus the form fingerprint, from the same
+    single page.evaluate.
+    """
+    elements = page.evaluate(_BULK_EXTRACT_JS)
+    return _schema_from_elements(elements, page.url), fingerprint_elements(elements)
+
+
 def extract_schema_from_page(page: Page) -> SubmissionFormSchema:
     logger.info("🔍 Searching for Greenhouse application form")
 
+    schema = _schema_from_elements(page.evaluate(_BULK_EXTRACT_JS), page.url)
+
+    logger.info("✅ Extracted %d Greenhouse fields", len(schema.fields))
+    return schema
+
+
+async def extract_schema_from_page_async(page) -> SubmissionFormSchema:
+    """
+    extract_schema_from_page for a playwright.async_api page.
+    """
+    return _schema_from_elements(await page.evaluate(_BULK_EXTRACT_JS), page.url)
+
+
+def extract_schema_from_page_per_element(page: Page) -> SubmissionFormSchema:
+    """
+    Previous implementation: several CDP round trips per form element.
+    Kept as the baseline for run_extract_schema_benchmark.py.
+    """
     form = page.query_selector("form#application-form")
     if not form:
         raise RuntimeError("❌ Greenhouse application form not found")
 
+    elements = [
+        _read_element_attributes(el)
+        for el in form.query_selector_all("input, textarea, select")
+        if el.get_attribute("id")
+    ]
+
+    return SubmissionFormSchema(
+        ats_type="greenhouse",
+        form_url=page.url,
+        fields=_build_fields(elements),
+    )
+
+
+# ---------- helpers ----------
+
+def _build_fields(elements: List[Dict[str, Any]]) -> List[FormField]:
     fields = []
 
-    for el in form.query_selector_all("input, textarea, select"):
-        field_id = el.get_attribute("id")
+    for attrs in elements:
+        field_id = attrs.get("id")
         if not field_id:
             continue  # Greenhouse real fields always have id
 
         # 🚫 Skip internal / helper inputs (React widgets, hidden fields)
-        input_type = el.get_attribute("type") or ""
+        input_type = attrs.get("type") or ""
         if field_id.startswith("iti-"):
             continue
         if input_type == "hidden":
             continue
 
-        label = _extract_label(el)
-        field_type = _detect_field_type(el)
-        required = _is_required(el, label)
-
+        label = attrs.get("label")
         fields.append(
             FormField(
                 field_id=field_id,
                 label=label,
-                type=field_type,
-                required=required,
+                type=_detect_field_type(attrs),
+                required=_is_required(attrs, label),
             )
         )
 
-    logger.info("✅ Extracted %d Greenhouse fields", len(fields))
-
-    return SubmissionFormSchema(
-        ats_type="greenhouse",
-        form_url=page.url,
-        fields=fields,
-    )
-
+    return fields
+
+
+def _read_element_attributes(el) -> Dict[str, Any]:
+    return {
+        "id": el.get_attribute("id"),
+        "type": el.get_attribute("type"),
+        "tag": el.evaluate("el => el.tagName"),
+        "label": _extract_label(el),
+        "aria_label": el.get_attribute("aria-label"),
+        "aria_required": el.get_attribute("aria-required"),
+        "required_attr": el.get_attribute("required"),
+        "parent_required": el.evaluate(
+            """el => {
+                let node = el.parentElement;
+                while (node) {
+                    if (node.getAttribute && node.getAttribute("aria-required") === "true") {
+                        return true;
+                    }
+                    node = node.parentElement;
+                }
+                return false;
+            }"""
+        ),
+    }
 
-# ---------- helpers ----------
 
 def _extract_label(el) -> str:
     label = el.evaluate(
@@ -68,10 +224,10 @@ def _extract_label(el) -> str:
     return label
 
 
-def _detect_field_type(el) -> FormFieldType:
-    t = (el.get_attribute("type") or "").lower()
-    el_id = (el.get_attribute("id") or "").lower()
-    aria = (el.get_attribute("aria-label") or "").lower()
+def _detect_field_type(attrs: Dict[str, Any]) -> FormFieldType:
+    t = (attrs.get("type") or "").lower()
+    el_id = (attrs.get("id") or "").lower()
+    aria = (attrs.get("aria_label") or "").lower()
 
     if t == "file" or "resume" in el_id or "cv" in el_id:
         return FormFieldType.FILE
@@ -82,41 +238,24 @@ def _detect_field_type(el) -> FormFieldType:
     if "phone" in el_id or "phone" in aria:
         return FormFieldType.PHONE
 
-    if el.evaluate("el => el.tagName") == "TEXTAREA":
+    if attrs.get("tag") == "TEXTAREA":
         return FormFieldType.TEXTAREA
 
     # 👇 LinkedIn / Website יפלו לכאן
     return FormFieldType.TEXT
 
 
-
-
-
-
-
-def _is_required(el, label: str) -> bool:
+def _is_required(attrs: Dict[str, Any], label: Optional[str]) -> bool:
     # Direct aria-required
-    if el.get_attribute("aria-required") == "true":
+    if attrs.get("aria_required") == "true":
         return True
 
     # Required attribute
-    if el.get_attribute("required"):
+    if attrs.get("required_attr"):
         return True
 
     # Check parent containers (important for file upload)
-    parent_required = el.evaluate(
-        """el => {
-            let node = el.parentElement;
-            while (node) {
-                if (node.getAttribute && node.getAttribute("aria-required") === "true") {
-                    return true;
-                }
-                node = node.parentElement;
-            }
-            return false;
-        }"""
-    )
-    if parent_required:
+    if attrs.get("parent_required"):
         return True
 
     # Label asterisk fallback
@@ -124,4 +263,3 @@ def _is_required(el, label: str) -> bool:
         return True
 
     return False
-
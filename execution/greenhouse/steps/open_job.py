@@ -1,34 +1,72 @@
 import logging
 from playwright.sync_api import Page
 
+from execution.greenhouse.urls import parse_greenhouse_job_url
+from execution.greenhouse.wait_timing import wait_timings
+
 logger = logging.getLogger(__name__)
 
+# 🔍 Greenhouse signature fields (much more reliable than form)
+DETECTION_SELECTORS = [
+    "input[name='first_name']",
+    "input[name='last_name']",
+    "input[type='file']",
+    "section#application",
+    "div.application-form",
+]
+
+
+_MATCHED_SELECTOR_JS = "(el, selectors) => selectors.find(s => el.matches(s))"
 
-def open_job(page: Page, job_url: str) -> None:
+
+def open_job(page: Page, job_url: str, timeout: int = 15000) -> None:
     logger.info("Opening Greenhouse job page")
     page.goto(job_url)
 
-    page.wait_for_timeout(2000)
-
-    # 🔍 Greenhouse signature fields (much more reliable than form)
-    selectors = [
-        "input[name='first_name']",
-        "input[name='last_name']",
-        "input[type='file']",
-        "section#application",
-        "div.application-form",
-    ]
-
-    for selector in selectors:
-        try:
-            page.wait_for_selector(selector, timeout=5000)
-            logger.info(f"✅ Greenhouse application detected using selector: {selector}")
-            return
-        except:
-            pass
+    # Race all signature selectors at once - returns as soon as any appears
+    try:
+        with wait_timings.measure("open_job.detect_application"):
+            element = page.wait_for_selector(
+                ", ".join(DETECTION_SELECTORS),
+                timeout=timeout,
+            )
+    except Exception:
+        element = None
+
+    if element is not None:
+        selector = element.evaluate(_MATCHED_SELECTOR_JS, DETECTION_SELECTORS)
+        logger.info(f"✅ Greenhouse application detected using selector: {selector}")
+        return
 
     page.screenshot(path="greenhouse_debug.png", full_page=True)
     raise RuntimeError(
         "❌ Greenhouse application not detected. "
         "See greenhouse_debug.png"
     )
+
+
+async def open_job_async(page, job_url: str, timeout: int = 15000) -> str:
+    """
+    open_job for a playwright.async_api page. Returns the matched selector.
+    """
+    # A posting that redirected (tracking params, canonical host) is still
+    # the same job - don't load it a second time
+    if not _on_posting(page.url, job_url):
+        await page.goto(job_url)
+
+    try:
+        element = await page.wait_for_selector(", ".join(DETECTION_SELECTORS), timeout=timeout)
+    except Exception:
+        element = None
+
+    if element is None:
+        raise RuntimeError(f"❌ Greenhouse application not detected at {job_url}")
+
+    return await element.evaluate(_MATCHED_SELECTOR_JS, DETECTION_SELECTORS)
+
+
+def _on_posting(current_url: str, job_url: str) -> bool:
+    if current_url == job_url:
+        return True
+    key = parse_greenhouse_job_url(job_url)
+    return key is not None and parse_greenhouse_job_url(current_url) == key
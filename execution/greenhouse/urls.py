@@ -0,0 +1,36 @@
+from typing import Optional, Tuple
+from urllib.parse import urlparse, parse_qs
+
+
+def parse_greenhouse_job_url(url: str) -> Optional[Tuple[str, str]]:
+    """
+    Extract (board_slug, job_id) from a Greenhouse job URL.
+
+    Supported shapes:
+    - https://job-boards.greenhouse.io/<board>/jobs/<job_id>
+    - https://boards.greenhouse.io/<board>/jobs/<job_id>
+    - https://boards.greenhouse.io/embed/job_app?for=<board>&token=<job_id>
+
+    Returns None for anything else.
+    """
+    if not url:
+        return None
+
+    parsed = urlparse(url.strip())
+    host = (parsed.hostname or "").lower()
+    if not host.endswith("greenhouse.io"):
+        return None
+
+    parts = [p for p in parsed.path.split("/") if p]
+
+    if len(parts) >= 3 and parts[1] == "jobs" and parts[2].isdigit():
+        return parts[0].lower(), parts[2]
+
+    if parts[:2] == ["embed", "job_app"]:
+        query = parse_qs(parsed.query)
+        board = query.get("for", [None])[0]
+        job_id = query.get("token", [None])[0]
+        if board and job_id:
+            return board.lower(), job_id
+
+    return None
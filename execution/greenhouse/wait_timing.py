@@ -0,0 +1,58 @@
+import logging
+import threading
+import time
+from contextlib import contextmanager
+from typing import Dict
+
+logger = logging.getLogger(__name__)
+
+
+class WaitTimings:
+    """
+    Accumulates time spent waiting in each Greenhouse step so wait
+    regressions show up in the run log.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._steps: Dict[str, Dict[str, float]] = {}
+
+    @contextmanager
+    def measure(self, step: str):
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            elapsed_ms = (time.perf_counter() - started) * 1000
+            with self._lock:
+                entry = self._steps.setdefault(
+                    step, {"count": 0, "total_ms": 0.0, "max_ms": 0.0}
+                )
+                entry["count"] += 1
+                entry["total_ms"] += elapsed_ms
+                entry["max_ms"] = max(entry["max_ms"], elapsed_ms)
+
+            logger.debug("Wait | step=%s | elapsed_ms=%.0f", step, elapsed_ms)
+
+    def report(self) -> Dict[str, Dict[str, float]]:
+        with self._lock:
+            return {step: dict(entry) for step, entry in self._steps.items()}
+
+    def log_report(self) -> None:
+        for step, entry in sorted(self.report().items()):
+            logger.info(
+                "Wait time | step=%s | count=%d | total_ms=%.0f | avg_ms=%.0f | max_ms=%.0f",
+                step,
+                entry["count"],
+                entry["total_ms"],
+                entry["total_ms"] / entry["count"],
+                entry["max_ms"],
+            )
+
+    def reset(self) -> None:
+        with self._lock:
+            self._steps.clear()
+
+
+# Process-wide collector used by the Greenhouse steps
+wait_timings = WaitTimings()
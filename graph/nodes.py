@@ -1,6 +1,8 @@
 import logging
 
 from graph.state import GraphState
+from models.durable_job_queue import job_key
+from storage.application_index import ApplicationIndex
 from agents.cv_optimization_agent import CVOptimizationAgent
 from agents.submission_agent import SubmissionAgent
 
@@ -11,21 +13,89 @@ def pop_job_node(state: GraphState) -> GraphState:
     """
     Pops the next job from the queue and stores it in state.current_job.
     Deterministic: if queue is missing or empty, sets current_job to None.
+
+    With an application_index, postings already submitted in an earlier run
+    are skipped, and postings that previously failed are moved to the back
+    of the queue once.
     """
-    if state.job_queue is None or state.job_queue.is_empty():
-        state.current_job = None
-        logger.info("No more jobs in queue")
-    else:
-        state.current_job = state.job_queue.pop_next()
+    state.current_job = None
+
+    while state.job_queue is not None and not state.job_queue.is_empty():
+        job = state.job_queue.pop_next()
+
+        if state.application_index is not None:
+            previous = state.application_index.lookup(job)
+
+            if previous == ApplicationIndex.SUBMITTED:
+                logger.info(
+                    "Skipping already-applied job | title=%s | company=%s",
+                    job.title,
+                    job.company,
+                )
+                state.job_queue.mark_done(job)
+                continue
+
+            key = job_key(job)
+            if previous == ApplicationIndex.FAILED and key not in state.deferred_job_keys:
+                logger.info(
+                    "Deprioritizing previously failed job | title=%s | company=%s",
+                    job.title,
+                    job.company,
+                )
+                state.deferred_job_keys.add(key)
+                state.job_queue.requeue(job)
+                continue
+
+        state.current_job = job
         logger.info(
             "Popped job | title=%s | company=%s",
-            state.current_job.title,
-            state.current_job.company,
+            job.title,
+            job.company,
         )
+        return state
 
+    logger.info("No more jobs in queue")
     return state
 
 
+def preflight_node(state: GraphState) -> GraphState:
+    """
+    Drops current_job if its posting is no longer live (HTTP pre-flight
+    with state.liveness_checker). Without a checker every job passes.
+    """
+    job = state.current_job
+    if job is None or state.liveness_checker is None or not job.application_url:
+        return state
+
+    result = state.liveness_checker.check(job.application_url)
+    if result.alive:
+        return state
+
+    record_dead_posting(state, job, result.reason)
+    state.current_job = None
+    return state
+
+
+def record_dead_posting(state: GraphState, job, reason: str) -> None:
+    logger.info(
+        "Dropping closed posting | title=%s | company=%s | reason=%s",
+        job.title,
+        job.company,
+        reason,
+    )
+
+    if state.result_store is not None:
+        state.result_store.record_failure(
+            job.company,
+            job.title,
+            f"PostingClosed: {reason}",
+            application_url=job.application_url,
+        )
+
+    if state.job_queue is not None:
+        state.job_queue.mark_done(job)
+
+
 def optimize_cv_node(state: GraphState) -> GraphState:
     """
     Optimizes CV for the current job.
@@ -50,6 +120,13 @@ def optimize_cv_node(state: GraphState) -> GraphState:
         state.retry_count += 1
         return state
 
+    if state.job_similarity_index is not None:
+        reused = state.job_similarity_index.find(job)
+        if reused is not None:
+            state.current_optimized_cv = reused
+            state.retry_count = 0
+            return state
+
     try:
         logger.info(
             "Optimizing CV | title=%s | company=%s | attempt=%d",
@@ -65,11 +142,27 @@ def optimize_cv_node(state: GraphState) -> GraphState:
 
         state.current_optimized_cv = optimized_cv
         state.retry_count = 0  # reset on success
+        if state.job_similarity_index is not None:
+            state.job_similarity_index.add(job, optimized_cv)
+        if state.retry_policy is not None and getattr(state.optimizer, "retry_policy", None) is None:
+            state.retry_policy.record_success()
 
     except Exception as e:
-        state.retry_count += 1
         state.current_optimized_cv = None
 
+        if getattr(state.optimizer, "retry_policy", None) is not None:
+            # The optimizer already retried under its policy - retrying
+            # the whole node again would multiply calls per job
+            state.retry_count = state.max_retries
+        elif state.retry_policy is not None:
+            if state.retry_policy.should_retry(e, state.retry_count + 1):
+                state.retry_count += 1
+                state.retry_policy.sleep(state.retry_policy.delay_for(e, state.retry_count))
+            else:
+                state.retry_count = state.max_retries
+        else:
+            state.retry_count += 1
+
         logger.warning(
             "Optimization failed | title=%s | company=%s | retry=%d | error=%s",
             job.title,
@@ -97,8 +190,12 @@ def submit_job_node(state: GraphState) -> GraphState:
     state.result_store.record_success(
         optimized_cv.job.company,
         optimized_cv.job.title,
+        application_url=optimized_cv.job.application_url,
     )
 
+    if state.job_queue is not None:
+        state.job_queue.mark_done(optimized_cv.job)
+
     # Clear state for next iteration
     state.current_job = None
     state.current_optimized_cv = None
@@ -126,8 +223,12 @@ def optimization_failed_node(state: GraphState) -> GraphState:
                 job.company,
                 job.title,
                 "CV optimization failed after retries",
+                application_url=job.application_url,
             )
 
+        if state.job_queue is not None:
+            state.job_queue.mark_done(job)
+
     state.current_job = None
     state.retry_count = 0
 
@@ -1,9 +1,23 @@
 import logging
+from typing import Optional
+
 from graph.state import GraphState
 from models.submission.form_schema import SubmissionFormSchema
 from models.submission.form_field import FormField
 from models.submission.form_field_type import FormFieldType
 from execution.greenhouse.greenhouse_executor import GreenhouseExecutor
+from execution.greenhouse.browser_pool import PooledGreenhouseExecutor
+from execution.greenhouse.board_api import BOARD_API_FINGERPRINT
+from execution.greenhouse.steps.extract_schema import (
+    extract_schema_from_page,
+    extract_schema_with_fingerprint,
+    fingerprint_elements,
+    read_form_signature,
+)
+from execution.greenhouse.steps.batch_fill import batch_fill_text_fields
+from execution.greenhouse.urls import parse_greenhouse_job_url
+from execution.greenhouse.wait_timing import wait_timings
+from storage.selector_strategy_cache import SelectorStrategyCache
 
 
 logger = logging.getLogger(__name__)
@@ -66,11 +80,9 @@ def submit_start_node(state: GraphState) -> GraphState:
         logger.warning("Unsupported ATS type | url=%s", url)
         return state
 
-    if state.executor is None:
-        state.executor = GreenhouseExecutor(
-            job_url=job.application_url,
-            headless=False,  
-        )
+    # With the board API the schema needs no browser - open it for the fill
+    if state.board_api is None:
+        _ensure_executor(state)
 
     logger.info("Submission started | ats_type=%s | job=%s | company=%s", 
                 state.ats_type, job.title, job.company)
@@ -78,6 +90,26 @@ def submit_start_node(state: GraphState) -> GraphState:
 
 
 
+def _ensure_executor(state: GraphState):
+    """
+    Open the job page for state.current_job if no executor is open yet.
+    """
+    if state.executor is None:
+        url = state.current_job.application_url
+        if state.browser_pool is not None:
+            state.executor = PooledGreenhouseExecutor(
+                job_url=url,
+                pool=state.browser_pool,
+            )
+        else:
+            state.executor = GreenhouseExecutor(
+                job_url=url,
+                headless=False,
+            )
+    return state.executor
+
+
+
 def detect_ats_node(state):
     if state.ats_type is None:
         state.ats_type = "unknown"
@@ -89,8 +121,16 @@ def extract_schema_node(state: GraphState) -> GraphState:
     """
     Extract the submission form schema.
 
-    Deterministic stub for now.
-    Will later be replaced by DOM parsing / LLM inference.
+    Sources, in order:
+    1. state.schema_cache (keyed by board/job id) - used without waiting
+       for the form and validated against the live form in FILL_FORM,
+       once the page is loaded anyway
+    2. state.board_api - no browser needed; stored in the cache and
+       trusted in FILL_FORM as long as the filled field ids exist
+    3. the DOM of the job page - a cached schema of another job on the
+       same board with the same form fingerprint, else a full extraction
+    Without an executor, or if DOM extraction fails, falls back to the
+    static Greenhouse schema.
     """
 
     job = state.current_job
@@ -109,9 +149,168 @@ def extract_schema_node(state: GraphState) -> GraphState:
         state.ats_type,
     )
 
-    schema = SubmissionFormSchema(
-        ats_type=state.ats_type,
-        form_url=job.application_url,
+    schema = _cached_schema(state, job.application_url)
+
+    if schema is None and state.board_api is not None and state.ats_type == "greenhouse":
+        schema = _schema_from_board_api(state, job.application_url)
+        if schema is None:
+            _ensure_executor(state)
+
+    if schema is None and state.executor is not None:
+        try:
+            schema = _extract_schema_from_dom(state, job.application_url)
+        except Exception as e:
+            logger.warning(f"DOM schema extraction failed, using static schema: {e}")
+
+    if schema is None:
+        schema = _static_greenhouse_schema(state.ats_type, job.application_url)
+
+    state.form_schema = _with_mapping_hints(schema)
+    return state
+
+
+def _with_mapping_hints(schema: SubmissionFormSchema) -> SubmissionFormSchema:
+    for field in schema.fields:
+        if field.mapping_hint is None:
+            field.mapping_hint = _infer_mapping_hint(field)
+    return schema
+
+
+def _cached_schema(state: GraphState, url: str) -> Optional[SubmissionFormSchema]:
+    """
+    Schema from state.schema_cache for this job. Validated lazily in
+    FILL_FORM, so nothing waits for the page here.
+    """
+    key = parse_greenhouse_job_url(url)
+    if state.schema_cache is None or key is None:
+        return None
+
+    cached = state.schema_cache.peek(*key)
+    if cached is None:
+        return None
+
+    fingerprint, schema = cached
+    state.schema_fingerprint = fingerprint
+    logger.info("Schema cache hit | board=%s | job_id=%s", *key)
+    return schema.model_copy(update={"form_url": url})
+
+
+def _schema_from_board_api(state: GraphState, url: str) -> Optional[SubmissionFormSchema]:
+    try:
+        schema = state.board_api.fetch_schema(url)
+    except Exception as e:
+        logger.warning(f"Board API schema fetch failed, using the page: {e}")
+        return None
+
+    key = parse_greenhouse_job_url(url)
+    if schema is not None and state.schema_cache is not None and key is not None:
+        state.schema_cache.put(*key, BOARD_API_FINGERPRINT, schema)
+        state.schema_fingerprint = BOARD_API_FINGERPRINT
+    return schema
+
+
+def _extract_schema_from_dom(state: GraphState, url: str) -> SubmissionFormSchema:
+    page = state.executor.get_page()
+    cache = state.schema_cache
+    key = parse_greenhouse_job_url(url)
+
+    with wait_timings.measure("extract_schema.form_present"):
+        page.wait_for_selector("form#application-form", timeout=10000)
+
+    if cache is None or key is None:
+        return extract_schema_from_page(page)
+
+    # Jobs on one board often share a form - the signature read is cheap
+    elements = read_form_signature(page)
+    fingerprint = fingerprint_elements(elements) if elements is not None else None
+    schema = cache.find(key[0], fingerprint) if fingerprint is not None else None
+
+    if schema is not None:
+        logger.info("Schema cache board hit | board=%s | job_id=%s", *key)
+        schema = schema.model_copy(update={"form_url": url})
+    else:
+        schema, fingerprint = extract_schema_with_fingerprint(page)
+
+    cache.put(*key, fingerprint, schema)
+    return schema
+
+
+def _validate_cached_schema(state: GraphState, page) -> None:
+    """
+    Compare a schema served from schema_cache with the live form, using
+    the signature read only. DOM schemas must match the fingerprint; board
+    API schemas only need every filled field id on the page. Otherwise the
+    form is extracted, the fresh schema replaces it (and the cache entry)
+    and the fields are mapped again.
+    """
+    expected = state.schema_fingerprint
+    state.schema_fingerprint = None
+
+    key = parse_greenhouse_job_url(state.current_job.application_url) if state.current_job else None
+    if key is None or state.schema_cache is None:
+        return
+
+    elements = read_form_signature(page)
+    if elements is None:
+        return
+
+    if expected == BOARD_API_FINGERPRINT:
+        present = {element.get("id") for element in elements}
+        missing = [
+            field_id for field_id, value in (state.field_mapping or {}).items()
+            if value not in (None, "") and field_id not in present
+        ]
+        if not missing:
+            return
+        logger.info("Board API schema fields missing on page | fields=%s", missing)
+    elif fingerprint_elements(elements) == expected:
+        return
+
+    schema, fingerprint = extract_schema_with_fingerprint(page)
+    logger.info("Cached schema is stale, re-mapping | board=%s | job_id=%s", *key)
+    state.schema_cache.invalidate(*key)
+    state.schema_cache.put(*key, fingerprint, schema)
+    state.form_schema = _with_mapping_hints(schema)
+    map_fields_node(state)
+
+
+# Hints that resolve to text content, never to a file path
+_TEXT_VALUE_HINTS = {"optimized_cv.cover_letter"}
+
+
+def _infer_mapping_hint(field: FormField) -> str | None:
+    """
+    Mapping hint for a DOM-extracted field (same hints as the static schema).
+    """
+    by_id = {
+        "first_name": "cv.full_name",   # Will be split in map_fields_node
+        "last_name": "cv.full_name",    # Will be split in map_fields_node
+        "email": "cv.email",
+        "phone": "user_profile.phone",
+        "country": "user_profile.country",
+        "resume": "cv.resume_path",
+        "cover_letter": "optimized_cv.cover_letter",
+        "cover_letter_text": "optimized_cv.cover_letter",
+    }
+    if field.field_id in by_id:
+        return by_id[field.field_id]
+
+    label = (field.label or "").lower()
+    if "linkedin" in label:
+        return "user_profile.linkedin"
+    if "website" in label or "portfolio" in label:
+        return "user_profile.website"
+
+    return None
+
+
+def _static_greenhouse_schema(ats_type, url: str) -> SubmissionFormSchema:
+    """
+    Deterministic fallback schema for the standard Greenhouse form.
+    """
+    return SubmissionFormSchema(
+        ats_type=ats_type,
+        form_url=url,
         fields=[
             # Greenhouse uses separate first_name and last_name fields
             FormField(
@@ -180,9 +379,6 @@ def extract_schema_node(state: GraphState) -> GraphState:
         ],
     )
 
-    state.form_schema = schema
-    return state
-
 
 
 def map_fields_node(state: GraphState) -> GraphState:
@@ -309,47 +505,79 @@ def fill_form_node(state: GraphState) -> GraphState:
     1. Primary: Label-based selectors (page.get_by_label) - most reliable for Greenhouse
     2. Fallback: Direct ID selectors (#first_name, #last_name, #email, #phone)
     3. File upload: input[type="file"] with set_input_files (no button clicks)
-    
+
+    With state.batch_fill (default), all text fields are set in one injected
+    script; only misses go through the per-field selectors above.
+
     Handles full_name by splitting into first_name/last_name automatically.
     """
-    executor = state.executor
     mapping = state.field_mapping
     schema = state.form_schema
 
-    if executor is None:
-        logger.warning("fill_form_node called without executor")
-        return state
-
     if mapping is None:
         logger.warning("fill_form_node called without field_mapping")
         return state
 
+    # Schema may have come from the board API - open the page only now
+    if state.executor is None and state.board_api is not None and state.current_job is not None:
+        _ensure_executor(state)
+
+    executor = state.executor
+    if executor is None:
+        logger.warning("fill_form_node called without executor")
+        return state
+
     page = executor.get_page()
 
     # Wait for form to be ready - Greenhouse forms load dynamically
     try:
-        page.wait_for_load_state("networkidle", timeout=15000)
-        # Wait for Greenhouse application form specifically
-        page.wait_for_selector("form#application-form", timeout=10000)
-        # Wait for at least one input field to be visible (ensures form is interactive)
-        page.wait_for_selector("input#first_name, input#last_name, input#email", timeout=10000, state="visible")
+        with wait_timings.measure("fill_form.form_ready"):
+            # Form presence, not networkidle - trackers and long polls keep
+            # the network busy long after the form is usable
+            page.wait_for_selector("form#application-form", timeout=15000)
+            # Wait for at least one input field to be visible (ensures form is interactive)
+            page.wait_for_selector("input#first_name, input#last_name, input#email", timeout=10000, state="visible")
         logger.info("Greenhouse form loaded and ready")
     except Exception as e:
         logger.warning(f"Form wait timeout: {e}")
         return state
 
+    if state.schema_fingerprint is not None:
+        try:
+            _validate_cached_schema(state, page)
+        except Exception as e:
+            logger.warning(f"Cached schema validation failed: {e}")
+        mapping = state.field_mapping
+        schema = state.form_schema
+
+    # Learned selector strategies are per board
+    board = None
+    if state.selector_strategy_cache is not None and state.current_job is not None:
+        key = parse_greenhouse_job_url(state.current_job.application_url)
+        board = key[0] if key else None
+
     # Fill fields using schema-aware approach
     if schema is None:
         logger.warning("No schema available, using generic Greenhouse field mapping")
-        _fill_greenhouse_fields_generic(page, mapping)
+        _fill_greenhouse_fields_generic(
+            page, mapping, state.batch_fill, state.selector_strategy_cache, board
+        )
     else:
-        _fill_greenhouse_fields_with_schema(page, schema, mapping)
+        _fill_greenhouse_fields_with_schema(
+            page, schema, mapping, state.batch_fill, state.selector_strategy_cache, board
+        )
 
     logger.info("Greenhouse form filling completed (no submit)")
     return state
 
 
-def _fill_greenhouse_fields_generic(page, mapping: dict):
+def _fill_greenhouse_fields_generic(
+    page,
+    mapping: dict,
+    batch: bool = True,
+    strategy_cache: Optional[SelectorStrategyCache] = None,
+    board: Optional[str] = None,
+):
     """
     Fill Greenhouse form fields generically without schema.
     Handles standard Greenhouse fields: first_name, last_name, email, phone, resume.
@@ -376,18 +604,18 @@ def _fill_greenhouse_fields_generic(page, mapping: dict):
         ("phone", "Phone", "#phone"),
     ]
     
-    for field_id, label_text, id_selector in field_configs:
-        if field_id not in mapping or not mapping[field_id]:
-            continue
-        
-        value = str(mapping[field_id])
-        _fill_greenhouse_text_field(page, field_id, label_text, id_selector, value)
+    text_fields = [
+        (field_id, label_text, id_selector, str(mapping[field_id]))
+        for field_id, label_text, id_selector in field_configs
+        if field_id in mapping and mapping[field_id]
+    ]
+    _fill_greenhouse_text_fields(page, text_fields, batch, strategy_cache, board)
     
     # Handle resume file upload (CRITICAL - must use set_input_files)
     if "resume" in mapping and mapping["resume"]:
         file_path = str(mapping["resume"]).strip()
         if file_path:
-            success = _fill_greenhouse_file_field(page, file_path)
+            success = _fill_greenhouse_file_field(page, file_path, strategy_cache, board)
             if not success:
                 logger.error(f"Failed to upload resume: {file_path}")
         else:
@@ -396,11 +624,22 @@ def _fill_greenhouse_fields_generic(page, mapping: dict):
         logger.warning("Resume not found in field mapping")
 
 
-def _fill_greenhouse_fields_with_schema(page, schema: SubmissionFormSchema, mapping: dict):
+def _fill_greenhouse_fields_with_schema(
+    page,
+    schema: SubmissionFormSchema,
+    mapping: dict,
+    batch: bool = True,
+    strategy_cache: Optional[SelectorStrategyCache] = None,
+    board: Optional[str] = None,
+):
     """
     Fill Greenhouse form fields using schema information.
     Uses label-based selectors with ID fallback for reliability.
+    Text fields are collected and filled together; file and country
+    fields go through Playwright one by one.
     """
+    text_fields = []
+
     for field in schema.fields:
         field_id = field.field_id
         value = mapping.get(field_id)
@@ -411,11 +650,23 @@ def _fill_greenhouse_fields_with_schema(page, schema: SubmissionFormSchema, mapp
             continue
         
         try:
+            # Text content for an upload question (the generated cover
+            # letter) goes into Greenhouse's "enter manually" textarea
+            if (
+                field.type in (FormFieldType.FILE, FormFieldType.FILE_UPLOAD)
+                and field.mapping_hint in _TEXT_VALUE_HINTS
+            ):
+                text_id = f"{field_id}_text"
+                text_fields.append((text_id, field.label, f"#{text_id}", str(value)))
+                continue
+
             # Handle file uploads (resume) - CRITICAL: use set_input_files only
             if field.type in (FormFieldType.FILE, FormFieldType.FILE_UPLOAD):
                 file_path = str(value).strip()
                 if file_path:
-                    success = _fill_greenhouse_file_field(page, file_path)
+                    success = _fill_greenhouse_file_field(
+                        page, file_path, strategy_cache, board, field_id
+                    )
                     if not success:
                         logger.error(f"Failed to upload resume for field '{field_id}': {file_path}")
                 else:
@@ -429,26 +680,97 @@ def _fill_greenhouse_fields_with_schema(page, schema: SubmissionFormSchema, mapp
             
             # Handle text fields (first_name, last_name, email, phone, LinkedIn, website, etc.)
             # For question_* fields, use the field_id directly as selector
-            if field_id.startswith("question_"):
-                _fill_greenhouse_text_field(page, field_id, field.label, f"#{field_id}", str(value))
-            else:
-                _fill_greenhouse_text_field(page, field_id, field.label, f"#{field_id}", str(value))
+            text_fields.append((field_id, field.label, f"#{field_id}", str(value)))
                 
         except Exception as e:
             logger.warning(f"Error filling field {field_id}: {e}")
 
+    _fill_greenhouse_text_fields(page, text_fields, batch, strategy_cache, board)
 
-def _fill_greenhouse_text_field(page, field_id: str, label_text: str, id_selector: str, value: str) -> bool:
+
+def _fill_greenhouse_text_fields(
+    page,
+    text_fields: list,
+    batch: bool,
+    strategy_cache: Optional[SelectorStrategyCache] = None,
+    board: Optional[str] = None,
+):
+    """
+    Fill (field_id, label_text, id_selector, value) tuples.
+
+    Batch mode sets all values in one page.evaluate and falls back to the
+    per-field strategies only for fields that were missing or didn't stick.
+    """
+    if not text_fields:
+        return
+
+    pending = text_fields
+
+    if batch:
+        try:
+            results = batch_fill_text_fields(
+                page,
+                {field_id: value for field_id, _, _, value in text_fields},
+            )
+            pending = [
+                f for f in text_fields
+                if results.get(f[0], {}).get("status") != "filled"
+            ]
+            for field_id, _, _, value in text_fields:
+                if results.get(field_id, {}).get("status") == "filled":
+                    logger.info(f"Filled '{field_id}' via batch fill with value: {value[:50]}")
+        except Exception as e:
+            logger.warning(f"Batch fill failed, filling fields one by one: {e}")
+
+    for field_id, label_text, id_selector, value in pending:
+        try:
+            _fill_greenhouse_text_field(
+                page, field_id, label_text, id_selector, value, strategy_cache, board
+            )
+        except Exception as e:
+            logger.warning(f"Error filling field {field_id}: {e}")
+
+
+def _fill_greenhouse_text_field(
+    page,
+    field_id: str,
+    label_text: str,
+    id_selector: str,
+    value: str,
+    strategy_cache: Optional[SelectorStrategyCache] = None,
+    board: Optional[str] = None,
+) -> bool:
     """
     Fill a Greenhouse text field using label-based selector with ID fallback.
     
     Strategy:
     1. Primary: Direct ID selector (#first_name, #last_name, etc.) - most reliable
     2. Fallback: Label-based selector (page.get_by_label) - uses label[for] connection
+
+    With a strategy_cache, the strategy that last worked for this board and
+    field is tried first; if it fails it is forgotten and the others are
+    tried in the default order.
     
     Returns True if field was filled, False otherwise.
     """
-    # Strategy 1: Direct ID selector (primary - Greenhouse uses standard IDs)
+    order = list(_TEXT_FILL_STRATEGIES)
+    if strategy_cache is not None:
+        order = strategy_cache.order(board, field_id, order)
+
+    for index, name in enumerate(order):
+        if _TEXT_FILL_STRATEGIES[name](page, field_id, label_text, id_selector, value):
+            if strategy_cache is not None and board is not None:
+                strategy_cache.record_success(board, field_id, name)
+            return True
+        if index == 0 and strategy_cache is not None and board is not None:
+            strategy_cache.record_failure(board, field_id, name)
+    
+    logger.warning(f"Could not fill field '{field_id}' (tried ID '{id_selector}' and label '{label_text}')")
+    return False
+
+
+def _fill_text_by_id(page, field_id: str, label_text: str, id_selector: str, value: str) -> bool:
+    # Direct ID selector (Greenhouse uses standard IDs)
     try:
         locator = page.locator(id_selector)
         # Wait for the element to be visible and ready
@@ -467,8 +789,11 @@ def _fill_greenhouse_text_field(page, field_id: str, label_text: str, id_selecto
                 logger.warning(f"Value mismatch for '{field_id}': expected '{value[:50]}', got '{filled_value[:50] if filled_value else 'empty'}'")
     except Exception as e:
         logger.debug(f"ID selector failed for '{field_id}': {e}")
-    
-    # Strategy 2: Label-based selector (fallback - uses label[for] connection)
+    return False
+
+
+def _fill_text_by_label(page, field_id: str, label_text: str, id_selector: str, value: str) -> bool:
+    # Label-based selector (uses label[for] connection)
     try:
         locator = page.get_by_label(label_text, exact=False)
         if locator.count() > 0:
@@ -482,11 +807,21 @@ def _fill_greenhouse_text_field(page, field_id: str, label_text: str, id_selecto
                 return True
     except Exception as e:
         logger.debug(f"Label-based selector failed for '{field_id}': {e}")
-    
-    logger.warning(f"Could not fill field '{field_id}' (tried ID '{id_selector}' and label '{label_text}')")
     return False
 
 
+# Default order matters: ID first, label as fallback
+_TEXT_FILL_STRATEGIES = {
+    "id": _fill_text_by_id,
+    "label": _fill_text_by_label,
+}
+
+
+# Options render within a frame or two of typing; if none show up, waiting
+# longer than the sleep this replaced only slows the job down
+_COUNTRY_LISTBOX_TIMEOUT_MS = 500
+
+
 def _fill_greenhouse_country_field(page, country_value: str):
     """
     Fill Greenhouse country dropdown field.
@@ -507,8 +842,15 @@ def _fill_greenhouse_country_field(page, country_value: str):
             country_input.first.click()
             # Type the country name
             country_input.first.fill(country_value)
-            # Wait a bit for dropdown to appear
-            page.wait_for_timeout(500)
+            # Wait for the dropdown options to render (not a fixed delay)
+            try:
+                with wait_timings.measure("fill_form.country_listbox"):
+                    page.wait_for_selector(
+                        '[role="listbox"] [role="option"], [role="option"]',
+                        timeout=_COUNTRY_LISTBOX_TIMEOUT_MS,
+                    )
+            except Exception:
+                logger.debug("Country listbox did not appear")
             # Try to select the first matching option
             # The dropdown items have role="option"
             option = page.locator(f'[role="option"]:has-text("{country_value}")').first
@@ -529,7 +871,13 @@ def _fill_greenhouse_country_field(page, country_value: str):
         return False
 
 
-def _fill_greenhouse_file_field(page, file_path: str):
+def _fill_greenhouse_file_field(
+    page,
+    file_path: str,
+    strategy_cache: Optional[SelectorStrategyCache] = None,
+    board: Optional[str] = None,
+    field_id: str = "resume",
+):
     """
     Fill Greenhouse resume file upload field.
     
@@ -561,26 +909,39 @@ def _fill_greenhouse_file_field(page, file_path: str):
         logger.error(f"Resume path is not a file: {normalized_path}")
         return False
     
-    try:
-        # Strategy 1: Try specific resume input by ID (Greenhouse standard)
-        file_input = page.locator("input#resume[type='file']")
-        if file_input.count() > 0:
-            file_input.first.set_input_files(normalized_path)
-            logger.info(f"Resume uploaded successfully via #resume: {normalized_path}")
-            return True
-        
-        # Strategy 2: Fallback to any file input
-        file_input = page.locator("input[type='file']")
-        if file_input.count() > 0:
-            file_input.first.set_input_files(normalized_path)
-            logger.info(f"Resume uploaded successfully via input[type='file']: {normalized_path}")
-            return True
-        else:
-            logger.warning("No file input found on page (tried #resume and input[type='file'])")
-            return False
-    except Exception as e:
-        logger.warning(f"Resume upload failed: {e}")
-        return False
+    # Strategy 1: the field's own file input by ID (Greenhouse standard)
+    # Strategy 2: fallback to any file input - resume only, other upload
+    # fields must never land in the resume input
+    selectors = _file_input_selectors(field_id)
+    order = list(selectors)
+    if strategy_cache is not None:
+        order = strategy_cache.order(board, field_id, order)
+
+    for index, name in enumerate(order):
+        selector = selectors[name]
+        try:
+            file_input = page.locator(selector)
+            if file_input.count() > 0:
+                file_input.first.set_input_files(normalized_path)
+                logger.info(f"Resume uploaded successfully via {selector}: {normalized_path}")
+                if strategy_cache is not None and board is not None:
+                    strategy_cache.record_success(board, field_id, name)
+                return True
+        except Exception as e:
+            logger.warning(f"Resume upload via {selector} failed: {e}")
+
+        if index == 0 and strategy_cache is not None and board is not None:
+            strategy_cache.record_failure(board, field_id, name)
+
+    logger.warning(f"No file input found on page (tried {', '.join(selectors.values())})")
+    return False
+
+
+def _file_input_selectors(field_id: str) -> dict:
+    selectors = {"id": f"input#{field_id}[type='file']"}
+    if field_id == "resume":
+        selectors["any_file"] = "input[type='file']"
+    return selectors
 
 
 
@@ -656,8 +1017,12 @@ def submit_success_node(state: GraphState) -> GraphState:
             state.result_store.record_success(
                 job.company,
                 job.title,
+                application_url=job.application_url,
             )
 
+        if state.job_queue is not None:
+            state.job_queue.mark_done(job)
+
     state.current_job = None
     state.current_optimized_cv = None
     return state
@@ -681,8 +1046,12 @@ def submit_failed_node(state: GraphState) -> GraphState:
                 job.company,
                 job.title,
                 "Submission failed",
+                application_url=job.application_url,
             )
 
+        if state.job_queue is not None:
+            state.job_queue.mark_done(job)
+
     state.current_job = None
     state.current_optimized_cv = None
     return state
@@ -0,0 +1,270 @@
+import asyncio
+import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Optional
+
+from graph.state import GraphState
+from graph.runner import RunReport, state_for_job, drain_queue, order_by_history, preflight_jobs
+from graph import workflow
+
+logger = logging.getLogger(__name__)
+
+_DONE = object()
+
+# Node runs per stage before giving up (LangGraph's default recursion limit)
+_MAX_STAGE_STEPS = 25
+
+
+class _PipelineItem:
+    def __init__(self, state: GraphState, job, lane: Optional[int] = None):
+        self.state = state
+        self.job = job
+        self.lane = lane
+
+
+class PipelineRunner:
+    """
+    Staged job pipeline with bounded queues between stages:
+
+        pre-flight -> intake -> OPTIMIZE -> page load + schema -> map + fill + submit
+
+    The LLM stage and the browser stages run at the same time, so while one
+    job is being filled the next ones are already being optimized. Queues
+    hold at most queue_size jobs, so a fast stage blocks instead of flooding
+    a slow one, and a batch's wall-clock time approaches that of the slowest
+    stage.
+
+    Browser work runs on "lanes": one single-thread executor per browser
+    worker. A job's page load and fill run on the same lane, because sync
+    Playwright objects are bound to the thread that created them.
+
+    The stages run the nodes of graph.workflow and follow its edges and
+    routing decisions (workflow.next_node), each stage stopping at the
+    node the next stage starts from.
+    """
+
+    def __init__(
+        self,
+        optimize_workers: int = 4,
+        browser_workers: int = 1,
+        queue_size: int = 4,
+    ):
+        if optimize_workers < 1 or browser_workers < 1 or queue_size < 1:
+            raise ValueError("worker counts and queue_size must be >= 1")
+
+        self.optimize_workers = optimize_workers
+        self.browser_workers = browser_workers
+        self.queue_size = queue_size
+
+        self._busy: Dict[str, float] = {}
+        self._busy_lock = threading.Lock()
+
+    def run(self, base_state: GraphState) -> RunReport:
+        return asyncio.run(self.run_async(base_state))
+
+    async def run_async(self, base_state: GraphState) -> RunReport:
+        jobs = order_by_history(base_state, drain_queue(base_state.job_queue))
+        jobs = await asyncio.get_running_loop().run_in_executor(
+            None, preflight_jobs, base_state, jobs
+        )
+        report = RunReport(
+            jobs_total=len(jobs),
+            max_concurrency=self.optimize_workers + self.browser_workers,
+        )
+        self._busy = {}
+
+        logger.info(
+            "Pipeline started | jobs=%d | optimize_workers=%d | browser_workers=%d | queue_size=%d",
+            len(jobs),
+            self.optimize_workers,
+            self.browser_workers,
+            self.queue_size,
+        )
+
+        lanes = [
+            ThreadPoolExecutor(max_workers=1, thread_name_prefix=f"browser-lane-{i}")
+            for i in range(self.browser_workers)
+        ]
+
+        to_optimize: asyncio.Queue = asyncio.Queue(maxsize=self.queue_size)
+        to_load: asyncio.Queue = asyncio.Queue(maxsize=self.queue_size)
+        to_fill: asyncio.Queue = asyncio.Queue(maxsize=self.queue_size)
+
+        counters = {"completed": 0, "errored": 0}
+        started = time.monotonic()
+
+        def finish(item: _PipelineItem, outcome: str):
+            counters[outcome] += 1
+            # Per-job states hold their own queue - acknowledge on the shared one
+            if base_state.job_queue is not None:
+                base_state.job_queue.mark_done(item.job)
+
+        async def intake():
+            for job in jobs:
+                await to_optimize.put(_PipelineItem(state_for_job(base_state, job), job))
+            for _ in range(self.optimize_workers):
+                await to_optimize.put(_DONE)
+
+        async def optimize_worker():
+            while True:
+                item = await to_optimize.get()
+                if item is _DONE:
+                    return
+
+                ok = await self._in_thread(None, "optimize", self._optimize_stage, item.state)
+                if ok is None:
+                    finish(item, "errored")
+                elif ok:
+                    await to_load.put(item)
+                else:
+                    finish(item, "completed")
+
+        async def load_worker(lane: int):
+            while True:
+                item = await to_load.get()
+                if item is _DONE:
+                    return
+
+                item.lane = lane
+                ok = await self._in_thread(lanes[lane], "page_load", self._load_stage, item.state)
+                if ok is None:
+                    finish(item, "errored")
+                    await self._in_thread(lanes[lane], "fill", self._close_executor, item.state)
+                    continue
+                await to_fill.put(item)
+
+        async def fill_worker():
+            while True:
+                item = await to_fill.get()
+                if item is _DONE:
+                    return
+
+                lane = lanes[item.lane]
+                ok = await self._in_thread(lane, "fill", self._fill_stage, item.state)
+                finish(item, "completed" if ok else "errored")
+                await self._in_thread(lane, "fill", self._close_executor, item.state)
+
+        optimizers = [asyncio.create_task(optimize_worker()) for _ in range(self.optimize_workers)]
+        loaders = [asyncio.create_task(load_worker(i)) for i in range(self.browser_workers)]
+        fillers = [asyncio.create_task(fill_worker()) for _ in range(self.browser_workers)]
+
+        await intake()
+        await asyncio.gather(*optimizers)
+        for _ in loaders:
+            await to_load.put(_DONE)
+        await asyncio.gather(*loaders)
+        for _ in fillers:
+            await to_fill.put(_DONE)
+        await asyncio.gather(*fillers)
+
+        if base_state.browser_pool is not None:
+            for lane in lanes:
+                await asyncio.get_running_loop().run_in_executor(
+                    lane, base_state.browser_pool.close_current_thread
+                )
+        for lane in lanes:
+            lane.shutdown(wait=True)
+
+        report.jobs_completed = counters["completed"]
+        report.jobs_errored = counters["errored"]
+        report.elapsed_seconds = time.monotonic() - started
+        if report.elapsed_seconds > 0:
+            report.jobs_per_minute = report.jobs_total / report.elapsed_seconds * 60
+        report.stage_busy_seconds = dict(self._busy)
+
+        logger.info(
+            "Pipeline completed | jobs=%d | completed=%d | errored=%d | elapsed=%.1fs "
+            "| throughput=%.2f jobs/min | stage_busy=%s",
+            report.jobs_total,
+            report.jobs_completed,
+            report.jobs_errored,
+            report.elapsed_seconds,
+            report.jobs_per_minute,
+            {k: round(v, 1) for k, v in report.stage_busy_seconds.items()},
+        )
+
+        return report
+
+    # ---------- stages (run in threads) ----------
+
+    @staticmethod
+    def _optimize_stage(state: GraphState) -> bool:
+        """
+        POP_JOB -> PREFLIGHT -> OPTIMIZE (with retries / OPT_FAILED).
+        Returns True if the job moves on to submission.
+        """
+        return _run_nodes(state, "POP_JOB", {"SUBMIT_START", "POP_JOB", "END"}) == "SUBMIT_START"
+
+    @staticmethod
+    def _load_stage(state: GraphState) -> bool:
+        """
+        SUBMIT_START -> DETECT_ATS -> EXTRACT_SCHEMA
+        """
+        _run_nodes(state, "SUBMIT_START", {"MAP_FIELDS"})
+        return True
+
+    @staticmethod
+    def _fill_stage(state: GraphState) -> bool:
+        """
+        MAP_FIELDS -> FILL_FORM -> VALIDATE_FORM (with retries)
+        -> CONFIRM_SUBMIT -> SUBMIT_SUCCESS / SUBMIT_FAILED
+        """
+        _run_nodes(state, "MAP_FIELDS", {"POP_JOB", "END"})
+        return True
+
+    @staticmethod
+    def _close_executor(state: GraphState) -> None:
+        if state.executor is None:
+            return
+        try:
+            state.executor.close()
+        except Exception as e:
+            logger.warning(f"Error closing executor: {e}")
+        state.executor = None
+
+    # ---------- helpers ----------
+
+    async def _in_thread(self, executor, stage: str, fn, state: GraphState):
+        """
+        Run a stage function off the event loop and account its busy time.
+        Returns the function's result, or None if it raised.
+        """
+        def timed():
+            started = time.monotonic()
+            try:
+                return fn(state)
+            finally:
+                with self._busy_lock:
+                    self._busy[stage] = self._busy.get(stage, 0.0) + time.monotonic() - started
+
+        try:
+            return await asyncio.get_running_loop().run_in_executor(executor, timed)
+        except Exception as e:
+            job = state.current_job
+            logger.error(
+                "Pipeline stage crashed | stage=%s | title=%s | error=%s",
+                stage,
+                job.title if job else None,
+                str(e),
+            )
+            if job is not None and state.result_store is not None:
+                state.result_store.record_failure(
+                    job.company, job.title, e, application_url=job.application_url
+                )
+            return None
+
+
+def _run_nodes(state: GraphState, start: str, stop) -> str:
+    """
+    Run workflow nodes from start, following the graph's edges, until the
+    next node is one of stop. Returns that node's name.
+    """
+    name = start
+    for _ in range(_MAX_STAGE_STEPS):
+        state = workflow.NODES[name](state)
+        name = workflow.next_node(name, state)
+        if name in stop:
+            return name
+    raise RuntimeError(f"Pipeline stage from {start} did not finish within {_MAX_STAGE_STEPS} steps")
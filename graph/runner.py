@@ -0,0 +1,253 @@
+import logging
+import queue
+import threading
+import time
+from typing import Dict, List, Optional, Union
+
+from pydantic import BaseModel, Field
+
+from graph.state import GraphState
+from graph.workflow import build_graph
+from graph.nodes import record_dead_posting
+from models.job import Job
+from models.job_queue import JobQueue
+from models.durable_job_queue import DurableJobQueue, job_key
+from storage.application_index import ApplicationIndex
+
+logger = logging.getLogger(__name__)
+
+
+class RunReport(BaseModel):
+    """
+    Summary of a concurrent run.
+    """
+
+    jobs_total: int = 0
+    jobs_completed: int = 0
+    jobs_errored: int = 0
+    max_concurrency: int = 1
+    elapsed_seconds: float = 0.0
+    jobs_per_minute: float = 0.0
+    # Busy time per pipeline stage (PipelineRunner only)
+    stage_busy_seconds: Dict[str, float] = Field(default_factory=dict)
+
+
+def state_for_job(base_state: GraphState, job: Job) -> GraphState:
+    """
+    Per-job copy of the base state: a single-job queue and cleared
+    per-job fields; shared runtime objects are kept by reference.
+    """
+    return base_state.model_copy(
+        update={
+            "job_queue": JobQueue(jobs=[job]),
+            "current_job": None,
+            "current_optimized_cv": None,
+            "retry_count": 0,
+            "ats_type": None,
+            "executor": None,
+            "form_schema": None,
+            "schema_fingerprint": None,
+            "field_mapping": None,
+            "submission_attempts": 0,
+        }
+    )
+
+
+def drain_queue(job_queue: Optional[Union[JobQueue, DurableJobQueue]]) -> List[Job]:
+    jobs: List[Job] = []
+    if job_queue is None:
+        return jobs
+
+    while not job_queue.is_empty():
+        jobs.append(job_queue.pop_next())
+    return jobs
+
+
+def order_by_history(base_state: GraphState, jobs: List[Job]) -> List[Job]:
+    """
+    Apply the application_index before fanning jobs out: drop postings
+    already submitted in an earlier run and move previously failed ones to
+    the end (marked as deferred so POP_JOB doesn't defer them again).
+    """
+    index = base_state.application_index
+    if index is None:
+        return jobs
+
+    fresh: List[Job] = []
+    failed: List[Job] = []
+
+    for job in jobs:
+        previous = index.lookup(job)
+        if previous == ApplicationIndex.SUBMITTED:
+            logger.info(
+                "Skipping already-applied job | title=%s | company=%s",
+                job.title,
+                job.company,
+            )
+            if base_state.job_queue is not None:
+                base_state.job_queue.mark_done(job)
+        elif previous == ApplicationIndex.FAILED:
+            base_state.deferred_job_keys.add(job_key(job))
+            failed.append(job)
+        else:
+            fresh.append(job)
+
+    return fresh + failed
+
+
+def preflight_jobs(base_state: GraphState, jobs: List[Job]) -> List[Job]:
+    """
+    Check every posting's liveness concurrently and drop the dead ones
+    before any job is fanned out. The per-job PREFLIGHT node then hits
+    the checker's memo.
+    """
+    checker = base_state.liveness_checker
+    if checker is None or not jobs:
+        return jobs
+
+    live, dead = checker.filter_jobs(jobs)
+    for job, result in dead:
+        record_dead_posting(base_state, job, result.reason)
+
+    logger.info("Pre-flight | jobs=%d | live=%d | dropped=%d", len(jobs), len(live), len(dead))
+    return live
+
+
+class ConcurrentJobRunner:
+    """
+    Runs the job workflow for N jobs at once.
+
+    Every job gets its own GraphState (a copy of the base state holding a
+    single-job queue), so nodes never share current_job / executor / form
+    state. Shared runtime objects (cv, optimizer, result_store, ...) are
+    passed through by reference.
+
+    Each job is invoked on a worker thread and stays on that thread for its
+    whole lifetime - the sync Playwright objects created by SUBMIT_START are
+    bound to the thread that created them. If the state carries a
+    browser_pool, every worker closes its own pooled browser on exit.
+    """
+
+    def __init__(self, graph=None, max_concurrency: int = 4):
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency must be >= 1")
+
+        self.graph = graph or build_graph()
+        self.max_concurrency = max_concurrency
+
+    def run(self, base_state: GraphState) -> RunReport:
+        jobs = order_by_history(base_state, drain_queue(base_state.job_queue))
+        jobs = preflight_jobs(base_state, jobs)
+
+        logger.info(
+            "Concurrent run started | jobs=%d | max_concurrency=%d",
+            len(jobs),
+            self.max_concurrency,
+        )
+
+        report = RunReport(
+            jobs_total=len(jobs),
+            max_concurrency=self.max_concurrency,
+        )
+        started = time.monotonic()
+
+        pending: "queue.Queue[Job]" = queue.Queue()
+        for job in jobs:
+            pending.put(job)
+
+        lock = threading.Lock()
+
+        def worker():
+            try:
+                while True:
+                    try:
+                        job = pending.get_nowait()
+                    except queue.Empty:
+                        return
+
+                    ok = self._run_job(base_state, job)
+                    with lock:
+                        if ok:
+                            report.jobs_completed += 1
+                        else:
+                            report.jobs_errored += 1
+            finally:
+                if base_state.browser_pool is not None:
+                    base_state.browser_pool.close_current_thread()
+
+        workers = [
+            threading.Thread(target=worker, name=f"job-worker-{i}")
+            for i in range(min(self.max_concurrency, len(jobs)))
+        ]
+        for thread in workers:
+            thread.start()
+        for thread in workers:
+            thread.join()
+
+        report.elapsed_seconds = time.monotonic() - started
+        if report.elapsed_seconds > 0:
+            report.jobs_per_minute = (
+                report.jobs_total / report.elapsed_seconds * 60
+            )
+
+        logger.info(
+            "Concurrent run completed | jobs=%d | completed=%d | errored=%d "
+            "| elapsed=%.1fs | throughput=%.2f jobs/min",
+            report.jobs_total,
+            report.jobs_completed,
+            report.jobs_errored,
+            report.elapsed_seconds,
+            report.jobs_per_minute,
+        )
+
+        return report
+
+    def _run_job(self, base_state: GraphState, job: Job) -> bool:
+        """
+        Run the full workflow for a single job.
+        Returns True if the graph finished, False if it raised.
+        """
+        state = state_for_job(base_state, job)
+        final_state = None
+
+        try:
+            final_state = self.graph.invoke(state)
+            return True
+
+        except Exception as e:
+            logger.error(
+                "Job run crashed | title=%s | company=%s | error=%s",
+                job.title,
+                job.company,
+                str(e),
+            )
+
+            if base_state.result_store is not None:
+                base_state.result_store.record_failure(
+                    job.company,
+                    job.title,
+                    e,
+                    application_url=job.application_url,
+                )
+            return False
+
+        finally:
+            self._close_executor(final_state, state)
+            # Per-job states hold their own queue - acknowledge on the shared one
+            if base_state.job_queue is not None:
+                base_state.job_queue.mark_done(job)
+
+    @staticmethod
+    def _close_executor(final_state, state: GraphState) -> None:
+        executor = None
+        if final_state is not None:
+            executor = final_state.get("executor")
+        if executor is None:
+            executor = state.executor
+        if executor is None:
+            return
+
+        try:
+            executor.close()
+        except Exception as e:
+            logger.warning(f"Error closing executor: {e}")
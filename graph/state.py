@@ -1,15 +1,24 @@
-from pydantic import BaseModel, ConfigDict
-from typing import Optional, Dict, Any
+from pydantic import BaseModel, ConfigDict, Field
+from typing import Optional, Dict, Any, Set, Union
 
 from models.job_queue import JobQueue
+from models.durable_job_queue import DurableJobQueue
 from execution.greenhouse.greenhouse_executor import GreenhouseExecutor
+from execution.greenhouse.browser_pool import BrowserPool, PooledGreenhouseExecutor
 from models.job import Job
 from models.cv import CV
 from models.optimized_cv import OptimizedCV
 from user.profile import UserProfile
 from agents.cv_optimization_agent import CVOptimizationAgent
+from agents.retry_policy import RetryPolicy
 from storage.result_store import ResultStore
 from models.submission.form_schema import SubmissionFormSchema
+from storage.schema_cache import SchemaCache
+from execution.greenhouse.board_api import GreenhouseBoardApi
+from execution.greenhouse.liveness import PostingLivenessChecker
+from storage.selector_strategy_cache import SelectorStrategyCache
+from storage.application_index import ApplicationIndex
+from storage.job_similarity_index import JobSimilarityIndex
 
 
 class GraphState(BaseModel):
@@ -19,8 +28,14 @@ class GraphState(BaseModel):
     """
 
     # ===== Job flow =====
-    job_queue: Optional[JobQueue] = None
+    job_queue: Optional[Union[JobQueue, DurableJobQueue]] = None
     current_job: Optional[Job] = None
+    # Cross-run index of past applications; used by POP_JOB to skip duplicates
+    application_index: Optional[ApplicationIndex] = None
+    deferred_job_keys: Set[str] = Field(default_factory=set)
+    # HTTP pre-flight; closed or removed postings are dropped before any
+    # LLM or browser work
+    liveness_checker: Optional[PostingLivenessChecker] = None
 
     # ===== User data =====
     user_profile: Optional[UserProfile] = None
@@ -31,13 +46,31 @@ class GraphState(BaseModel):
     optimizer: Optional[CVOptimizationAgent] = None
     retry_count: int = 0
     max_retries: int = 3
+    # Run-wide retry policy; also handed to the optimizer so retries are
+    # never nested and share one budget
+    retry_policy: Optional[RetryPolicy] = None
+    # Near-duplicate postings reuse an already optimized CV
+    job_similarity_index: Optional[JobSimilarityIndex] = None
 
     # ===== Submission =====
     ats_type: Optional[str] = None
-    executor: Optional[GreenhouseExecutor] = None
+    executor: Optional[Union[GreenhouseExecutor, PooledGreenhouseExecutor]] = None
+    # Shared browsers for the run; when set, executors borrow contexts from it
+    browser_pool: Optional[BrowserPool] = None
     form_schema: Optional[SubmissionFormSchema] = None
+    # Extracted schemas keyed by board/job id, validated by DOM fingerprint
+    schema_cache: Optional[SchemaCache] = None
+    # Greenhouse board API client; when set, schemas are fetched over HTTP
+    # and the browser is only opened for the fill
+    board_api: Optional[GreenhouseBoardApi] = None
+    # Fingerprint of a schema served from schema_cache, checked by FILL_FORM
+    schema_fingerprint: Optional[str] = None
+    # Locator strategy that last worked per board/field
+    selector_strategy_cache: Optional[SelectorStrategyCache] = None
     # field_mapping is a dict mapping field_id -> value (not FieldMappingResult model)
     field_mapping: Optional[Dict[str, Any]] = None
+    # Fill all text fields in one injected script instead of per-field calls
+    batch_fill: bool = True
 
     submission_attempts: int = 0
     max_submission_attempts: int = 2
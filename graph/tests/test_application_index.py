@@ -0,0 +1,66 @@
+from graph.nodes import pop_job_node
+from graph.state import GraphState
+from models.job import Job
+from models.job_queue import JobQueue
+from storage.application_index import ApplicationIndex, normalize_application_url
+
+
+def _job(i: int, url: str = None) -> Job:
+    return Job(
+        id=f"job-{i}",
+        title=f"Job {i}",
+        company="Test Co",
+        application_url=url or f"https://job-boards.greenhouse.io/test/jobs/{i}",
+    )
+
+
+def test_normalize_application_url():
+    assert (
+        normalize_application_url("https://boards.greenhouse.io/Test/jobs/123?gh_src=abc")
+        == normalize_application_url("https://job-boards.greenhouse.io/test/jobs/123")
+    )
+    assert (
+        normalize_application_url("https://www.example.com/jobs/1/?utm_source=x&b=2")
+        == "example.com/jobs/1?b=2"
+    )
+
+
+def test_submitted_is_never_downgraded(tmp_path):
+    index = ApplicationIndex(str(tmp_path / "apps.sqlite"))
+    index.record("Test Co", "Job 0", "submitted", _job(0).application_url)
+    index.record("Test Co", "Job 0", "failed", _job(0).application_url)
+
+    assert index.lookup(_job(0)) == ApplicationIndex.SUBMITTED
+    assert index.lookup(_job(1)) is None
+
+
+def test_title_match_under_another_url_is_not_a_duplicate(tmp_path):
+    index = ApplicationIndex(str(tmp_path / "apps.sqlite"))
+    index.record("Test Co", "Job 0", "submitted", _job(0).application_url)
+
+    # Multi-location repost: same company and title, different posting
+    repost = _job(0, url="https://job-boards.greenhouse.io/test/jobs/999")
+    assert index.lookup(repost) is None
+
+    without_url = Job(id="job-0", title="Job 0", company="Test Co")
+    assert index.lookup(without_url) == ApplicationIndex.SUBMITTED
+
+
+def test_pop_job_skips_submitted_and_defers_failed(tmp_path):
+    index = ApplicationIndex(str(tmp_path / "apps.sqlite"))
+    index.record("Test Co", "Job 0", "submitted", _job(0).application_url)
+    index.record("Test Co", "Job 1", "failed", _job(1).application_url)
+
+    state = GraphState(
+        job_queue=JobQueue(jobs=[_job(0), _job(1), _job(2)]),
+        application_index=index,
+    )
+
+    state = pop_job_node(state)
+    assert state.current_job.id == "job-2"
+
+    state = pop_job_node(state)
+    assert state.current_job.id == "job-1"
+
+    state = pop_job_node(state)
+    assert state.current_job is None
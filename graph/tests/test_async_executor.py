@@ -0,0 +1,85 @@
+import asyncio
+import time
+
+from execution.greenhouse.async_executor import run_with_tab_limits
+
+
+def test_slow_tab_times_out_without_stalling_others():
+    in_flight = []
+    peak = []
+
+    async def worker(url):
+        in_flight.append(url)
+        peak.append(len(in_flight))
+        try:
+            await asyncio.sleep(10 if url == "slow" else 0.05)
+            if url == "broken":
+                raise RuntimeError("no form")
+            return url.upper()
+        finally:
+            in_flight.remove(url)
+
+    urls = ["slow", "a", "b", "broken", "c", "d"]
+    started = time.perf_counter()
+    results = asyncio.run(run_with_tab_limits(urls, worker, max_tabs=3, tab_timeout=0.5))
+
+    assert time.perf_counter() - started < 2
+    assert max(peak) == 3
+    assert [r.job_url for r in results] == urls
+    assert results[0].timed_out and not results[0].ok
+    assert results[3].error == "no form"
+    assert [r.value for r in results if r.ok] == ["A", "B", "C", "D"]
+
+
+def test_concurrent_tabs_launch_one_browser(monkeypatch):
+    from execution.greenhouse import async_executor
+
+    launches = []
+
+    class _FakeBrowser:
+        async def new_context(self):
+            return object()
+
+    class _FakePlaywright:
+        def __init__(self):
+            self.chromium = self
+
+        async def start(self):
+            return self
+
+        async def launch(self, headless=True):
+            launches.append(headless)
+            await asyncio.sleep(0.01)
+            return _FakeBrowser()
+
+    monkeypatch.setattr(async_executor, "async_playwright", _FakePlaywright)
+
+    browser = async_executor.AsyncGreenhouseBrowser(block_resources=False)
+
+    async def open_many():
+        return await asyncio.gather(*(browser.new_context() for _ in range(5)))
+
+    assert len(asyncio.run(open_many())) == 5
+    assert len(launches) == 1
+
+
+def test_open_job_async_skips_reload_after_redirect():
+    from execution.greenhouse.steps.open_job import open_job_async
+
+    class _Element:
+        async def evaluate(self, script, selectors):
+            return selectors[0]
+
+    class _Page:
+        url = "https://job-boards.greenhouse.io/acme/jobs/42?gh_src=abc"
+        gotos = 0
+
+        async def goto(self, url):
+            self.gotos += 1
+
+        async def wait_for_selector(self, selector, timeout=None):
+            return _Element()
+
+    page = _Page()
+    asyncio.run(open_job_async(page, "https://boards.greenhouse.io/acme/jobs/42"))
+    assert page.gotos == 0
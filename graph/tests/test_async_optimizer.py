@@ -0,0 +1,50 @@
+import asyncio
+import json
+from types import SimpleNamespace
+
+from agents.async_cv_optimization_agent import AsyncOpenAICVOptimizationAgent
+from models.cv import CV
+from models.job import Job
+
+
+class _FakeCompletions:
+    def __init__(self):
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def create(self, **params):
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        prompt = params["messages"][-1]["content"]
+        # Later jobs answer faster, so completion order differs from input order
+        await asyncio.sleep(0.05 if "Job 0" in prompt else 0.01)
+        self.in_flight -= 1
+        return SimpleNamespace(
+            choices=[SimpleNamespace(message=SimpleNamespace(content=json.dumps({
+                "tailored_summary": "summary",
+                "tailored_skills": ["Python"],
+                "tailored_experience": "",
+                "full_text": " tailored ",
+                "cover_letter": "Dear team",
+            })))]
+        )
+
+
+def test_optimize_many_is_bounded_and_yields_as_completed(monkeypatch):
+    monkeypatch.setenv("OPENAI_API_KEY", "test")
+    completions = _FakeCompletions()
+    client = SimpleNamespace(chat=SimpleNamespace(completions=completions))
+
+    agent = AsyncOpenAICVOptimizationAgent(
+        max_concurrency=3, requests_per_minute=None, async_client=client
+    )
+    cv = CV(full_name="Test", skills=["Python"], location="Remote", summary="Dev")
+    jobs = [Job(id=str(i), title=f"Job {i}", company="Co") for i in range(8)]
+
+    outcomes = agent.optimize_all(cv, jobs)
+
+    assert len(outcomes) == 8
+    assert all(o.optimized_cv.full_text == "tailored" for o in outcomes)
+    assert all(o.optimized_cv.cover_letter == "Dear team" for o in outcomes)
+    assert completions.max_in_flight == 3
+    assert outcomes[0].job.id != "0"
@@ -0,0 +1,35 @@
+import json
+
+from agents.batch_cv_optimization import BatchCVOptimizer, batch_custom_id
+from agents.cv_optimization_agent import OpenAICVOptimizationAgent
+from models.cv import CV
+from models.job import Job
+from scripts.local_batch_runner import run_batch_locally
+from storage.optimization_cache import OptimizationCache
+
+
+def test_batch_round_trip_fills_cache(tmp_path, monkeypatch):
+    monkeypatch.setenv("OPENAI_API_KEY", "test")
+    agent = OpenAICVOptimizationAgent(cache=OptimizationCache(str(tmp_path / "cache.sqlite")))
+    batch = BatchCVOptimizer(agent)
+
+    cv = CV(full_name="Test", skills=["Python"], location="Remote", summary="Dev")
+    jobs = [Job(id=str(i), title=f"Job {i}", company="Co") for i in range(3)]
+
+    requests_path = str(tmp_path / "requests.jsonl")
+    results_path = str(tmp_path / "results.jsonl")
+
+    assert batch.write_requests(cv, jobs, requests_path) == 3
+    with open(requests_path) as f:
+        assert [json.loads(line)["custom_id"] for line in f] == ["job-0", "job-1", "job-2"]
+
+    run_batch_locally(requests_path, results_path, fail_ids={batch_custom_id(jobs[2])})
+    optimized = batch.ingest_results(cv, results_path, requests_path)
+
+    assert set(optimized) == {"job-0", "job-1"}
+    assert optimized["job-0"].job.title == "Job 0"
+    assert optimized["job-0"].cover_letter == "Dear hiring team,"
+
+    # Ingested results are served from the cache; only the failed job is pending
+    assert agent.optimize(cv, jobs[1]).full_text.startswith("OPTIMIZED CV")
+    assert batch.write_requests(cv, jobs, requests_path) == 1
@@ -0,0 +1,240 @@
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from execution.greenhouse.board_api import GreenhouseBoardApi
+from graph.nodes_submission import extract_schema_node
+from graph.state import GraphState
+from models.job import Job
+from models.submission.form_field_type import FormFieldType
+
+JOB = {
+    "id": 123,
+    "title": "Engineer",
+    "questions": [
+        {"label": "First Name", "required": True, "fields": [{"name": "first_name", "type": "input_text"}]},
+        {"label": "Email", "required": True, "fields": [{"name": "email", "type": "input_text"}]},
+        {
+            "label": "Resume/CV",
+            "required": True,
+            "fields": [{"name": "resume", "type": "input_file"}, {"name": "resume_text", "type": "textarea"}],
+        },
+        {"label": "LinkedIn Profile", "required": False, "fields": [{"name": "question_1", "type": "input_text"}]},
+        {
+            "label": "Cover Letter",
+            "required": False,
+            "fields": [
+                {"name": "cover_letter", "type": "input_file"},
+                {"name": "cover_letter_text", "type": "textarea"},
+            ],
+        },
+        {"label": "Hidden", "required": False, "fields": [{"name": "token", "type": "input_hidden"}]},
+    ],
+}
+
+
+@pytest.fixture
+def board_server():
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            path = self.path.split("?")[0]
+            if path == "/v1/boards/acme/jobs":
+                payload = {"jobs": [
+                    {"id": 123, "absolute_url": "https://careers.acme.com/jobs?gh_jid=123"},
+                    {"id": 456},
+                ]}
+            elif path == "/v1/boards/acme/jobs/123":
+                payload = JOB
+            else:
+                self.send_error(404)
+                return
+            data = json.dumps(payload).encode("utf-8")
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(data)))
+            self.end_headers()
+            self.wfile.write(data)
+
+        def log_message(self, format, *args):
+            pass
+
+    httpd = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    threading.Thread(target=httpd.serve_forever, daemon=True).start()
+    yield f"http://127.0.0.1:{httpd.server_address[1]}/v1"
+    httpd.shutdown()
+    httpd.server_close()
+
+
+def test_fetch_schema_converts_questions(board_server):
+    api = GreenhouseBoardApi(base_url=board_server)
+    schema = api.fetch_schema("https://job-boards.greenhouse.io/acme/jobs/123")
+    api.close()
+
+    by_id = {f.field_id: f for f in schema.fields}
+    assert list(by_id) == ["first_name", "email", "resume", "question_1", "cover_letter_text"]
+    assert by_id["cover_letter_text"].type == FormFieldType.TEXTAREA
+    assert by_id["email"].type == FormFieldType.EMAIL
+    assert by_id["resume"].type == FormFieldType.FILE
+    assert by_id["resume"].required and not by_id["question_1"].required
+    assert by_id["question_1"].label == "LinkedIn Profile"
+
+
+def test_fetch_board_schemas_skips_failed_jobs(board_server):
+    api = GreenhouseBoardApi(base_url=board_server)
+    schemas = api.fetch_board_schemas("acme")
+    assert api.stats() == {"requests": 3, "failures": 1}
+
+    assert list(schemas) == ["123"]
+    assert schemas["123"].form_url == "https://careers.acme.com/jobs?gh_jid=123"
+    assert api.list_jobs("acme")["456"] == "https://job-boards.greenhouse.io/acme/jobs/456"
+    api.close()
+
+
+def test_extract_schema_node_uses_api_without_browser(board_server):
+    api = GreenhouseBoardApi(base_url=board_server)
+    state = GraphState(
+        current_job=Job(
+            title="Engineer",
+            company="Acme",
+            application_url="https://job-boards.greenhouse.io/acme/jobs/123",
+        ),
+        ats_type="greenhouse",
+        board_api=api,
+    )
+
+    state = extract_schema_node(state)
+    api.close()
+
+    assert state.executor is None
+    hints = {f.field_id: f.mapping_hint for f in state.form_schema.fields}
+    assert hints["resume"] == "cv.resume_path"
+    assert hints["question_1"] == "user_profile.linkedin"
+    assert hints["cover_letter_text"] == "optimized_cv.cover_letter"
+
+
+def test_api_schema_goes_through_schema_cache(board_server, tmp_path):
+    from storage.schema_cache import SchemaCache
+
+    api = GreenhouseBoardApi(base_url=board_server)
+    cache = SchemaCache(str(tmp_path / "schemas.sqlite"))
+
+    def state():
+        return GraphState(
+            current_job=Job(
+                title="Engineer",
+                company="Acme",
+                application_url="https://job-boards.greenhouse.io/acme/jobs/123",
+            ),
+            ats_type="greenhouse",
+            board_api=api,
+            schema_cache=cache,
+        )
+
+    first = extract_schema_node(state())
+    assert first.schema_fingerprint == "board_api"
+    assert api.stats()["requests"] == 1
+
+    # Second run is served from the cache, flagged for the field id check
+    second = extract_schema_node(state())
+    assert api.stats()["requests"] == 1
+    assert second.schema_fingerprint == "board_api"
+    assert second.form_schema.fields == first.form_schema.fields
+    api.close()
+    cache.close()
+
+
+def test_cover_letter_upload_field_is_filled_as_text():
+    from graph.nodes_submission import _fill_greenhouse_fields_with_schema
+    from models.submission.form_field import FormField
+    from models.submission.form_schema import SubmissionFormSchema
+
+    class _Page:
+        def __init__(self):
+            self.values = None
+
+        def evaluate(self, script, values):
+            self.values = values
+            return {k: {"status": "filled", "actual": v} for k, v in values.items()}
+
+    schema = SubmissionFormSchema(
+        ats_type="greenhouse",
+        form_url="https://job-boards.greenhouse.io/acme/jobs/123",
+        fields=[
+            FormField(
+                field_id="cover_letter",
+                label="Cover Letter",
+                type=FormFieldType.FILE,
+                required=False,
+                mapping_hint="optimized_cv.cover_letter",
+            )
+        ],
+    )
+    page = _Page()
+    _fill_greenhouse_fields_with_schema(page, schema, {"cover_letter": "Dear Acme, ..."})
+
+    assert page.values == {"cover_letter_text": "Dear Acme, ..."}
+
+
+class _SignaturePage:
+    def __init__(self, ids):
+        self.ids = ids
+        self.url = "https://job-boards.greenhouse.io/acme/jobs/123"
+        self.scripts = []
+
+    def evaluate(self, script):
+        self.scripts.append(script)
+        return [{"id": i, "tag": "INPUT", "type": "text", "label": i} for i in self.ids]
+
+
+def test_api_schema_is_trusted_when_filled_ids_exist(board_server, tmp_path):
+    from execution.greenhouse.steps.extract_schema import _BULK_EXTRACT_JS
+    from graph.nodes_submission import _validate_cached_schema
+    from storage.schema_cache import SchemaCache
+
+    api = GreenhouseBoardApi(base_url=board_server)
+    cache = SchemaCache(str(tmp_path / "schemas.sqlite"))
+    state = GraphState(
+        current_job=Job(
+            title="Engineer",
+            company="Acme",
+            application_url="https://job-boards.greenhouse.io/acme/jobs/123",
+        ),
+        ats_type="greenhouse",
+        board_api=api,
+        schema_cache=cache,
+    )
+    state = extract_schema_node(state)
+    state.field_mapping = {"first_name": "Test", "email": "t@example.com", "question_1": None}
+
+    page = _SignaturePage(["first_name", "email", "resume"])
+    _validate_cached_schema(state, page)
+
+    assert _BULK_EXTRACT_JS not in page.scripts
+    assert cache.stats()["invalidations"] == 0
+    assert cache.peek("acme", "123")[0] == "board_api"
+    api.close()
+    cache.close()
+
+
+def test_warm_schema_cache_fetches_pending_jobs_per_board(board_server, tmp_path):
+    from storage.schema_cache import SchemaCache
+
+    api = GreenhouseBoardApi(base_url=board_server)
+    cache = SchemaCache(str(tmp_path / "schemas.sqlite"))
+    urls = [
+        "https://job-boards.greenhouse.io/acme/jobs/123",
+        "https://job-boards.greenhouse.io/acme/jobs/999",  # closed, not listed
+        "https://example.com/not-greenhouse",
+    ]
+
+    assert api.warm_schema_cache(cache, urls) == 1
+    assert api.stats()["requests"] == 2  # one listing + one job
+    assert cache.job_ids("acme") == {"123"}
+
+    # Already cached jobs are not fetched again
+    assert api.warm_schema_cache(cache, urls) == 0
+    assert api.stats()["requests"] == 3
+    api.close()
+    cache.close()
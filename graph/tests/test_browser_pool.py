@@ -0,0 +1,107 @@
+import threading
+
+from types import SimpleNamespace
+
+from execution.greenhouse.browser_pool import BrowserPool, _BrowserSlot, _driver_pid
+
+
+class _FakeBrowser:
+    def new_context(self):
+        return object()
+
+    def close(self):
+        pass
+
+
+class _FakePlaywright:
+    def __init__(self):
+        self.chromium = self
+
+    def launch(self, headless=True):
+        return _FakeBrowser()
+
+    def stop(self):
+        pass
+
+
+class _StubMemoryPool(BrowserPool):
+    """
+    Pool with fake browsers and a stubbed per-slot memory probe.
+    """
+
+    def __init__(self, memory_by_driver, **kwargs):
+        super().__init__(block_resources=False, **kwargs)
+        self.memory_by_driver = memory_by_driver
+        self._next_driver = 0
+        self.terminated = []
+
+    def _launch(self):
+        self._next_driver += 1
+        return _BrowserSlot(_FakePlaywright(), _FakeBrowser(), driver_pid=self._next_driver)
+
+    def _terminate(self, slot):
+        self.terminated.append(slot.driver_pid)
+
+    def _browser_memory_mb(self, slot):
+        # A relaunched browser starts small again
+        if slot.recycles:
+            return 100
+        return self.memory_by_driver.get(slot.driver_pid)
+
+
+def _acquire_in_thread(pool):
+    done = threading.Event()
+
+    def run():
+        pool.release_context(pool.acquire_context())
+        pool.release_context(pool.acquire_context())
+        done.set()
+
+    thread = threading.Thread(target=run)
+    thread.start()
+    thread.join()
+    assert done.is_set()
+
+
+def test_memory_ceiling_is_per_browser():
+    # Together the two browsers exceed the ceiling; neither does alone
+    pool = _StubMemoryPool({1: 1500, 2: 1500}, max_memory_mb=2048)
+    _acquire_in_thread(pool)
+    _acquire_in_thread(pool)
+    assert pool.recycles == 0
+
+
+def test_browser_over_ceiling_is_recycled():
+    pool = _StubMemoryPool({1: 3000}, max_memory_mb=2048)
+    _acquire_in_thread(pool)
+    assert pool.recycles == 1
+
+
+def test_close_terminates_browsers_of_other_threads():
+    pool = _StubMemoryPool({}, max_memory_mb=2048)
+    # Both workers alive at once, so their thread idents (slot keys) differ
+    barrier = threading.Barrier(2)
+
+    def worker():
+        pool.release_context(pool.acquire_context())
+        barrier.wait()
+
+    threads = [threading.Thread(target=worker) for _ in range(2)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    pool.close()
+
+    assert sorted(pool.terminated) == [1, 2]
+    assert pool._slots == {}
+
+
+def test_driver_pid_comes_from_the_launched_process():
+    proc = SimpleNamespace(pid=4321)
+    playwright = SimpleNamespace(
+        _impl_obj=SimpleNamespace(_connection=SimpleNamespace(_transport=SimpleNamespace(_proc=proc)))
+    )
+    assert _driver_pid(playwright) == 4321
+    assert _driver_pid(object()) is None
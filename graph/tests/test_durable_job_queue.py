@@ -0,0 +1,59 @@
+from models.durable_job_queue import DurableJobQueue
+from models.job import Job
+
+
+def _job(i: int) -> Job:
+    return Job(
+        id=f"job-{i}",
+        title=f"Job {i}",
+        company="Test Co",
+        application_url=f"https://job-boards.greenhouse.io/test/jobs/{i}",
+    )
+
+
+def test_fifo_order(tmp_path):
+    queue = DurableJobQueue(str(tmp_path / "jobs.sqlite"))
+    for i in range(3):
+        queue.add(_job(i))
+
+    assert [queue.pop_next().id for _ in range(3)] == ["job-0", "job-1", "job-2"]
+    assert queue.is_empty()
+
+
+def test_resume_after_crash(tmp_path):
+    path = str(tmp_path / "jobs.sqlite")
+
+    queue = DurableJobQueue(path)
+    for i in range(3):
+        queue.add(_job(i))
+
+    done = queue.pop_next()
+    queue.mark_done(done)
+    queue.pop_next()  # in flight when the "crash" happens
+    queue.close()
+
+    resumed = DurableJobQueue(path)
+    assert [resumed.pop_next().id for _ in range(2)] == ["job-1", "job-2"]
+    assert resumed.is_empty()
+
+
+def test_add_is_idempotent_across_runs(tmp_path):
+    path = str(tmp_path / "jobs.sqlite")
+
+    queue = DurableJobQueue(path)
+    queue.add(_job(0))
+    queue.mark_done(queue.pop_next())
+    queue.close()
+
+    rerun = DurableJobQueue(path)
+    rerun.add(_job(0))
+    assert rerun.is_empty()
+
+
+def test_expired_lease_is_reclaimed(tmp_path):
+    queue = DurableJobQueue(str(tmp_path / "jobs.sqlite"), lease_seconds=-1)
+    queue.add(_job(0))
+
+    queue.pop_next()
+    assert not queue.is_empty()
+    assert queue.pop_next().id == "job-0"
@@ -0,0 +1,62 @@
+import openai
+import pytest
+
+from agents.cv_optimization_agent import OpenAICVOptimizationAgent
+from agents.retry_policy import RetryPolicy
+from models.cv import CV
+from models.job import Job
+from scripts.fake_openai_server import FakeOpenAIServer
+
+
+@pytest.fixture
+def cv_and_job(monkeypatch):
+    monkeypatch.setenv("OPENAI_API_KEY", "test")
+    return (
+        CV(full_name="Test", skills=["Python"], summary="Dev"),
+        Job(id="1", title="Engineer", company="Co", description="Write Python."),
+    )
+
+
+def test_real_client_against_fake_server(cv_and_job):
+    cv, job = cv_and_job
+    server = FakeOpenAIServer(latency="fixed:0").start()
+    try:
+        agent = OpenAICVOptimizationAgent(base_url=server.base_url)
+        optimized = agent.optimize(cv, job)
+
+        assert optimized.full_text == "Fake full text"
+        assert optimized.cover_letter == "Fake cover letter"
+        assert server.stats["prompt_tokens"] > 0
+    finally:
+        server.stop()
+
+
+def test_server_errors_are_retried_by_policy(cv_and_job):
+    cv, job = cv_and_job
+    server = FakeOpenAIServer(latency="fixed:0", error_rate=1.0).start()
+    try:
+        agent = OpenAICVOptimizationAgent(
+            base_url=server.base_url,
+            retry_policy=RetryPolicy(max_attempts=3, sleep=lambda _: None),
+        )
+        with pytest.raises(openai.InternalServerError):
+            agent.optimize(cv, job)
+
+        assert server.stats["requests"] == 3
+    finally:
+        server.stop()
+
+
+def test_configured_token_counts_replace_estimates(cv_and_job):
+    cv, job = cv_and_job
+    server = FakeOpenAIServer(
+        latency="fixed:0", prompt_tokens="1200", completion_tokens="uniform:300,400"
+    ).start()
+    try:
+        agent = OpenAICVOptimizationAgent(base_url=server.base_url)
+        agent.optimize(cv, job)
+
+        assert server.stats["prompt_tokens"] == 1200
+        assert 300 <= server.stats["completion_tokens"] <= 400
+    finally:
+        server.stop()
@@ -0,0 +1,49 @@
+from models.cv import CV
+from models.job import Job
+from models.optimized_cv import OptimizedCV
+from storage.job_similarity_index import JobSimilarityIndex
+
+DESCRIPTION = " ".join(
+    f"Responsibility {i}: design, build and operate backend services in Python." for i in range(12)
+)
+
+
+def _job(i, company="Acme", location="Berlin", description=DESCRIPTION):
+    return Job(id=str(i), title="Backend Engineer", company=company,
+               location=location, description=description)
+
+
+def test_reposts_reuse_optimized_cv_within_company():
+    index = JobSimilarityIndex()
+    original = _job(1)
+    cv = CV(full_name="Test")
+    index.add(original, OptimizedCV(original_cv=cv, job=original, full_text="tailored"))
+
+    repost = _job(2, location="London", description=DESCRIPTION + " Hybrid in London.")
+    reused = index.find(repost)
+    assert reused.full_text == "tailored"
+    assert reused.job.id == "2"
+
+    assert index.find(_job(3, company="Globex")) is None
+    unrelated = " ".join(f"Sell enterprise software deal {i} to new customers." for i in range(12))
+    assert index.find(_job(4, description=unrelated)) is None
+
+    assert index.stats()["reuses"] == 1
+    assert [j.id for j in index.unique([_job(5), _job(6, location="Paris"), _job(7, company="Globex")])] == ["5", "7"]
+
+
+def test_representatives_indexed_up_front_serve_twins_in_any_order():
+    index = JobSimilarityIndex()
+    cv = CV(full_name="Test")
+    jobs = [_job(1), _job(2, location="Paris"), _job(3, company="Globex")]
+    representatives = index.unique(jobs)
+
+    indexed = index.add_many(
+        (job, OptimizedCV(original_cv=cv, job=job, full_text=f"tailored {job.company}"))
+        for job in representatives
+    )
+
+    assert indexed == 2
+    # The twin is looked up before its representative is ever processed
+    assert index.find(jobs[1]).full_text == "tailored Acme"
+    assert index.find(jobs[1]).job.id == "2"
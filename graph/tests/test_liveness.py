@@ -0,0 +1,69 @@
+import httpx
+
+from execution.greenhouse.liveness import PostingLivenessChecker
+from graph.nodes import preflight_node
+from graph.runner import preflight_jobs
+from graph.state import GraphState
+from models.job import Job
+from models.job_queue import JobQueue
+from storage.result_store import ResultStore
+
+LIVE = "https://job-boards.greenhouse.io/acme/jobs/1"
+CLOSED = "https://job-boards.greenhouse.io/acme/jobs/2"
+REMOVED = "https://job-boards.greenhouse.io/acme/jobs/3"
+NO_HEAD = "https://job-boards.greenhouse.io/acme/jobs/4"
+DOWN = "https://job-boards.greenhouse.io/acme/jobs/5"
+
+
+def _checker():
+    calls = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        url = str(request.url)
+        calls.append((request.method, url))
+        if url == CLOSED:
+            return httpx.Response(302, headers={"location": "https://job-boards.greenhouse.io/acme?error=true"})
+        if url == REMOVED:
+            return httpx.Response(404)
+        if url == NO_HEAD and request.method == "HEAD":
+            return httpx.Response(405)
+        if url == DOWN:
+            raise httpx.ConnectError("refused", request=request)
+        return httpx.Response(200)
+
+    client = httpx.Client(transport=httpx.MockTransport(handler), follow_redirects=True)
+    return PostingLivenessChecker(client=client), calls
+
+
+def test_check_classifies_postings():
+    checker, calls = _checker()
+    results = checker.check_many([LIVE, CLOSED, REMOVED, NO_HEAD, DOWN])
+
+    assert results[LIVE].alive
+    assert not results[CLOSED].alive and results[CLOSED].reason == "redirected_to_board"
+    assert results[CLOSED].redirects == 1
+    assert not results[REMOVED].alive and results[REMOVED].reason == "not_found"
+    assert results[NO_HEAD].alive and ("GET", NO_HEAD) in calls
+    assert results[DOWN].alive and results[DOWN].reason.startswith("unreachable")
+
+    # Memoized - no second request
+    checker.check(LIVE)
+    assert calls.count(("HEAD", LIVE)) == 1
+    assert checker.stats() == {"checked": 5, "dead": 2}
+
+
+def test_preflight_drops_dead_postings(tmp_path):
+    checker, _ = _checker()
+    store = ResultStore("Test", results_dir=str(tmp_path))
+    jobs = [Job(title=f"Job {i}", company="Acme", application_url=url) for i, url in enumerate([LIVE, CLOSED])]
+    base_state = GraphState(liveness_checker=checker, result_store=store)
+
+    assert preflight_jobs(base_state, jobs) == [jobs[0]]
+    assert store.failed == 1
+
+    state = GraphState(job_queue=JobQueue(jobs=[]), current_job=jobs[1], liveness_checker=checker)
+    assert preflight_node(state).current_job is None
+
+    state.current_job = jobs[0]
+    assert preflight_node(state).current_job is jobs[0]
+    store.close()
@@ -0,0 +1,62 @@
+import itertools
+
+from agents.cv_optimization_agent import OpenAICVOptimizationAgent
+from models.cv import CV
+from models.job import Job
+from storage import optimization_cache
+from storage.optimization_cache import OptimizationCache
+
+
+def test_hits_and_misses_are_counted(tmp_path):
+    cache = OptimizationCache(str(tmp_path / "cache.sqlite"))
+
+    assert cache.get("a") is None
+    cache.put("a", "value")
+    assert cache.get("a") == "value"
+    assert cache.get("a") == "value"
+
+    assert cache.stats() == {"hits": 2, "misses": 1, "evictions": 0, "entries": 1}
+    cache.close()
+
+
+def test_evicts_least_recently_used_at_max_entries(tmp_path, monkeypatch):
+    # Strictly increasing clock, so access order is unambiguous
+    clock = itertools.count(1)
+    monkeypatch.setattr(optimization_cache.time, "time", lambda: float(next(clock)))
+    cache = OptimizationCache(str(tmp_path / "cache.sqlite"), max_entries=2)
+
+    cache.put("a", "1")
+    cache.put("b", "2")
+    cache.get("a")  # "b" is now the least recently used
+    cache.put("c", "3")
+
+    assert cache.get("b") is None
+    assert (cache.get("a"), cache.get("c")) == ("1", "3")
+    assert cache.stats()["evictions"] == 1
+    assert cache.stats()["entries"] == 2
+    cache.close()
+
+
+def test_entries_survive_reopen(tmp_path):
+    path = str(tmp_path / "cache.sqlite")
+    cache = OptimizationCache(path)
+    cache.put("a", "value")
+    cache.close()
+
+    reopened = OptimizationCache(path)
+    assert reopened.get("a") == "value"
+    reopened.close()
+
+
+def test_cache_key_depends_on_tokenizer(monkeypatch):
+    monkeypatch.setenv("OPENAI_API_KEY", "test")
+    agent = OpenAICVOptimizationAgent()
+    cv = CV(full_name="Test", skills=["Python"], summary="Dev")
+    job = Job(id="1", title="Engineer", company="Co", description="Write Python.")
+
+    key = agent._cache_key(cv, job)
+    monkeypatch.setattr(agent.prompt_builder.counter, "_encoding", None)
+    monkeypatch.setattr(agent.prompt_builder.counter, "CHARS_PER_TOKEN", 3)
+
+    assert agent.prompt_builder.counter.mode == "chars/3"
+    assert agent._cache_key(cv, job) != key
@@ -0,0 +1,111 @@
+import threading
+
+from graph import workflow
+from graph.pipeline import PipelineRunner
+from graph.state import GraphState
+from models.cv import CV
+from models.job import Job
+from models.job_queue import JobQueue
+from models.optimized_cv import OptimizedCV
+from models.submission.form_field import FormField
+from models.submission.form_field_type import FormFieldType
+from models.submission.form_schema import SubmissionFormSchema
+
+SUBMISSION = [
+    "POP_JOB", "PREFLIGHT", "OPTIMIZE", "SUBMIT_START", "DETECT_ATS", "EXTRACT_SCHEMA",
+    "MAP_FIELDS", "FILL_FORM", "VALIDATE_FORM", "CONFIRM_SUBMIT", "SUBMIT_SUCCESS",
+]
+
+
+def _stub_nodes(monkeypatch):
+    """
+    Replace every workflow node except POP_JOB with a stub that records
+    (job id, node, thread). Job ids pick the failure path.
+    """
+    events = []
+    lock = threading.Lock()
+
+    def stub(name, action=None):
+        def node(state):
+            with lock:
+                events.append((state.current_job.id, name, threading.current_thread().name))
+            if action is not None:
+                action(state)
+            return state
+        return node
+
+    def optimize(state):
+        if state.current_job.id == "opt_fails":
+            state.retry_count += 1
+        else:
+            state.current_optimized_cv = OptimizedCV(original_cv=state.cv, job=state.current_job)
+
+    def extract(state):
+        if state.current_job.id == "crashes":
+            raise RuntimeError("page did not load")
+        state.form_schema = SubmissionFormSchema(
+            ats_type="greenhouse",
+            form_url="https://example.com",
+            fields=[FormField(field_id="email", label="Email", type=FormFieldType.EMAIL, required=True)],
+        )
+
+    def map_fields(state):
+        state.field_mapping = {"email": "" if state.current_job.id == "invalid" else "a@b.c"}
+
+    def validate(state):
+        state.submission_attempts += 1
+
+    actions = {
+        "OPTIMIZE": optimize,
+        "EXTRACT_SCHEMA": extract,
+        "MAP_FIELDS": map_fields,
+        "VALIDATE_FORM": validate,
+    }
+    for name in workflow.NODES:
+        if name != "POP_JOB":
+            monkeypatch.setitem(workflow.NODES, name, stub(name, actions.get(name)))
+    return events
+
+
+def _run(monkeypatch, job_ids):
+    events = _stub_nodes(monkeypatch)
+    state = GraphState(
+        cv=CV(full_name="Test"),
+        job_queue=JobQueue(jobs=[Job(id=i, title=i, company="Co") for i in job_ids]),
+    )
+    report = PipelineRunner(optimize_workers=2, browser_workers=2, queue_size=1).run(state)
+    return report, events
+
+
+def _path(events, job_id):
+    return [node for job, node, _ in events if job == job_id]
+
+
+def test_stages_follow_graph_edges_and_keep_a_job_on_one_lane(monkeypatch):
+    report, events = _run(monkeypatch, ["a", "b", "c"])
+
+    assert (report.jobs_completed, report.jobs_errored) == (3, 0)
+    for job_id in ("a", "b", "c"):
+        # POP_JOB is the real node and is not recorded
+        assert _path(events, job_id) == SUBMISSION[1:]
+
+        threads = {node: thread for job, node, thread in events if job == job_id}
+        assert threads["EXTRACT_SCHEMA"].startswith("browser-lane-")
+        assert threads["FILL_FORM"] == threads["EXTRACT_SCHEMA"]
+        assert not threads["OPTIMIZE"].startswith("browser-lane-")
+
+
+def test_failure_paths(monkeypatch):
+    report, events = _run(monkeypatch, ["opt_fails", "invalid", "crashes"])
+
+    assert _path(events, "opt_fails") == ["PREFLIGHT", "OPTIMIZE", "OPTIMIZE", "OPTIMIZE", "OPT_FAILED"]
+    assert _path(events, "invalid") == [
+        "PREFLIGHT", "OPTIMIZE", "SUBMIT_START", "DETECT_ATS", "EXTRACT_SCHEMA",
+        "MAP_FIELDS", "FILL_FORM", "VALIDATE_FORM",
+        "MAP_FIELDS", "FILL_FORM", "VALIDATE_FORM",
+        "SUBMIT_FAILED",
+    ]
+    assert _path(events, "crashes") == [
+        "PREFLIGHT", "OPTIMIZE", "SUBMIT_START", "DETECT_ATS", "EXTRACT_SCHEMA",
+    ]
+    assert (report.jobs_completed, report.jobs_errored) == (2, 1)
@@ -0,0 +1,29 @@
+from agents.cv_optimization_agent import OpenAICVOptimizationAgent
+from agents.prompt_builder import PromptBuilder
+from models.cv import CV
+from models.job import Job
+
+
+def test_long_description_is_trimmed_to_relevant_paragraphs():
+    builder = PromptBuilder(OpenAICVOptimizationAgent.MODEL, max_prompt_tokens=300)
+    cv = CV(full_name="Test", skills=["Python", "PostgreSQL"], summary="Backend developer")
+
+    filler = "\n\n".join(f"Our office perk number {i} is lovely and fun. " * 8 for i in range(30))
+    relevant = "You will build APIs in Python on top of PostgreSQL."
+    job = Job(title="Backend Engineer", company="Co", description=filler + "\n\n" + relevant)
+
+    prompt = builder.build(OpenAICVOptimizationAgent.PROMPT_TEMPLATE, cv, job)
+
+    assert builder.counter.count(prompt) <= 300
+    assert relevant in prompt
+    assert "perk number 29" not in prompt
+
+
+def test_short_description_is_untouched():
+    builder = PromptBuilder(OpenAICVOptimizationAgent.MODEL)
+    cv = CV(full_name="Test", skills=["Python"], summary="Dev")
+    job = Job(title="Engineer", company="Co", description="Write Python.")
+
+    prompt = builder.build(OpenAICVOptimizationAgent.PROMPT_TEMPLATE, cv, job)
+
+    assert "Write Python." in prompt
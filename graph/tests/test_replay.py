@@ -0,0 +1,109 @@
+import os
+import urllib.error
+import urllib.request
+
+import pytest
+
+from execution.greenhouse.replay import SnapshotServer, recording_name, static_snapshot
+
+JOB_URL = "https://job-boards.greenhouse.io/acme/jobs/123"
+
+
+def test_static_snapshot_strips_scripts():
+    html = '<html><script src="x.js"></script><form id="application-form"></form><SCRIPT>\nboot()</SCRIPT></html>'
+    assert static_snapshot(html) == '<html><form id="application-form"></form></html>'
+
+
+def test_snapshot_server_serves_recorded_job(tmp_path):
+    assert recording_name(JOB_URL) == "acme_123"
+    (tmp_path / "acme_123.html").write_text('<form id="application-form"></form>', encoding="utf-8")
+
+    with SnapshotServer(str(tmp_path)) as server:
+        url = server.url_for(JOB_URL)
+        assert url.endswith("/acme/jobs/123")
+        with urllib.request.urlopen(url) as response:
+            assert b"application-form" in response.read()
+
+        with pytest.raises(urllib.error.HTTPError):
+            urllib.request.urlopen(server.url_for("https://job-boards.greenhouse.io/acme/jobs/999"))
+
+
+def test_recording_name_rejects_other_urls():
+    with pytest.raises(ValueError):
+        recording_name("https://example.com/jobs/1")
+
+
+# ---------- replayed page regression ----------
+
+FIXTURES = os.path.join(os.path.dirname(__file__), "fixtures")
+FIXTURE_JOB_URL = "https://job-boards.greenhouse.io/acme/jobs/4000000001"
+
+
+@pytest.fixture
+def replayed_executor():
+    from playwright.sync_api import sync_playwright
+
+    from execution.greenhouse.greenhouse_executor import GreenhouseExecutor
+
+    with sync_playwright() as pw:
+        try:
+            pw.chromium.launch().close()
+        except Exception as e:
+            pytest.skip(f"Chromium not available: {e}")
+
+    with SnapshotServer(FIXTURES) as server:
+        executor = GreenhouseExecutor(server.url_for(FIXTURE_JOB_URL), headless=True, block_resources=False)
+        try:
+            yield executor
+        finally:
+            executor.close()
+
+
+def test_replayed_page_schema_and_fill(replayed_executor, tmp_path):
+    from execution.greenhouse.steps.batch_fill import batch_fill_text_fields
+    from execution.greenhouse.steps.dry_run_fill import dry_run_fill_form
+    from execution.greenhouse.steps.extract_schema import extract_schema_from_page
+    from mapping.map_profile_to_schema import map_profile_to_schema
+    from models.submission.form_field_type import FormFieldType
+    from user.profile import UserProfile
+
+    page = replayed_executor.get_page()
+    schema = extract_schema_from_page(page)
+
+    fields = {f.field_id: f for f in schema.fields}
+    assert list(fields) == [
+        "first_name", "last_name", "email", "phone", "resume",
+        "question_1001", "question_1002", "question_1003",
+    ]
+    assert fields["email"].type == FormFieldType.EMAIL
+    assert fields["phone"].type == FormFieldType.PHONE
+    assert fields["resume"].type == FormFieldType.FILE and fields["resume"].required
+    assert fields["question_1003"].type == FormFieldType.TEXTAREA
+    assert fields["first_name"].required and not fields["question_1001"].required
+
+    resume = tmp_path / "resume.pdf"
+    resume.write_bytes(b"%PDF-1.4")
+    profile = UserProfile(
+        first_name="Replay",
+        last_name="User",
+        email="replay@example.com",
+        phone="+15555550100",
+        country="United States",
+        resume_path=str(resume),
+        linkedin="https://linkedin.com/in/replay-user",
+        website="https://example.com",
+    )
+    mapping = map_profile_to_schema(schema, profile)
+    assert mapping.missing_required_fields == []
+
+    dry_run_fill_form(page, mapping)
+    assert page.input_value("#first_name") == "Replay"
+    assert page.input_value("#email") == "replay@example.com"
+    assert page.input_value("#question_1001") == "https://linkedin.com/in/replay-user"
+    assert page.input_value("#question_1002") == "https://example.com"
+    assert page.evaluate("document.getElementById('resume').files.length") == 1
+
+    results = batch_fill_text_fields(page, {"last_name": "Batch", "question_1003": "Because.", "nope": "x"})
+    assert results["last_name"]["status"] == "filled"
+    assert results["question_1003"]["actual"] == "Because."
+    assert results["nope"]["status"] == "missing"
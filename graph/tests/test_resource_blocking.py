@@ -0,0 +1,23 @@
+from execution.greenhouse.resource_blocking import ResourceBlocker
+
+GREENHOUSE = "https://job-boards.greenhouse.io/acme/jobs/1"
+
+
+def test_trackers_blocked_but_navigations_allowed():
+    blocker = ResourceBlocker()
+
+    assert blocker.should_block("image", "https://job-boards.greenhouse.io/logo.png", GREENHOUSE)
+    assert blocker.should_block("script", "https://connect.facebook.net/sdk.js", GREENHOUSE)
+    assert blocker.should_block("xhr", "https://www.linkedin.com/px/track", GREENHOUSE)
+
+    # Navigations and frames to listed hosts go through
+    assert not blocker.should_block("document", "https://www.linkedin.com/in/someone", GREENHOUSE)
+    assert not blocker.should_block("document", "https://www.facebook.com/plugins/page.php", GREENHOUSE)
+
+
+def test_first_party_xhr_is_not_host_blocked():
+    blocker = ResourceBlocker()
+    page = "https://www.linkedin.com/jobs/view/1"
+
+    assert not blocker.should_block("fetch", "https://api.linkedin.com/voyager/jobs", page)
+    assert blocker.should_block("script", "https://static.licdn.com/tracker.js", page)
@@ -0,0 +1,31 @@
+import time
+
+from storage.result_store import ResultStore, error_type_for
+from storage.results_analytics import error_type_of
+
+
+def test_result_store_files_and_error_types(tmp_path):
+    first = ResultStore("A", results_dir=str(tmp_path), fsync_interval=0.05)
+    second = ResultStore("B", results_dir=str(tmp_path))
+    assert first.filepath != second.filepath
+
+    first.record_failure("Acme", "Engineer", TimeoutError("form never loaded"))
+    first.record_failure("Acme", "Analyst", "PostingClosed: not_found")
+    first.record_failure("Acme", "Designer", "Submission failed")
+
+    # The timer syncs pending records without a further write
+    time.sleep(0.2)
+    assert first._sync_timer is None
+
+    jobs = ResultStore.load(first.filepath)["jobs"]
+    assert [j["error_type"] for j in jobs] == ["TimeoutError", "PostingClosed", "Exception"]
+    assert jobs[0]["error"] == "form never loaded"
+    first.close()
+    second.close()
+
+
+def test_log_and_analytics_agree_on_error_types():
+    for message in ("TimeoutError: form never loaded", "PostingClosed: not_found", "Submission failed"):
+        # Runs from before error_type was recorded stored "str"
+        record = {"status": "failed", "error": message, "error_type": "str"}
+        assert error_type_of(record) == error_type_for(message)
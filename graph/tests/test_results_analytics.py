@@ -0,0 +1,28 @@
+from storage.result_store import ResultStore
+from storage.results_analytics import ResultsAnalytics
+
+
+def test_incremental_ingest_and_queries(tmp_path):
+    results_dir = str(tmp_path / "results")
+    analytics = ResultsAnalytics(str(tmp_path / "analytics.sqlite"))
+
+    store = ResultStore("Tester", results_dir=results_dir)
+    store.record_success("Acme", "Engineer", "https://boards.greenhouse.io/acme/jobs/1")
+    store.record_failure("Globex", "Engineer", "TimeoutError: form never loaded",
+                         "https://jobs.lever.co/globex/2")
+
+    assert analytics.ingest(results_dir) == 2
+    assert analytics.ingest(results_dir) == 0
+
+    store.record_failure("Globex", "Analyst", "boom", "https://jobs.lever.co/globex/3")
+    store.save()
+    store.close()
+
+    assert analytics.ingest(results_dir) == 1
+
+    assert analytics.top_failing_companies() == [("Globex", 2)]
+    assert dict((row[0], row[3]) for row in analytics.submit_rate_by_ats()) == {
+        "greenhouse": 100.0,
+        "lever": 0.0,
+    }
+    assert sorted(analytics.error_breakdown()) == [("Exception", 1), ("TimeoutError", 1)]
@@ -0,0 +1,101 @@
+from types import SimpleNamespace
+
+import httpx
+import openai
+import pytest
+
+from agents.cv_optimization_agent import CVOptimizationAgent, OpenAICVOptimizationAgent
+from agents.optimization_response import OptimizationResponseError
+from agents.retry_policy import RetryBudget, RetryPolicy
+from graph.nodes import optimize_cv_node
+from graph.state import GraphState
+from models.cv import CV
+from models.job import Job
+
+
+def _status_error(cls, status, headers=None):
+    request = httpx.Request("POST", "https://api.openai.com/v1/chat/completions")
+    response = httpx.Response(status, headers=headers or {}, request=request)
+    return cls("error", response=response, body=None)
+
+
+def _flaky(errors, result="ok"):
+    calls = []
+
+    def fn():
+        calls.append(1)
+        if len(calls) <= len(errors):
+            raise errors[len(calls) - 1]
+        return result
+
+    return fn, calls
+
+
+def test_honors_retry_after_and_stops_on_non_retryable():
+    sleeps = []
+    policy = RetryPolicy(sleep=sleeps.append)
+
+    fn, calls = _flaky([_status_error(openai.RateLimitError, 429, {"retry-after": "7"})])
+    assert policy.call(fn) == "ok"
+    assert sleeps == [7.0]
+
+    fn, calls = _flaky([_status_error(openai.BadRequestError, 400)])
+    with pytest.raises(openai.BadRequestError):
+        policy.call(fn)
+    assert len(calls) == 1
+
+
+def test_shared_budget_caps_retries_during_outage():
+    policy = RetryPolicy(budget=RetryBudget(capacity=3), sleep=lambda _: None)
+    outage = [_status_error(openai.InternalServerError, 500)] * 10
+
+    total_calls = 0
+    for _ in range(5):
+        fn, calls = _flaky(outage)
+        with pytest.raises(openai.InternalServerError):
+            policy.call(fn)
+        total_calls += len(calls)
+
+    # 5 first attempts + only 3 budgeted retries across all jobs
+    assert total_calls == 8
+
+
+def test_graph_does_not_retry_on_top_of_optimizer_policy():
+    class FailingOptimizer(CVOptimizationAgent):
+        retry_policy = RetryPolicy()
+        calls = 0
+
+        def optimize(self, cv, job):
+            FailingOptimizer.calls += 1
+            raise RuntimeError("down")
+
+    state = GraphState(
+        cv=CV(full_name="Test", skills=[], location="Remote", summary="Dev"),
+        current_job=Job(id="1", title="Job", company="Co"),
+        optimizer=FailingOptimizer(),
+    )
+    state = optimize_cv_node(state)
+
+    assert FailingOptimizer.calls == 1
+    assert state.retry_count == state.max_retries
+
+
+def test_refused_completion_raises_validation_error_and_is_retried():
+    calls = []
+
+    def create(**params):
+        calls.append(params)
+        message = SimpleNamespace(content=None, refusal="I can't help with that.")
+        return SimpleNamespace(choices=[SimpleNamespace(message=message)], usage=None)
+
+    client = SimpleNamespace(chat=SimpleNamespace(completions=SimpleNamespace(create=create)))
+    agent = OpenAICVOptimizationAgent(
+        client=client, retry_policy=RetryPolicy(sleep=lambda _: None)
+    )
+    cv = CV(full_name="Test", skills=[], location="Remote", summary="Dev")
+
+    with pytest.raises(OptimizationResponseError, match="refused"):
+        agent.optimize(cv, Job(id="1", title="Job", company="Co"))
+
+    # Same rule as an invalid JSON response: one retry, then give up
+    assert len(calls) == 2
@@ -0,0 +1,104 @@
+from execution.greenhouse.steps.extract_schema import _BULK_EXTRACT_JS
+from graph.nodes_submission import extract_schema_node, _validate_cached_schema
+from graph.state import GraphState
+from models.job import Job
+from storage.schema_cache import SchemaCache
+
+URL = "https://job-boards.greenhouse.io/acme/jobs/1"
+OTHER_URL = "https://job-boards.greenhouse.io/acme/jobs/2"
+
+
+def _elements(linkedin_label):
+    return [
+        {"id": "first_name", "type": "text", "tag": "INPUT", "label": "First Name*", "aria_required": "true"},
+        {"id": "question_1", "type": "text", "tag": "INPUT", "label": linkedin_label},
+    ]
+
+
+class _FakePage:
+    def __init__(self, elements, url=URL):
+        self.elements = elements
+        self.url = url
+        self.extractions = 0
+        self.signature_reads = 0
+        self.waits = 0
+
+    def wait_for_selector(self, selector, timeout=None):
+        self.waits += 1
+
+    def evaluate(self, script):
+        if script == _BULK_EXTRACT_JS:
+            self.extractions += 1
+        else:
+            self.signature_reads += 1
+        return self.elements
+
+
+class _FakeExecutor:
+    def __init__(self, page):
+        self.page = page
+
+    def get_page(self):
+        return self.page
+
+
+def _state(cache, page, url=URL):
+    state = GraphState(
+        current_job=Job(title="Engineer", company="Acme", application_url=url),
+        ats_type="greenhouse",
+        schema_cache=cache,
+    )
+    # Bypass field validation for the fake executor
+    object.__setattr__(state, "executor", _FakeExecutor(page))
+    return state
+
+
+def test_miss_extracts_once_and_hit_skips_page(tmp_path):
+    cache = SchemaCache(str(tmp_path / "schemas.sqlite"))
+
+    page = _FakePage(_elements("LinkedIn Profile"))
+    extract_schema_node(_state(cache, page))
+    assert (page.waits, page.extractions) == (1, 1)
+
+    page = _FakePage(_elements("LinkedIn Profile"))
+    state = _state(cache, page)
+    schema = extract_schema_node(state).form_schema
+    assert (page.waits, page.extractions, page.signature_reads) == (0, 0, 0)
+    assert [f.field_id for f in schema.fields] == ["first_name", "question_1"]
+    assert state.schema_fingerprint is not None
+
+    # FILL_FORM validates with the signature read only
+    _validate_cached_schema(state, page)
+    assert (page.extractions, page.signature_reads) == (0, 1)
+    assert cache.stats()["invalidations"] == 0
+    cache.close()
+
+
+def test_same_form_on_board_skips_extraction(tmp_path):
+    cache = SchemaCache(str(tmp_path / "schemas.sqlite"))
+    extract_schema_node(_state(cache, _FakePage(_elements("LinkedIn Profile"))))
+
+    page = _FakePage(_elements("LinkedIn Profile"), OTHER_URL)
+    schema = extract_schema_node(_state(cache, page, OTHER_URL)).form_schema
+
+    assert (page.extractions, page.signature_reads) == (0, 1)
+    assert schema.form_url == OTHER_URL
+    assert cache.stats()["board_hits"] == 1
+    assert cache.peek("acme", "2") is not None
+    cache.close()
+
+
+def test_label_change_invalidates_cached_schema(tmp_path):
+    cache = SchemaCache(str(tmp_path / "schemas.sqlite"))
+    extract_schema_node(_state(cache, _FakePage(_elements("LinkedIn Profile"))))
+
+    page = _FakePage(_elements("Portfolio URL"))
+    state = extract_schema_node(_state(cache, page))
+    _validate_cached_schema(state, page)
+
+    labels = {f.field_id: f.label for f in state.form_schema.fields}
+    assert labels["question_1"] == "Portfolio URL"
+    assert state.form_schema.fields[1].mapping_hint == "user_profile.website"
+    assert state.field_mapping is not None
+    assert cache.stats()["invalidations"] == 1
+    cache.close()
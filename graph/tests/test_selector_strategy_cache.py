@@ -0,0 +1,94 @@
+from graph.nodes_submission import _fill_greenhouse_text_field
+from storage.selector_strategy_cache import SelectorStrategyCache
+
+
+class _Locator:
+    def __init__(self, page, kind):
+        self.page, self.kind, self.first = page, kind, self
+
+    def wait_for(self, **kwargs):
+        if self.kind not in self.page.working:
+            raise TimeoutError(f"{self.kind} not visible")
+
+    def count(self):
+        return 1 if self.kind in self.page.working else 0
+
+    def clear(self):
+        pass
+
+    def fill(self, value):
+        self.page.value = value
+
+    def input_value(self):
+        return self.page.value
+
+
+class _Page:
+    def __init__(self, working):
+        self.working, self.calls, self.value = set(working), [], None
+
+    def locator(self, selector):
+        self.calls.append("id")
+        return _Locator(self, "id")
+
+    def get_by_label(self, label, exact=False):
+        self.calls.append("label")
+        return _Locator(self, "label")
+
+
+def test_learns_and_relearns_strategy_per_board(tmp_path):
+    cache = SelectorStrategyCache(str(tmp_path / "strategies.sqlite"))
+
+    page = _Page(working={"label"})
+    assert _fill_greenhouse_text_field(page, "q1", "Q1", "#q1", "x", cache, "acme")
+    assert page.calls == ["id", "label"]
+
+    # Persisted: a new cache instance goes straight to the label strategy
+    cache = SelectorStrategyCache(str(tmp_path / "strategies.sqlite"))
+    page = _Page(working={"label"})
+    assert _fill_greenhouse_text_field(page, "q1", "Q1", "#q1", "x", cache, "acme")
+    assert page.calls == ["label"]
+
+    # The board changed its markup - fall back and relearn
+    page = _Page(working={"id"})
+    assert _fill_greenhouse_text_field(page, "q1", "Q1", "#q1", "x", cache, "acme")
+    assert page.calls == ["label", "id"]
+    assert cache.get("acme", "q1") == "id"
+    assert cache.stats()["relearns"] == 1
+
+
+def test_non_resume_upload_never_falls_back_to_resume_input(tmp_path):
+    from graph.nodes_submission import _fill_greenhouse_file_field
+
+    class _FileLocator:
+        def __init__(self, page, selector):
+            self.page, self.selector, self.first = page, selector, self
+
+        def count(self):
+            return 1 if self.selector in self.page.present else 0
+
+        def set_input_files(self, path):
+            self.page.uploads.append(self.selector)
+
+    class _FilePage:
+        def __init__(self, present):
+            self.present, self.uploads = set(present), []
+
+        def locator(self, selector):
+            return _FileLocator(self, selector)
+
+    letter = tmp_path / "letter.pdf"
+    letter.write_bytes(b"%PDF")
+    cache = SelectorStrategyCache(str(tmp_path / "strategies.sqlite"))
+
+    # Only the resume input exists - the cover letter must not go into it
+    page = _FilePage({"input[type='file']", "input#resume[type='file']"})
+    assert not _fill_greenhouse_file_field(page, str(letter), cache, "acme", "cover_letter")
+    assert page.uploads == []
+    assert cache.get("acme", "cover_letter") is None
+
+    page = _FilePage({"input#cover_letter[type='file']"})
+    assert _fill_greenhouse_file_field(page, str(letter), cache, "acme", "cover_letter")
+    assert page.uploads == ["input#cover_letter[type='file']"]
+    assert cache.get("acme", "cover_letter") == "id"
+    cache.close()
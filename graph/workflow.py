@@ -3,6 +3,7 @@ from langgraph.graph import StateGraph, END
 from graph.state import GraphState
 from graph.nodes import (
     pop_job_node,
+    preflight_node,
     optimize_cv_node,
     optimization_failed_node,
 )
@@ -20,116 +21,126 @@ from graph.nodes_submission import (
 )
 
 
-def build_graph():
-    graph = StateGraph(GraphState)
+def is_form_valid(state) -> bool:
+    """Check if all required fields have valid values."""
+    schema = state.form_schema
+    mapping = state.field_mapping
 
-    # ===== Core job loop =====
-    graph.add_node("POP_JOB", pop_job_node)
-    graph.add_node("OPTIMIZE", optimize_cv_node)
-    graph.add_node("OPT_FAILED", optimization_failed_node)
+    if schema is None or mapping is None:
+        return False
+
+    for field in schema.fields:
+        if field.required:
+            value = mapping.get(field.field_id)
+            if value is None or value == "" or value == []:
+                return False
+
+    return True
+
+
+# ===== Routing decisions (shared with graph.pipeline) =====
+
+def route_after_pop(state) -> str:
+    """Job existence check."""
+    return "END" if state.current_job is None else "PREFLIGHT"
+
+
+def route_after_preflight(state) -> str:
+    """Dead postings go straight back to POP_JOB."""
+    return "POP_JOB" if state.current_job is None else "OPTIMIZE"
+
+
+def route_after_optimize(state) -> str:
+    """Optimization with retries."""
+    if state.current_optimized_cv is not None:
+        return "SUBMIT_START"
+    if state.retry_count < state.max_retries:
+        return "OPTIMIZE"
+    return "OPT_FAILED"
 
+
+def route_after_validate(state) -> str:
+    """Form validation decision."""
+    if is_form_valid(state):
+        return "CONFIRM_SUBMIT"
+    if state.submission_attempts < state.max_submission_attempts:
+        return "MAP_FIELDS"
+    return "SUBMIT_FAILED"
+
+
+def route_after_confirm(state) -> str:
+    """Submission decision."""
+    if state.submission_attempts <= state.max_submission_attempts:
+        return "SUBMIT_SUCCESS"
+    return "SUBMIT_FAILED"
+
+
+NODES = {
+    # ===== Core job loop =====
+    "POP_JOB": pop_job_node,
+    "PREFLIGHT": preflight_node,
+    "OPTIMIZE": optimize_cv_node,
+    "OPT_FAILED": optimization_failed_node,
     # ===== Submission sub-graph =====
-    graph.add_node("SUBMIT_START", submit_start_node)
-    graph.add_node("DETECT_ATS", detect_ats_node)
-    graph.add_node("EXTRACT_SCHEMA", extract_schema_node)
-    graph.add_node("MAP_FIELDS", map_fields_node)
-    graph.add_node("FILL_FORM", fill_form_node)
-    graph.add_node("VALIDATE_FORM", validate_form_node)
-    graph.add_node("CONFIRM_SUBMIT", confirm_submission_node)
-    graph.add_node("SUBMIT_SUCCESS", submit_success_node)
-    graph.add_node("SUBMIT_FAILED", submit_failed_node)
+    "SUBMIT_START": submit_start_node,
+    "DETECT_ATS": detect_ats_node,
+    "EXTRACT_SCHEMA": extract_schema_node,
+    "MAP_FIELDS": map_fields_node,
+    "FILL_FORM": fill_form_node,
+    "VALIDATE_FORM": validate_form_node,
+    "CONFIRM_SUBMIT": confirm_submission_node,
+    "SUBMIT_SUCCESS": submit_success_node,
+    "SUBMIT_FAILED": submit_failed_node,
+}
+
+# Unconditional edges
+EDGES = {
+    "OPT_FAILED": "POP_JOB",
+    "SUBMIT_START": "DETECT_ATS",
+    "DETECT_ATS": "EXTRACT_SCHEMA",
+    "EXTRACT_SCHEMA": "MAP_FIELDS",
+    "MAP_FIELDS": "FILL_FORM",
+    "FILL_FORM": "VALIDATE_FORM",
+    "SUBMIT_SUCCESS": "POP_JOB",
+    "SUBMIT_FAILED": "POP_JOB",
+}
+
+# Conditional edges: node -> (route, possible targets)
+ROUTES = {
+    "POP_JOB": (route_after_pop, ("PREFLIGHT", "END")),
+    "PREFLIGHT": (route_after_preflight, ("OPTIMIZE", "POP_JOB")),
+    "OPTIMIZE": (route_after_optimize, ("SUBMIT_START", "OPTIMIZE", "OPT_FAILED")),
+    "VALIDATE_FORM": (route_after_validate, ("CONFIRM_SUBMIT", "MAP_FIELDS", "SUBMIT_FAILED")),
+    "CONFIRM_SUBMIT": (route_after_confirm, ("SUBMIT_SUCCESS", "SUBMIT_FAILED")),
+}
+
+
+def next_node(name: str, state) -> str:
+    """
+    Node the graph runs after name for this state ("END" when done).
+    """
+    if name in ROUTES:
+        return ROUTES[name][0](state)
+    return EDGES[name]
+
+
+def build_graph():
+    graph = StateGraph(GraphState)
+
+    for name, node in NODES.items():
+        graph.add_node(name, node)
 
     # Entry point
     graph.set_entry_point("POP_JOB")
 
-    # ===== Job existence check =====
-    graph.add_conditional_edges(
-        "POP_JOB",
-        lambda state: "END" if state.current_job is None else "OPTIMIZE",
-        {
-            "OPTIMIZE": "OPTIMIZE",
-            "END": END,
-        },
-    )
-
-    # ===== Optimization with retries =====
-    graph.add_conditional_edges(
-        "OPTIMIZE",
-        lambda state: (
-            "SUBMIT_START"
-            if state.current_optimized_cv is not None
-            else "OPTIMIZE"
-            if state.retry_count < state.max_retries
-            else "OPT_FAILED"
-        ),
-        {
-            "SUBMIT_START": "SUBMIT_START",
-            "OPTIMIZE": "OPTIMIZE",
-            "OPT_FAILED": "OPT_FAILED",
-        },
-    )
-
-    # ===== Optimization failure =====
-    graph.add_edge("OPT_FAILED", "POP_JOB")
-
-    # ===== Submission sub-graph wiring =====
-    graph.add_edge("SUBMIT_START", "DETECT_ATS")
-    graph.add_edge("DETECT_ATS", "EXTRACT_SCHEMA")
-    graph.add_edge("EXTRACT_SCHEMA", "MAP_FIELDS")
-    graph.add_edge("MAP_FIELDS", "FILL_FORM")
-    graph.add_edge("FILL_FORM", "VALIDATE_FORM")
-
-    # ===== Form validation decision =====
-    def _is_form_valid(state):
-        """Check if all required fields have valid values."""
-        schema = state.form_schema
-        mapping = state.field_mapping
-
-        if schema is None or mapping is None:
-            return False
-
-        for field in schema.fields:
-            if field.required:
-                value = mapping.get(field.field_id)
-                if value is None or value == "" or value == []:
-                    return False
-
-        return True
-
-    graph.add_conditional_edges(
-        "VALIDATE_FORM",
-        lambda state: (
-            "CONFIRM_SUBMIT"
-            if _is_form_valid(state)
-            else "MAP_FIELDS"
-            if state.submission_attempts < state.max_submission_attempts
-            else "SUBMIT_FAILED"
-        ),
-        {
-            "CONFIRM_SUBMIT": "CONFIRM_SUBMIT",
-            "MAP_FIELDS": "MAP_FIELDS",
-            "SUBMIT_FAILED": "SUBMIT_FAILED",
-        },
-    )
-
-    # ===== Submission decision =====
-    graph.add_conditional_edges(
-        "CONFIRM_SUBMIT",
-        lambda state: (
-            "SUBMIT_SUCCESS"
-            if state.submission_attempts <= state.max_submission_attempts
-            else "SUBMIT_FAILED"
-        ),
-        {
-            "SUBMIT_SUCCESS": "SUBMIT_SUCCESS",
-            "SUBMIT_FAILED": "SUBMIT_FAILED",
-        },
-    )
-
-
-
-    # ===== Loop back =====
-    graph.add_edge("SUBMIT_SUCCESS", "POP_JOB")
-    graph.add_edge("SUBMIT_FAILED", "POP_JOB")
+    for name, target in EDGES.items():
+        graph.add_edge(name, target)
+
+    for name, (route, targets) in ROUTES.items():
+        graph.add_conditional_edges(
+            name,
+            route,
+            {target: END if target == "END" else target for target in targets},
+        )
 
     return graph.compile()
@@ -1,3 +1,6 @@
+import logging
+import os
+
 from dotenv import load_dotenv
 load_dotenv(dotenv_path=".env")
 
@@ -7,12 +10,25 @@ setup_logging()
 from models.cv import CV
 from agents.job_matching_agent import JobMatchingAgent
 from storage.result_store import ResultStore
-
-from agents.cv_optimization_agent import OpenAICVOptimizationAgent
+from storage.application_index import ApplicationIndex
+from models.durable_job_queue import DurableJobQueue
+from storage.optimization_cache import OptimizationCache
+from storage.schema_cache import SchemaCache
+from storage.selector_strategy_cache import SelectorStrategyCache
+from storage.job_similarity_index import JobSimilarityIndex
+
+from agents.async_cv_optimization_agent import AsyncOpenAICVOptimizationAgent
 from agents.submission_agent import SubmissionAgent
+from agents.retry_policy import RetryPolicy
 
 from graph.state import GraphState
 from graph.workflow import build_graph
+from graph.runner import ConcurrentJobRunner
+from graph.pipeline import PipelineRunner
+from execution.greenhouse.browser_pool import BrowserPool
+from execution.greenhouse.board_api import GreenhouseBoardApi
+from execution.greenhouse.liveness import PostingLivenessChecker
+from execution.greenhouse.wait_timing import wait_timings
 
 
 def main():
@@ -25,13 +41,69 @@ def main():
 
     matcher = JobMatchingAgent()
     job_queue = matcher.find_matching_jobs("Backend Developer", cv)
+    matched_jobs = list(job_queue.jobs)
+
+    # 🔑 Durable queue: a restarted run resumes where the last one stopped
+    queue_db = os.getenv("JOB_QUEUE_DB")
+    if queue_db:
+        durable_queue = DurableJobQueue(queue_db)
+        for job in job_queue.jobs:
+            durable_queue.add(job)
+        job_queue = durable_queue
+
+    # 🔑 Cross-run index of past applications (backfilled from results/)
+    application_index = ApplicationIndex()
+    application_index.ingest_results("results")
 
-    result_store = ResultStore(cv.full_name)
+    result_store = ResultStore(cv.full_name, application_index=application_index)
 
     # 🔑 Instantiate shared runtime agents
-    optimizer = OpenAICVOptimizationAgent()
+    optimization_cache = OptimizationCache()
+    retry_policy = RetryPolicy()
+    optimizer = AsyncOpenAICVOptimizationAgent(
+        cache=optimization_cache,
+        retry_policy=retry_policy,
+        max_concurrency=int(os.getenv("OPTIMIZE_CONCURRENCY", "16")),
+    )
     submission_agent = SubmissionAgent(optimizer)
 
+    job_similarity_index = JobSimilarityIndex()
+
+    # 🔑 HTTP pre-flight: closed postings never reach the optimizer or a browser
+    liveness_checker = PostingLivenessChecker() if os.getenv("PREFLIGHT", "1") == "1" else None
+
+    # Jobs still to apply to (the liveness results are memoized for the graph)
+    pending_jobs = [
+        job for job in matched_jobs
+        if application_index.lookup(job) != ApplicationIndex.SUBMITTED
+    ]
+    if liveness_checker is not None:
+        pending_jobs, _ = liveness_checker.filter_jobs(pending_jobs)
+
+    # Opt-in: optimize every pending job concurrently up front; the graph
+    # then picks the results up from the optimization cache. Off by default
+    # because it holds every browser back until the last job is optimized
+    # (the runners already overlap the two), and a result evicted from the
+    # LRU cache before its job runs is paid for twice. Near-duplicates are
+    # left out - the representatives are indexed before the graph runs, so
+    # every twin finds its optimized CV whichever runner gets there first.
+    if os.getenv("PREOPTIMIZE", "0") == "1":
+        outcomes = optimizer.optimize_all(cv, job_similarity_index.unique(pending_jobs))
+        job_similarity_index.add_many(
+            (outcome.job, outcome.optimized_cv)
+            for outcome in outcomes
+            if outcome.optimized_cv is not None
+        )
+
+    # 🔑 Form schemas over HTTP - the browser only opens for the fill
+    board_api = GreenhouseBoardApi() if os.getenv("BOARD_API", "1") == "1" else None
+    schema_cache = SchemaCache()
+    if board_api is not None:
+        # Bulk discovery per board, so EXTRACT_SCHEMA hits the cache
+        board_api.warm_schema_cache(schema_cache, (job.application_url for job in pending_jobs))
+
+    browser_pool = BrowserPool(headless=os.getenv("HEADLESS", "1") == "1")
+
     graph = build_graph()
 
     print(graph.get_graph().draw_mermaid())
@@ -40,14 +112,56 @@ def main():
     state = GraphState(
         cv=cv,
         job_queue=job_queue,
+        application_index=application_index,
+        liveness_checker=liveness_checker,
         result_store=result_store,
         optimizer=optimizer,
+        retry_policy=retry_policy,
+        job_similarity_index=job_similarity_index,
         submission_agent=submission_agent,
+        browser_pool=browser_pool,
+        schema_cache=schema_cache,
+        board_api=board_api,
+        selector_strategy_cache=SelectorStrategyCache(),
     )
 
-    graph.invoke(state)
+    # 🔑 Process jobs concurrently (MAX_CONCURRENT_JOBS=1 keeps it sequential)
+    max_concurrency = int(os.getenv("MAX_CONCURRENT_JOBS", "4"))
+    if os.getenv("PIPELINE") == "1":
+        # Overlap CV optimization with browser work
+        runner = PipelineRunner(
+            optimize_workers=max_concurrency,
+            browser_workers=int(os.getenv("BROWSER_WORKERS", "1")),
+        )
+    else:
+        runner = ConcurrentJobRunner(graph, max_concurrency=max_concurrency)
+    runner.run(state)
 
     result_store.save()
+    result_store.close()
+
+    wait_timings.log_report()
+
+    # Workers close their own browsers; this logs blocking / recycle stats
+    browser_pool.close()
+
+    if liveness_checker is not None:
+        logging.getLogger(__name__).info("Pre-flight | %s", liveness_checker.stats())
+        liveness_checker.close()
+
+    if board_api is not None:
+        logging.getLogger(__name__).info("Board API | %s", board_api.stats())
+        board_api.close()
+
+    logging.getLogger(__name__).info("Schema cache | %s", schema_cache.stats())
+    schema_cache.close()
+
+    logging.getLogger(__name__).info(
+        "Optimization cache | %s", optimization_cache.stats()
+    )
+    logging.getLogger(__name__).info(
+        "Near-duplicate reuse | %s", job_similarity_index.stats()
+    )
 
 
 if __name__ == "__main__":
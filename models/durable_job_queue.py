@@ -0,0 +1,159 @@
+import logging
+import os
+import sqlite3
+import threading
+import time
+
+from models.job import Job
+
+logger = logging.getLogger(__name__)
+
+
+def job_key(job: Job) -> str:
+    """
+    Stable identity of a job across runs.
+    """
+    if job.id:
+        return f"id:{job.id}"
+    if job.application_url:
+        return f"url:{job.application_url}"
+    return f"ct:{job.company}|{job.title}"
+
+
+class DurableJobQueue:
+    """
+    SQLite-backed FIFO job queue with the same API as JobQueue.
+
+    Every job moves through queued -> leased -> done. pop_next leases the
+    oldest queued job; mark_done acknowledges it once it was processed.
+    Jobs leased by a run that crashed are put back at their original
+    position when the queue is reopened, so a restarted run resumes exactly
+    where the previous one stopped. Leases that expire during a run are
+    reclaimed as well.
+
+    pop_next is an index lookup on (state, seq) - O(log n) regardless of
+    queue size.
+    """
+
+    QUEUED = "queued"
+    LEASED = "leased"
+    DONE = "done"
+
+    def __init__(
+        self,
+        path: str = os.path.join("queue", "jobs.sqlite"),
+        lease_seconds: float = 1800,
+    ):
+        self.path = path
+        self.lease_seconds = lease_seconds
+
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS jobs (
+                seq INTEGER PRIMARY KEY AUTOINCREMENT,
+                job_key TEXT NOT NULL UNIQUE,
+                job_json TEXT NOT NULL,
+                state TEXT NOT NULL,
+                lease_until REAL,
+                updated_at REAL NOT NULL
+            )
+            """
+        )
+        self._conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_jobs_state_seq ON jobs(state, seq)"
+        )
+
+        recovered = self._conn.execute(
+            "UPDATE jobs SET state = ?, lease_until = NULL, updated_at = ? WHERE state = ?",
+            (self.QUEUED, time.time(), self.LEASED),
+        ).rowcount
+        if recovered:
+            logger.info("Recovered %d in-flight jobs from previous run", recovered)
+
+    def is_empty(self) -> bool:
+        with self._lock:
+            self._reclaim_expired()
+            row = self._conn.execute(
+                "SELECT 1 FROM jobs WHERE state = ? LIMIT 1", (self.QUEUED,)
+            ).fetchone()
+        return row is None
+
+    def pop_next(self) -> Job:
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                self._reclaim_expired()
+                row = self._conn.execute(
+                    "SELECT seq, job_json FROM jobs WHERE state = ? ORDER BY seq LIMIT 1",
+                    (self.QUEUED,),
+                ).fetchone()
+
+                if row is None:
+                    raise IndexError("Cannot pop from empty DurableJobQueue")
+
+                now = time.time()
+                self._conn.execute(
+                    "UPDATE jobs SET state = ?, lease_until = ?, updated_at = ? WHERE seq = ?",
+                    (self.LEASED, now + self.lease_seconds, now, row[0]),
+                )
+                self._conn.execute("COMMIT")
+            except Exception:
+                self._conn.execute("ROLLBACK")
+                raise
+
+        return Job.model_validate_json(row[1])
+
+    def add(self, job: Job) -> None:
+        """
+        Enqueue a job. Jobs already known to the queue (queued, in flight or
+        done in an earlier run) are ignored.
+        """
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR IGNORE INTO jobs (job_key, job_json, state, updated_at) "
+                "VALUES (?, ?, ?, ?)",
+                (job_key(job), job.model_dump_json(), self.QUEUED, time.time()),
+            )
+
+    def requeue(self, job: Job) -> None:
+        """
+        Move a leased job back to the end of the queue.
+        """
+        with self._lock:
+            self._conn.execute(
+                "UPDATE jobs SET seq = (SELECT MAX(seq) + 1 FROM jobs), state = ?, "
+                "lease_until = NULL, updated_at = ? WHERE job_key = ? AND state = ?",
+                (self.QUEUED, time.time(), job_key(job), self.LEASED),
+            )
+
+    def mark_done(self, job: Job) -> None:
+        with self._lock:
+            self._conn.execute(
+                "UPDATE jobs SET state = ?, lease_until = NULL, updated_at = ? "
+                "WHERE job_key = ? AND state = ?",
+                (self.DONE, time.time(), job_key(job), self.LEASED),
+            )
+
+    def counts(self) -> dict:
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT state, COUNT(*) FROM jobs GROUP BY state"
+            ).fetchall()
+        return dict(rows)
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+    def _reclaim_expired(self) -> None:
+        self._conn.execute(
+            "UPDATE jobs SET state = ?, lease_until = NULL WHERE state = ? AND lease_until < ?",
+            (self.QUEUED, self.LEASED, time.time()),
+        )
@@ -21,3 +21,16 @@ class JobQueue(BaseModel):
 
     def add(self, job: Job) -> None:
         self.jobs.append(job)
+
+    def requeue(self, job: Job) -> None:
+        """
+        Put a popped job back at the end of the queue.
+        """
+        self.jobs.append(job)
+
+    def mark_done(self, job: Job) -> None:
+        """
+        Acknowledge a processed job. Nothing to do for the in-memory queue;
+        kept for API parity with DurableJobQueue.
+        """
+        pass
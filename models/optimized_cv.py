@@ -18,5 +18,6 @@ class OptimizedCV(BaseModel):
     tailored_summary: Optional[str] = None
     tailored_skills: List[str] = Field(default_factory=list)
     tailored_experience: Optional[str] = None
+    cover_letter: Optional[str] = None
 
     full_text: Optional[str] = None  # final rendered CV text (for submission)
@@ -0,0 +1,54 @@
+"""
+Overnight CV optimization through the OpenAI Batch API.
+
+    python -m scripts.batch_optimize write   batches/requests.jsonl
+    python -m scripts.batch_optimize submit  batches/requests.jsonl
+    python -m scripts.batch_optimize fetch   <batch_id> batches/results.jsonl
+    python -m scripts.batch_optimize ingest  batches/requests.jsonl batches/results.jsonl
+
+Ingested results land in the optimization cache, so the next main.py run
+submits those applications without calling OpenAI.
+"""
+
+import argparse
+
+from dotenv import load_dotenv
+load_dotenv(dotenv_path=".env")
+
+from agents.batch_cv_optimization import BatchCVOptimizer
+from agents.cv_optimization_agent import OpenAICVOptimizationAgent
+from agents.job_matching_agent import JobMatchingAgent
+from models.cv import CV
+from storage.optimization_cache import OptimizationCache
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Batch API mode for CV optimization")
+    parser.add_argument("command", choices=["write", "submit", "fetch", "ingest"])
+    parser.add_argument("args", nargs="+")
+    args = parser.parse_args()
+
+    cv = CV(
+        full_name="Test User",
+        skills=["Python", "FastAPI", "SQL"],
+        location="Remote",
+        summary="Backend developer",
+    )
+
+    batch = BatchCVOptimizer(OpenAICVOptimizationAgent(cache=OptimizationCache()))
+
+    if args.command == "write":
+        jobs = JobMatchingAgent().find_matching_jobs("Backend Developer", cv).jobs
+        print(f"Wrote {batch.write_requests(cv, jobs, args.args[0])} requests")
+    elif args.command == "submit":
+        print(batch.submit(args.args[0]))
+    elif args.command == "fetch":
+        ready = batch.download_results(args.args[0], args.args[1])
+        print("Downloaded" if ready else "Batch not finished yet")
+    else:
+        optimized = batch.ingest_results(cv, args.args[1], args.args[0])
+        print(f"Ingested {len(optimized)} optimized CVs")
+
+
+if __name__ == "__main__":
+    main()
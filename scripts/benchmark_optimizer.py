@@ -0,0 +1,126 @@
+"""
+Benchmark the real optimizer HTTP path against the local fake OpenAI server.
+
+    python -m scripts.benchmark_optimizer --jobs 200 --concurrency 32 \\
+        --latency lognormal:0.8,0.4 --rate-limit-rate 0.05 --error-rate 0.02
+
+Runs a sequential baseline, the async optimize_many path, and a cached
+second pass, and prints throughput, latency percentiles and how many
+requests (including retries) reached the server.
+"""
+
+import argparse
+import os
+import statistics
+import tempfile
+import time
+from typing import List
+
+from agents.async_cv_optimization_agent import AsyncOpenAICVOptimizationAgent
+from agents.cv_optimization_agent import OpenAICVOptimizationAgent
+from agents.retry_policy import RetryPolicy
+from models.cv import CV
+from models.job import Job
+from scripts.fake_openai_server import FakeOpenAIServer
+from storage.optimization_cache import OptimizationCache
+
+
+def _jobs(count: int) -> List[Job]:
+    return [
+        Job(
+            id=f"bench-{i}",
+            title=f"Backend Engineer {i}",
+            company=f"Company {i % 25}",
+            description=f"Build Python services #{i}. " * 40,
+        )
+        for i in range(count)
+    ]
+
+
+def _report(name: str, jobs: int, elapsed: float, latencies: List[float], requests: int, failed: int):
+    latencies = sorted(latencies) or [0.0]
+    p95 = latencies[min(len(latencies) - 1, int(len(latencies) * 0.95))]
+    print(
+        f"{name:<18} jobs={jobs:<4} failed={failed:<3} elapsed={elapsed:7.2f}s "
+        f"jobs/min={jobs / elapsed * 60 if elapsed else 0:8.1f} "
+        f"p50={statistics.median(latencies):5.2f}s p95={p95:5.2f}s requests={requests}"
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Optimizer benchmark against a fake OpenAI server")
+    parser.add_argument("--jobs", type=int, default=50)
+    parser.add_argument("--sequential-jobs", type=int, default=10)
+    parser.add_argument("--concurrency", type=int, default=16)
+    parser.add_argument("--latency", default="lognormal:0.5,0.4")
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--rate-limit-rate", type=float, default=0.0)
+    parser.add_argument("--retry-after", type=float, default=0.5)
+    parser.add_argument("--prompt-tokens", default=os.environ.get("FAKE_OPENAI_PROMPT_TOKENS"))
+    parser.add_argument("--completion-tokens", default=os.environ.get("FAKE_OPENAI_COMPLETION_TOKENS"))
+    args = parser.parse_args()
+
+    os.environ.setdefault("OPENAI_API_KEY", "fake")
+
+    server = FakeOpenAIServer(
+        latency=args.latency,
+        error_rate=args.error_rate,
+        rate_limit_rate=args.rate_limit_rate,
+        retry_after=args.retry_after,
+        prompt_tokens=args.prompt_tokens,
+        completion_tokens=args.completion_tokens,
+    ).start()
+
+    cv = CV(full_name="Bench User", skills=["Python", "SQL"], summary="Backend developer")
+    jobs = _jobs(args.jobs)
+
+    try:
+        # Sequential baseline on a sample - the full set would take too long
+        sample = _jobs(args.sequential_jobs)
+        agent = OpenAICVOptimizationAgent(base_url=server.base_url, retry_policy=RetryPolicy())
+        before = server.stats["requests"]
+        latencies, failed = [], 0
+        started = time.perf_counter()
+        for job in sample:
+            job_started = time.perf_counter()
+            try:
+                agent.optimize(cv, job)
+            except Exception:
+                failed += 1
+            latencies.append(time.perf_counter() - job_started)
+        _report("sequential", len(sample), time.perf_counter() - started, latencies,
+                server.stats["requests"] - before, failed)
+
+        with tempfile.TemporaryDirectory() as tmp:
+            cache = OptimizationCache(os.path.join(tmp, "bench.sqlite"))
+            async_agent = AsyncOpenAICVOptimizationAgent(
+                cache=cache,
+                max_concurrency=args.concurrency,
+                requests_per_minute=None,
+                base_url=server.base_url,
+                retry_policy=RetryPolicy(),
+            )
+
+            for name in ("async", "async (cached)"):
+                before = server.stats["requests"]
+                started = time.perf_counter()
+                outcomes = async_agent.optimize_all(cv, jobs)
+                _report(
+                    name,
+                    len(outcomes),
+                    time.perf_counter() - started,
+                    [o.elapsed_seconds for o in outcomes],
+                    server.stats["requests"] - before,
+                    sum(1 for o in outcomes if o.error),
+                )
+
+            print(f"cache: {cache.stats()}")
+            cache.close()
+
+        print(f"server: {dict(server.stats)}")
+    finally:
+        server.stop()
+
+
+if __name__ == "__main__":
+    main()
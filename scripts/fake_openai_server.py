@@ -0,0 +1,261 @@
+"""
+Local deterministic stand-in for the OpenAI chat completions API.
+
+Point the real client at it (OpenAICVOptimizationAgent(base_url=...) or
+OPENAI_BASE_URL) to load-test concurrency, retries and caching without
+network access:
+
+    python -m scripts.fake_openai_server --port 8765 --latency lognormal:0.8,0.4 \\
+        --error-rate 0.02 --rate-limit-rate 0.05
+
+Latency specs: fixed:<s> | uniform:<min>,<max> | lognormal:<median>,<sigma>.
+Reported usage defaults to len/4 estimates; --prompt-tokens and
+--completion-tokens (or FAKE_OPENAI_PROMPT_TOKENS / FAKE_OPENAI_COMPLETION_TOKENS)
+override it with a count or a spec of the same form, e.g. uniform:800,1600.
+Outcomes are derived from a hash of the request body and how many times it
+has been seen, so a run is reproducible regardless of request ordering.
+"""
+
+import argparse
+import hashlib
+import json
+import math
+import os
+import random
+import threading
+import time
+import uuid
+from collections import Counter
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Callable, Dict, Optional
+
+
+def parse_latency(spec: str) -> Callable[[random.Random], float]:
+    kind, _, args = spec.partition(":")
+    values = [float(v) for v in args.split(",") if v]
+
+    if kind == "fixed":
+        return lambda rng: values[0]
+    if kind == "uniform":
+        return lambda rng: rng.uniform(values[0], values[1])
+    if kind == "lognormal":
+        median, sigma = values
+        return lambda rng: rng.lognormvariate(math.log(median), sigma)
+    raise ValueError(f"Unknown latency distribution: {spec}")
+
+
+def parse_tokens(spec: str) -> Callable[[random.Random], int]:
+    """
+    Token count spec: a plain integer or a latency-style distribution.
+    """
+    if spec.isdigit():
+        spec = f"fixed:{spec}"
+    draw = parse_latency(spec)
+    return lambda rng: max(0, round(draw(rng)))
+
+
+def _fake_value(schema: Dict[str, Any], name: str) -> Any:
+    kind = schema.get("type")
+    if kind == "object":
+        return {
+            key: _fake_value(sub_schema, key)
+            for key, sub_schema in schema.get("properties", {}).items()
+        }
+    if kind == "array":
+        return [_fake_value(schema.get("items", {}), name) for _ in range(3)]
+    if kind in ("integer", "number"):
+        return 1
+    if kind == "boolean":
+        return True
+    return f"Fake {name.replace('_', ' ')}"
+
+
+class FakeOpenAIServer:
+    """
+    Threaded HTTP server answering POST /v1/chat/completions.
+
+    error_rate requests fail with 500, rate_limit_rate with 429 and a
+    Retry-After header; the rest succeed after a latency drawn from the
+    configured distribution. prompt_tokens / completion_tokens replace the
+    len/4 usage estimates. GET /stats returns request counters.
+    """
+
+    def __init__(
+        self,
+        host: str = "127.0.0.1",
+        port: int = 0,
+        latency: str = "fixed:0.05",
+        error_rate: float = 0.0,
+        rate_limit_rate: float = 0.0,
+        retry_after: float = 1.0,
+        prompt_tokens: Optional[str] = None,
+        completion_tokens: Optional[str] = None,
+        seed: int = 0,
+    ):
+        self.latency = parse_latency(latency)
+        self.prompt_tokens = parse_tokens(prompt_tokens) if prompt_tokens else None
+        self.completion_tokens = parse_tokens(completion_tokens) if completion_tokens else None
+        self.error_rate = error_rate
+        self.rate_limit_rate = rate_limit_rate
+        self.retry_after = retry_after
+        self.seed = seed
+
+        self.stats: Counter = Counter()
+        self._seen: Counter = Counter()
+        self._lock = threading.Lock()
+
+        self._httpd = ThreadingHTTPServer((host, port), self._handler_class())
+        self._httpd.daemon_threads = True
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def base_url(self) -> str:
+        host, port = self._httpd.server_address[:2]
+        return f"http://{host}:{port}/v1"
+
+    def start(self) -> "FakeOpenAIServer":
+        self._thread = threading.Thread(target=self._httpd.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self._httpd.shutdown()
+        self._httpd.server_close()
+
+    def serve_forever(self) -> None:
+        self._httpd.serve_forever()
+
+    # ---------- request handling ----------
+
+    def _respond(self, body: bytes):
+        """
+        Returns (status, headers, payload, delay) for one completion request.
+        """
+        digest = hashlib.sha256(body).hexdigest()
+        with self._lock:
+            self._seen[digest] += 1
+            self.stats["requests"] += 1
+            rng = random.Random(f"{self.seed}:{digest}:{self._seen[digest]}")
+
+        roll = rng.random()
+        if roll < self.rate_limit_rate:
+            with self._lock:
+                self.stats["rate_limited"] += 1
+            return 429, {"retry-after": str(self.retry_after)}, {
+                "error": {"message": "Rate limit reached (fake)", "type": "requests", "code": "rate_limit_exceeded"}
+            }, 0.0
+
+        if roll < self.rate_limit_rate + self.error_rate:
+            with self._lock:
+                self.stats["errors"] += 1
+            return 500, {}, {
+                "error": {"message": "Internal server error (fake)", "type": "server_error", "code": None}
+            }, self.latency(rng)
+
+        request = json.loads(body)
+        prompt_tokens = sum(
+            len(str(message.get("content", ""))) for message in request.get("messages", [])
+        ) // 4
+
+        response_format = request.get("response_format") or {}
+        if response_format.get("type") == "json_schema":
+            schema = response_format["json_schema"]["schema"]
+            content = json.dumps(_fake_value(schema, "response"))
+        else:
+            content = "Fake completion"
+        completion_tokens = max(1, len(content) // 4)
+
+        if self.prompt_tokens is not None:
+            prompt_tokens = self.prompt_tokens(rng)
+        if self.completion_tokens is not None:
+            completion_tokens = self.completion_tokens(rng)
+
+        with self._lock:
+            self.stats["completed"] += 1
+            self.stats["prompt_tokens"] += prompt_tokens
+            self.stats["completion_tokens"] += completion_tokens
+
+        return 200, {}, {
+            "id": f"chatcmpl-{uuid.uuid4().hex}",
+            "object": "chat.completion",
+            "created": int(time.time()),
+            "model": request.get("model", "fake"),
+            "choices": [
+                {
+                    "index": 0,
+                    "message": {"role": "assistant", "content": content},
+                    "finish_reason": "stop",
+                }
+            ],
+            "usage": {
+                "prompt_tokens": prompt_tokens,
+                "completion_tokens": completion_tokens,
+                "total_tokens": prompt_tokens + completion_tokens,
+            },
+        }, self.latency(rng)
+
+    def _handler_class(self):
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def do_POST(self):
+                body = self.rfile.read(int(self.headers.get("Content-Length", 0)))
+                if not self.path.rstrip("/").endswith("/chat/completions"):
+                    self._send(404, {}, {"error": {"message": "Not found"}})
+                    return
+
+                status, headers, payload, delay = server._respond(body)
+                time.sleep(delay)
+                self._send(status, headers, payload)
+
+            def do_GET(self):
+                if self.path.rstrip("/").endswith("/stats"):
+                    with server._lock:
+                        self._send(200, {}, dict(server.stats))
+                else:
+                    self._send(404, {}, {"error": {"message": "Not found"}})
+
+            def _send(self, status, headers, payload):
+                data = json.dumps(payload).encode("utf-8")
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(data)))
+                for key, value in headers.items():
+                    self.send_header(key, value)
+                self.end_headers()
+                self.wfile.write(data)
+
+            def log_message(self, format, *args):
+                pass
+
+        return Handler
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Fake OpenAI chat completions server")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--latency", default="lognormal:0.8,0.4")
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--rate-limit-rate", type=float, default=0.0)
+    parser.add_argument("--retry-after", type=float, default=1.0)
+    parser.add_argument("--prompt-tokens", default=os.environ.get("FAKE_OPENAI_PROMPT_TOKENS"))
+    parser.add_argument("--completion-tokens", default=os.environ.get("FAKE_OPENAI_COMPLETION_TOKENS"))
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    server = FakeOpenAIServer(
+        host=args.host,
+        port=args.port,
+        latency=args.latency,
+        error_rate=args.error_rate,
+        rate_limit_rate=args.rate_limit_rate,
+        retry_after=args.retry_after,
+        prompt_tokens=args.prompt_tokens,
+        completion_tokens=args.completion_tokens,
+        seed=args.seed,
+    )
+    print(f"Fake OpenAI server listening on {server.base_url}")
+    server.serve_forever()
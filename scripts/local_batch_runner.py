@@ -0,0 +1,97 @@
+"""
+Local stand-in for the OpenAI Batch API.
+
+Reads a Batch API request file and writes a result file in the same format
+the real service produces, so batch mode can be exercised end-to-end
+without an OpenAI account.
+
+    python -m scripts.local_batch_runner requests.jsonl results.jsonl
+"""
+
+import argparse
+import json
+import uuid
+from typing import Callable, Optional
+
+
+def echo_completion(body: dict) -> str:
+    """
+    Default responder: a deterministic structured "optimized CV" built
+    from the prompt.
+    """
+    prompt = body["messages"][-1]["content"]
+    first_line = prompt.strip().splitlines()[0]
+    return json.dumps({
+        "tailored_summary": first_line,
+        "tailored_skills": [],
+        "tailored_experience": "",
+        "full_text": "OPTIMIZED CV\n" + first_line,
+        "cover_letter": "Dear hiring team,",
+    })
+
+
+def run_batch_locally(
+    requests_path: str,
+    results_path: str,
+    responder: Callable[[dict], str] = echo_completion,
+    fail_ids: Optional[set] = None,
+) -> int:
+    """
+    Answer every request in requests_path. Requests whose custom_id is in
+    fail_ids get an error result instead. Returns the number of results.
+    """
+    fail_ids = fail_ids or set()
+    count = 0
+
+    with open(requests_path, "r", encoding="utf-8") as src, open(
+        results_path, "w", encoding="utf-8"
+    ) as dst:
+        for line in src:
+            if not line.strip():
+                continue
+            request = json.loads(line)
+            custom_id = request["custom_id"]
+
+            if custom_id in fail_ids:
+                result = {
+                    "id": f"batch_req_{uuid.uuid4().hex}",
+                    "custom_id": custom_id,
+                    "response": None,
+                    "error": {"code": "server_error", "message": "Simulated failure"},
+                }
+            else:
+                body = request["body"]
+                result = {
+                    "id": f"batch_req_{uuid.uuid4().hex}",
+                    "custom_id": custom_id,
+                    "response": {
+                        "status_code": 200,
+                        "request_id": uuid.uuid4().hex,
+                        "body": {
+                            "object": "chat.completion",
+                            "model": body.get("model"),
+                            "choices": [
+                                {
+                                    "index": 0,
+                                    "message": {"role": "assistant", "content": responder(body)},
+                                    "finish_reason": "stop",
+                                }
+                            ],
+                        },
+                    },
+                    "error": None,
+                }
+
+            dst.write(json.dumps(result) + "\n")
+            count += 1
+
+    return count
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Run a Batch API request file locally")
+    parser.add_argument("requests_path")
+    parser.add_argument("results_path")
+    args = parser.parse_args()
+
+    print(f"Wrote {run_batch_locally(args.requests_path, args.results_path)} results")
@@ -0,0 +1,78 @@
+"""
+Query historical run results without rereading every run file.
+
+Examples:
+    python -m scripts.query_results failures --since 30d
+    python -m scripts.query_results submit-rate --since 2026-09-01
+    python -m scripts.query_results errors --limit 5
+    python -m scripts.query_results daily --since 7d
+"""
+
+import argparse
+import re
+import time
+from datetime import datetime, timedelta
+
+from storage.results_analytics import ResultsAnalytics
+
+
+def parse_since(value: str) -> str:
+    """
+    Accept an ISO date/datetime or a relative window like "30d" / "12h".
+    """
+    if not value:
+        return ""
+
+    match = re.fullmatch(r"(\d+)([dh])", value.strip())
+    if match:
+        amount, unit = int(match.group(1)), match.group(2)
+        delta = timedelta(days=amount) if unit == "d" else timedelta(hours=amount)
+        return (datetime.utcnow() - delta).isoformat()
+
+    return datetime.fromisoformat(value).isoformat()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Query historical job application results")
+    parser.add_argument("command", choices=["ingest", "failures", "submit-rate", "errors", "daily"])
+    parser.add_argument("--since", default="", help="ISO date or relative window (30d, 12h)")
+    parser.add_argument("--limit", type=int, default=10)
+    parser.add_argument("--results-dir", default="results")
+    parser.add_argument("--db", default=None, help="Analytics database path")
+    args = parser.parse_args()
+
+    analytics = ResultsAnalytics(args.db) if args.db else ResultsAnalytics()
+
+    started = time.perf_counter()
+    added = analytics.ingest(args.results_dir)
+    ingest_ms = (time.perf_counter() - started) * 1000
+
+    if args.command == "ingest":
+        print(f"Ingested {added} new rows in {ingest_ms:.1f}ms")
+        return
+
+    since = parse_since(args.since)
+
+    started = time.perf_counter()
+    if args.command == "failures":
+        headers = ("company", "failures")
+        rows = analytics.top_failing_companies(since, args.limit)
+    elif args.command == "submit-rate":
+        headers = ("ats", "total", "submitted", "submit_rate_%")
+        rows = analytics.submit_rate_by_ats(since)
+    elif args.command == "errors":
+        headers = ("error_type", "occurrences")
+        rows = analytics.error_breakdown(since, args.limit)
+    else:
+        headers = ("day", "submitted", "failed")
+        rows = analytics.daily_counts(since)
+    query_ms = (time.perf_counter() - started) * 1000
+
+    print(" | ".join(headers))
+    for row in rows:
+        print(" | ".join(str(v) for v in row))
+    print(f"\n({len(rows)} rows, query {query_ms:.1f}ms, ingested {added} new rows in {ingest_ms:.1f}ms)")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,4 +1,5 @@
 from storage.result_store import ResultStore
+from storage.optimization_cache import OptimizationCache
 from models.cv import CV
 from models.job import Job
 from models.job_queue import JobQueue
@@ -25,7 +26,7 @@ def retry_failed(filepath: str, cv: CV):
         return
 
     job_queue = JobQueue(failed_jobs)
-    optimizer = OpenAICVOptimizationAgent()
+    optimizer = OpenAICVOptimizationAgent(cache=OptimizationCache())
     submission_agent = SubmissionAgent(optimizer)
 
     submission_agent.process_jobs(cv, job_queue)
@@ -0,0 +1,228 @@
+import glob
+import hashlib
+import json
+import logging
+import os
+import re
+import sqlite3
+import threading
+import time
+from typing import Iterable, List, Optional, Tuple
+from urllib.parse import urlparse, parse_qsl, urlencode
+
+from execution.greenhouse.urls import parse_greenhouse_job_url
+from models.job import Job
+
+logger = logging.getLogger(__name__)
+
+# Query parameters that identify the traffic source, not the posting
+_TRACKING_PARAMS = {"gh_src", "source", "src", "ref", "referrer", "lever-source", "gclid", "fbclid"}
+
+
+def normalize_application_url(url: str) -> Optional[str]:
+    """
+    Canonical form of an application URL, so the same posting reached
+    through different links maps to one key.
+    """
+    if not url:
+        return None
+
+    greenhouse = parse_greenhouse_job_url(url)
+    if greenhouse is not None:
+        board, job_id = greenhouse
+        return f"greenhouse:{board}/{job_id}"
+
+    parsed = urlparse(url.strip())
+    host = (parsed.hostname or "").lower()
+    if host.startswith("www."):
+        host = host[4:]
+
+    query = sorted(
+        (k, v)
+        for k, v in parse_qsl(parsed.query)
+        if k.lower() not in _TRACKING_PARAMS and not k.lower().startswith("utm_")
+    )
+
+    path = parsed.path.rstrip("/")
+    normalized = f"{host}{path}"
+    if query:
+        normalized += "?" + urlencode(query)
+    return normalized
+
+
+def company_title_hash(company: str, title: str) -> str:
+    def clean(text: str) -> str:
+        return re.sub(r"\s+", " ", (text or "").strip().lower())
+
+    payload = f"{clean(company)}|{clean(title)}"
+    return hashlib.sha1(payload.encode("utf-8")).hexdigest()
+
+
+def application_keys(company: str, title: str, application_url: Optional[str] = None) -> List[str]:
+    keys = [f"ct:{company_title_hash(company, title)}"]
+    url_key = normalize_application_url(application_url)
+    if url_key:
+        keys.insert(0, f"url:{url_key}")
+    return keys
+
+
+class ApplicationIndex:
+    """
+    Persistent index of every past submission and failure.
+
+    Each outcome is stored under two keys - the normalized application URL
+    and a company/title hash (used for jobs without a URL) - in a SQLite table whose primary key is the
+    lookup key, so a lookup is a single B-tree probe even with hundreds of
+    thousands of entries. A "submitted" status is never downgraded to
+    "failed".
+    """
+
+    SUBMITTED = "submitted"
+    FAILED = "failed"
+
+    def __init__(self, path: str = os.path.join("cache", "applications.sqlite")):
+        self.path = path
+
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS applications (
+                key TEXT PRIMARY KEY,
+                status TEXT NOT NULL,
+                updated_at REAL NOT NULL
+            ) WITHOUT ROWID
+            """
+        )
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS ingested_runs (path TEXT PRIMARY KEY)"
+        )
+        self._conn.commit()
+
+    def lookup(self, job: Job) -> Optional[str]:
+        """
+        Status of a previous application to this posting, or None.
+
+        The normalized URL decides. A company/title match alone only counts
+        for jobs without a URL; otherwise it is a repost under another URL
+        (e.g. a multi-location copy), which is logged and processed.
+        """
+        keys = application_keys(job.company, job.title, job.application_url)
+        placeholders = ",".join("?" for _ in keys)
+
+        with self._lock:
+            statuses = dict(
+                self._conn.execute(
+                    f"SELECT key, status FROM applications WHERE key IN ({placeholders})",
+                    keys,
+                ).fetchall()
+            )
+
+        url_key, title_key = (keys[0], keys[1]) if len(keys) == 2 else (None, keys[0])
+        if url_key is not None and url_key in statuses:
+            return statuses[url_key]
+
+        status = statuses.get(title_key)
+        if status is None or url_key is None:
+            return status
+
+        logger.info(
+            "Same company/title seen under another URL, processing | title=%s | company=%s | previous=%s",
+            job.title,
+            job.company,
+            status,
+        )
+        return None
+
+    def record(
+        self,
+        company: str,
+        title: str,
+        status: str,
+        application_url: Optional[str] = None,
+    ) -> None:
+        with self._lock:
+            self._upsert(application_keys(company, title, application_url), status)
+            self._conn.commit()
+
+    def ingest_results(self, results_dir: str = "results") -> int:
+        """
+        Backfill from ResultStore run files not ingested yet.
+        Returns the number of job records added.
+        """
+        added = 0
+        paths = sorted(
+            glob.glob(os.path.join(results_dir, "run_*.json"))
+            + glob.glob(os.path.join(results_dir, "run_*.jsonl"))
+        )
+
+        for path in paths:
+            with self._lock:
+                seen = self._conn.execute(
+                    "SELECT 1 FROM ingested_runs WHERE path = ?", (path,)
+                ).fetchone()
+            if seen:
+                continue
+
+            records = list(_read_run_records(path))
+            with self._lock:
+                for company, title, status, url in records:
+                    self._upsert(application_keys(company, title, url), status)
+                self._conn.execute(
+                    "INSERT OR IGNORE INTO ingested_runs (path) VALUES (?)", (path,)
+                )
+                self._conn.commit()
+            added += len(records)
+
+        if added:
+            logger.info("Application index backfilled | records=%d", added)
+        return added
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+    def _upsert(self, keys: Iterable[str], status: str) -> None:
+        now = time.time()
+        for key in keys:
+            self._conn.execute(
+                """
+                INSERT INTO applications (key, status, updated_at) VALUES (?, ?, ?)
+                ON CONFLICT(key) DO UPDATE SET
+                    status = CASE
+                        WHEN applications.status = 'submitted' THEN 'submitted'
+                        ELSE excluded.status
+                    END,
+                    updated_at = excluded.updated_at
+                """,
+                (key, status, now),
+            )
+
+
+def _read_run_records(path: str) -> Iterable[Tuple[str, str, str, Optional[str]]]:
+    """
+    (company, title, status, application_url) for every job in a run file.
+    """
+    if path.endswith(".jsonl"):
+        jobs = []
+        with open(path, "r", encoding="utf-8") as f:
+            for line in f:
+                try:
+                    record = json.loads(line)
+                except json.JSONDecodeError:
+                    continue
+                if record.get("type", "job") == "job":
+                    jobs.append(record)
+    else:
+        with open(path, "r", encoding="utf-8") as f:
+            jobs = json.load(f).get("jobs", [])
+
+    for job in jobs:
+        if "company" not in job or "status" not in job:
+            continue
+        yield job["company"], job.get("title", ""), job["status"], job.get("application_url")
@@ -0,0 +1,207 @@
+import hashlib
+import logging
+import random
+import re
+import threading
+from collections import defaultdict
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+from models.durable_job_queue import job_key
+from models.job import Job
+from models.optimized_cv import OptimizedCV
+
+logger = logging.getLogger(__name__)
+
+_MERSENNE_PRIME = (1 << 61) - 1
+_MAX_HASH = (1 << 32) - 1
+_WORD = re.compile(r"\w+")
+
+
+class JobSimilarityIndex:
+    """
+    In-memory MinHash/LSH index of job postings for one run.
+
+    Each job's title + description is reduced to word shingles and a MinHash
+    signature. Signatures are split into bands; jobs that share a band bucket
+    are candidates and are accepted when their estimated Jaccard similarity
+    is >= threshold. Only postings of the same company are compared, so a
+    CV tailored for one employer is never reused for another.
+
+    A near-duplicate's OptimizedCV is reused with the new job attached,
+    saving the LLM call for reposts and multi-location copies.
+    """
+
+    def __init__(
+        self,
+        threshold: float = 0.85,
+        num_perm: int = 128,
+        bands: int = 16,
+        shingle_size: int = 3,
+        min_shingles: int = 20,
+        seed: int = 1,
+    ):
+        if num_perm % bands:
+            raise ValueError("num_perm must be divisible by bands")
+
+        self.threshold = threshold
+        self.num_perm = num_perm
+        self.bands = bands
+        self.rows = num_perm // bands
+        self.shingle_size = shingle_size
+        self.min_shingles = min_shingles
+
+        rng = random.Random(seed)
+        self._perms = [
+            (rng.randrange(1, _MERSENNE_PRIME), rng.randrange(0, _MERSENNE_PRIME))
+            for _ in range(num_perm)
+        ]
+
+        self._buckets: Dict[Tuple[str, int, Tuple[int, ...]], Set[str]] = defaultdict(set)
+        self._entries: Dict[str, Tuple[List[int], Optional[OptimizedCV]]] = {}
+        self._lock = threading.Lock()
+
+        self.lookups = 0
+        self.reuses = 0
+
+    def find(self, job: Job) -> Optional[OptimizedCV]:
+        """
+        OptimizedCV of an indexed near-duplicate of job, re-targeted to job.
+        """
+        signature = self._signature(job)
+
+        with self._lock:
+            self.lookups += 1
+            if signature is None:
+                return None
+
+            best_key, best_similarity = self._best_match(job, signature)
+            if best_key is None or best_similarity < self.threshold:
+                return None
+
+            self.reuses += 1
+            optimized_cv = self._entries[best_key][1]
+
+        logger.info(
+            "Near-duplicate job reused | job=%s | company=%s | similarity=%.2f",
+            job.title,
+            job.company,
+            best_similarity,
+        )
+        return optimized_cv.model_copy(update={"job": job})
+
+    def add(self, job: Job, optimized_cv: OptimizedCV) -> None:
+        signature = self._signature(job)
+        if signature is None:
+            return
+
+        with self._lock:
+            self._insert(job, signature, optimized_cv)
+
+    def add_many(self, items: Iterable[Tuple[Job, OptimizedCV]]) -> int:
+        """
+        Index (job, optimized_cv) pairs, e.g. the representatives optimized
+        ahead of the graph run, so their twins never depend on the order
+        in which runners reach them. Returns how many were indexed.
+        """
+        signed = [(job, self._signature(job), optimized_cv) for job, optimized_cv in items]
+
+        with self._lock:
+            indexed = 0
+            for job, signature, optimized_cv in signed:
+                if signature is not None:
+                    self._insert(job, signature, optimized_cv)
+                    indexed += 1
+        return indexed
+
+    def unique(self, jobs: List[Job]) -> List[Job]:
+        """
+        jobs without the near-duplicates of earlier jobs in the list.
+        Used to avoid optimizing duplicates ahead of the graph run; the
+        index itself is not modified.
+        """
+        scratch = JobSimilarityIndex(
+            threshold=self.threshold,
+            num_perm=self.num_perm,
+            bands=self.bands,
+            shingle_size=self.shingle_size,
+            min_shingles=self.min_shingles,
+        )
+        scratch._perms = self._perms
+
+        kept: List[Job] = []
+        for job in jobs:
+            signature = scratch._signature(job)
+            if signature is not None:
+                _, similarity = scratch._best_match(job, signature)
+                if similarity >= self.threshold:
+                    continue
+                scratch._insert(job, signature, None)
+            kept.append(job)
+
+        return kept
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "indexed": len(self._entries),
+                "lookups": self.lookups,
+                "reuses": self.reuses,
+                "reuse_rate": round(self.reuses / self.lookups, 3) if self.lookups else 0.0,
+            }
+
+    # ---------- MinHash / LSH ----------
+
+    def _signature(self, job: Job) -> Optional[List[int]]:
+        if not job.description:
+            return None
+
+        words = _WORD.findall(f"{job.title} {job.description}".lower())
+        shingles = {
+            " ".join(words[i:i + self.shingle_size])
+            for i in range(len(words) - self.shingle_size + 1)
+        }
+        if len(shingles) < self.min_shingles:
+            return None
+
+        hashes = [
+            int.from_bytes(hashlib.blake2b(s.encode("utf-8"), digest_size=4).digest(), "big")
+            for s in shingles
+        ]
+        return [
+            min(((a * h + b) % _MERSENNE_PRIME) & _MAX_HASH for h in hashes)
+            for a, b in self._perms
+        ]
+
+    def _bands(self, signature: List[int]):
+        for band in range(self.bands):
+            yield tuple(signature[band * self.rows:(band + 1) * self.rows])
+
+    def _insert(self, job: Job, signature: List[int], optimized_cv: Optional[OptimizedCV]) -> None:
+        key = job_key(job)
+        company = self._company(job)
+
+        self._entries[key] = (signature, optimized_cv)
+        for band, band_hash in enumerate(self._bands(signature)):
+            self._buckets[(company, band, band_hash)].add(key)
+
+    def _best_match(self, job: Job, signature: List[int]) -> Tuple[Optional[str], float]:
+        company = self._company(job)
+        candidates: Set[str] = set()
+        for band, band_hash in enumerate(self._bands(signature)):
+            candidates |= self._buckets.get((company, band, band_hash), set())
+        candidates.discard(job_key(job))
+
+        best_key, best_similarity = None, 0.0
+        for candidate in candidates:
+            similarity = self._similarity(signature, self._entries[candidate][0])
+            if similarity > best_similarity:
+                best_key, best_similarity = candidate, similarity
+        return best_key, best_similarity
+
+    @staticmethod
+    def _similarity(a: List[int], b: List[int]) -> float:
+        return sum(1 for x, y in zip(a, b) if x == y) / len(a)
+
+    @staticmethod
+    def _company(job: Job) -> str:
+        return job.company.strip().lower()
@@ -1,70 +1,210 @@
 import json
 import os
+import re
+import threading
+import time
+import uuid
 from datetime import datetime
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Optional, Union
+
+from storage.application_index import ApplicationIndex
+
+
+# "TimeoutError: form never loaded" -> "TimeoutError"
+_ERROR_TYPE_PREFIX = re.compile(r"^([A-Z][A-Za-z0-9_]*):")
+
+
+def error_type_for(error: Union[str, BaseException]) -> str:
+    """
+    Class name of an exception, or the "Type:" prefix of an error message.
+    """
+    if isinstance(error, BaseException):
+        return type(error).__name__
+    match = _ERROR_TYPE_PREFIX.match(str(error))
+    return match.group(1) if match else "Exception"
 
 
 class ResultStore:
     """
-    Persists the results of a single run to a JSON file.
+    Persists the results of a single run to an append-only JSONL file.
+
+    The first line describes the run, every record_success / record_failure
+    is appended (and flushed) immediately, and save() appends a summary
+    line. fsync is batched: records written since the last fsync are synced
+    by a timer at most fsync_interval seconds later, so a crash loses at
+    most that window of results.
+
+    Every store writes its own file (timestamp plus a random suffix), so
+    runs started in the same second never share one.
+
+    Outcomes are also written through to the cross-run ApplicationIndex
+    when one is given.
     """
 
-    def __init__(self, candidate_name: str):
+    def __init__(
+        self,
+        candidate_name: str,
+        application_index: Optional[ApplicationIndex] = None,
+        results_dir: str = "results",
+        fsync_interval: float = 1.0,
+    ):
         timestamp = datetime.utcnow().strftime("%Y-%m-%d_%H-%M-%S")
-        self.run_id = f"run_{timestamp}"
-        self.filepath = os.path.join("results", f"{self.run_id}.json")
+        self.run_id = f"run_{timestamp}_{uuid.uuid4().hex[:8]}"
+        self.filepath = os.path.join(results_dir, f"{self.run_id}.jsonl")
 
         self.data: Dict[str, Any] = {
             "run_id": self.run_id,
             "candidate": candidate_name,
             "started_at": datetime.utcnow().isoformat(),
-            "jobs": [],
         }
 
-    def record_success(self, company: str, title: str) -> None:
-        self.data["jobs"].append(
+        self.application_index = application_index
+        self.fsync_interval = fsync_interval
+
+        # Running counters - finalize() never rescans the records
+        self.total = 0
+        self.submitted = 0
+        self.failed = 0
+
+        self._lock = threading.Lock()
+        self._last_fsync = time.monotonic()
+        self._sync_timer: Optional[threading.Timer] = None
+
+        os.makedirs(results_dir, exist_ok=True)
+        self._file = open(self.filepath, "x", encoding="utf-8")
+        self._append({"type": "run", **self.data}, force_sync=True)
+
+    def record_success(self, company: str, title: str, application_url: Optional[str] = None) -> None:
+        self._record_job(
             {
                 "company": company,
                 "title": title,
+                "application_url": application_url,
                 "status": "submitted",
                 "timestamp": datetime.utcnow().isoformat(),
             }
         )
 
-    def record_failure(self, company: str, title: str, error: str) -> None:
-        self.data["jobs"].append(
+        if self.application_index is not None:
+            self.application_index.record(company, title, "submitted", application_url)
+
+    def record_failure(
+        self,
+        company: str,
+        title: str,
+        error: Union[str, BaseException],
+        application_url: Optional[str] = None,
+    ) -> None:
+        """
+        error may be the exception itself (its class is recorded) or a
+        message; "SomeError: details" messages record "SomeError".
+        """
+        self._record_job(
             {
                 "company": company,
                 "title": title,
+                "application_url": application_url,
                 "status": "failed",
-                "error": error,
-                "error_type": error.__class__.__name__ if hasattr(error, "__class__") else "Exception",
+                "error": str(error),
+                "error_type": error_type_for(error),
                 "timestamp": datetime.utcnow().isoformat(),
             }
         )
 
+        if self.application_index is not None:
+            self.application_index.record(company, title, "failed", application_url)
 
     def finalize(self) -> None:
-        total = len(self.data["jobs"])
-        submitted = sum(1 for j in self.data["jobs"] if j["status"] == "submitted")
-        failed = sum(1 for j in self.data["jobs"] if j["status"] == "failed")
-
         self.data["summary"] = {
-            "total_jobs": total,
-            "submitted": submitted,
-            "failed": failed,
+            "total_jobs": self.total,
+            "submitted": self.submitted,
+            "failed": self.failed,
             "completed_at": datetime.utcnow().isoformat(),
         }
 
     @staticmethod
     def load(filepath: str) -> Dict[str, Any]:
+        """
+        Load a run file. JSONL runs are reassembled into the same shape
+        as the legacy JSON files: {run_id, candidate, started_at, jobs, summary}.
+        """
+        if not filepath.endswith(".jsonl"):
+            with open(filepath, "r", encoding="utf-8") as f:
+                return json.load(f)
+
+        run: Dict[str, Any] = {"jobs": []}
+        jobs: List[Dict[str, Any]] = run["jobs"]
+
         with open(filepath, "r", encoding="utf-8") as f:
-            return json.load(f)
+            for line in f:
+                if not line.strip():
+                    continue
+                try:
+                    record = json.loads(line)
+                except json.JSONDecodeError:
+                    continue  # torn last line after a crash
+
+                record_type = record.pop("type", "job")
+                if record_type == "run":
+                    run.update(record)
+                elif record_type == "summary":
+                    run["summary"] = record
+                else:
+                    jobs.append(record)
 
+        return run
 
     def save(self) -> None:
         self.finalize()
-        os.makedirs("results", exist_ok=True)
-        with open(self.filepath, "w", encoding="utf-8") as f:
-            json.dump(self.data, f, indent=2)
+        self._append({"type": "summary", **self.data["summary"]}, force_sync=True)
+
+    def close(self) -> None:
+        with self._lock:
+            if self._sync_timer is not None:
+                self._sync_timer.cancel()
+                self._sync_timer = None
+            if not self._file.closed:
+                self._file.flush()
+                os.fsync(self._file.fileno())
+                self._file.close()
+
+    def _record_job(self, record: Dict[str, Any]) -> None:
+        with self._lock:
+            self.total += 1
+            if record["status"] == "submitted":
+                self.submitted += 1
+            elif record["status"] == "failed":
+                self.failed += 1
+
+        self._append({"type": "job", **record})
+
+    def _append(self, record: Dict[str, Any], force_sync: bool = False) -> None:
+        line = json.dumps(record, ensure_ascii=False) + "\n"
+
+        with self._lock:
+            self._file.write(line)
+            self._file.flush()
+
+            now = time.monotonic()
+            if force_sync or now - self._last_fsync >= self.fsync_interval:
+                self._fsync(now)
+            elif self._sync_timer is None:
+                # Sync this record even if nothing else is written
+                delay = self.fsync_interval - (now - self._last_fsync)
+                self._sync_timer = threading.Timer(delay, self._sync_pending)
+                self._sync_timer.daemon = True
+                self._sync_timer.start()
+
+    def _sync_pending(self) -> None:
+        with self._lock:
+            self._sync_timer = None
+            if not self._file.closed:
+                self._fsync(time.monotonic())
 
+    def _fsync(self, now: float) -> None:
+        # Caller holds self._lock
+        os.fsync(self._file.fileno())
+        self._last_fsync = now
+        if self._sync_timer is not None:
+            self._sync_timer.cancel()
+            self._sync_timer = None
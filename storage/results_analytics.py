@@ -0,0 +1,235 @@
+import glob
+import json
+import logging
+import os
+import sqlite3
+import threading
+from typing import Any, Dict, List, Optional, Tuple
+from urllib.parse import urlparse
+
+from storage.result_store import error_type_for
+
+logger = logging.getLogger(__name__)
+
+# Host suffix -> ATS name
+_ATS_HOSTS = {
+    "greenhouse.io": "greenhouse",
+    "lever.co": "lever",
+    "myworkdayjobs.com": "workday",
+    "ashbyhq.com": "ashby",
+    "smartrecruiters.com": "smartrecruiters",
+    "workable.com": "workable",
+}
+
+
+def error_type_of(record: Dict[str, Any]) -> Optional[str]:
+    """
+    Error class of a failed record. Runs written before ResultStore
+    recorded the real class stored "str"; for those the message prefix is
+    parsed the same way ResultStore does.
+    """
+    if record.get("status") != "failed":
+        return None
+
+    error_type = record.get("error_type")
+    if error_type and error_type != "str":
+        return error_type
+
+    return error_type_for(str(record.get("error") or ""))
+
+
+def ats_from_url(url: Optional[str]) -> str:
+    host = (urlparse(url).hostname or "").lower() if url else ""
+    for suffix, ats in _ATS_HOSTS.items():
+        if host == suffix or host.endswith("." + suffix):
+            return ats
+    return "unknown" if not host else "other"
+
+
+class ResultsAnalytics:
+    """
+    Local SQLite analytics store over historical ResultStore runs.
+
+    Runs are ingested incrementally: JSONL run files are tailed from the last
+    byte offset seen, legacy JSON files are ingested once. Job rows are
+    indexed by company, status, error type and timestamp so aggregate
+    queries never reread the run files.
+    """
+
+    def __init__(self, path: str = os.path.join("cache", "results_analytics.sqlite")):
+        self.path = path
+
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.executescript(
+            """
+            CREATE TABLE IF NOT EXISTS jobs (
+                run_id TEXT,
+                company TEXT,
+                title TEXT,
+                status TEXT,
+                error TEXT,
+                error_type TEXT,
+                ats TEXT,
+                application_url TEXT,
+                ts TEXT
+            );
+            CREATE INDEX IF NOT EXISTS idx_jobs_company ON jobs(company);
+            CREATE INDEX IF NOT EXISTS idx_jobs_status_ts ON jobs(status, ts);
+            CREATE INDEX IF NOT EXISTS idx_jobs_error_type ON jobs(error_type);
+            CREATE INDEX IF NOT EXISTS idx_jobs_ts ON jobs(ts);
+            CREATE INDEX IF NOT EXISTS idx_jobs_ats_ts ON jobs(ats, ts);
+
+            CREATE TABLE IF NOT EXISTS ingested_files (
+                path TEXT PRIMARY KEY,
+                offset INTEGER NOT NULL,
+                run_id TEXT
+            );
+            """
+        )
+        self._conn.commit()
+
+    # ---------- ingestion ----------
+
+    def ingest(self, results_dir: str = "results") -> int:
+        """
+        Ingest new records from results_dir. Returns the number of job rows added.
+        """
+        added = 0
+        for path in sorted(glob.glob(os.path.join(results_dir, "run_*.jsonl"))):
+            added += self._ingest_jsonl(path)
+        for path in sorted(glob.glob(os.path.join(results_dir, "run_*.json"))):
+            added += self._ingest_json(path)
+
+        if added:
+            logger.info("Results analytics ingested | rows=%d", added)
+        return added
+
+    def _ingest_jsonl(self, path: str) -> int:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT offset, run_id FROM ingested_files WHERE path = ?", (path,)
+            ).fetchone()
+        offset, run_id = row if row else (0, None)
+
+        if os.path.getsize(path) <= offset:
+            return 0
+
+        rows = []
+        with open(path, "rb") as f:
+            f.seek(offset)
+            for raw in f:
+                if not raw.endswith(b"\n"):
+                    break  # partially written line - pick it up next time
+                offset += len(raw)
+
+                try:
+                    record = json.loads(raw)
+                except json.JSONDecodeError:
+                    continue
+
+                record_type = record.get("type", "job")
+                if record_type == "run":
+                    run_id = record.get("run_id")
+                elif record_type == "job":
+                    rows.append(self._row(run_id, record))
+
+        with self._lock:
+            self._conn.executemany(
+                "INSERT INTO jobs VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)", rows
+            )
+            self._conn.execute(
+                "INSERT OR REPLACE INTO ingested_files (path, offset, run_id) VALUES (?, ?, ?)",
+                (path, offset, run_id),
+            )
+            self._conn.commit()
+        return len(rows)
+
+    def _ingest_json(self, path: str) -> int:
+        with self._lock:
+            seen = self._conn.execute(
+                "SELECT 1 FROM ingested_files WHERE path = ?", (path,)
+            ).fetchone()
+        if seen:
+            return 0
+
+        with open(path, "r", encoding="utf-8") as f:
+            run = json.load(f)
+
+        run_id = run.get("run_id")
+        rows = [self._row(run_id, job) for job in run.get("jobs", [])]
+
+        with self._lock:
+            self._conn.executemany(
+                "INSERT INTO jobs VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)", rows
+            )
+            self._conn.execute(
+                "INSERT INTO ingested_files (path, offset, run_id) VALUES (?, ?, ?)",
+                (path, os.path.getsize(path), run_id),
+            )
+            self._conn.commit()
+        return len(rows)
+
+    @staticmethod
+    def _row(run_id: Optional[str], record: Dict[str, Any]) -> Tuple:
+        url = record.get("application_url")
+        return (
+            run_id,
+            record.get("company"),
+            record.get("title"),
+            record.get("status"),
+            record.get("error"),
+            error_type_of(record),
+            ats_from_url(url),
+            url,
+            record.get("timestamp"),
+        )
+
+    # ---------- queries ----------
+
+    def top_failing_companies(self, since: Optional[str] = None, limit: int = 10) -> List[Tuple]:
+        return self._query(
+            "SELECT company, COUNT(*) AS failures FROM jobs "
+            "WHERE status = 'failed' AND ts >= ? "
+            "GROUP BY company ORDER BY failures DESC LIMIT ?",
+            (since or "", limit),
+        )
+
+    def submit_rate_by_ats(self, since: Optional[str] = None) -> List[Tuple]:
+        return self._query(
+            "SELECT ats, COUNT(*) AS total, "
+            "SUM(status = 'submitted') AS submitted, "
+            "ROUND(100.0 * SUM(status = 'submitted') / COUNT(*), 1) AS submit_rate "
+            "FROM jobs WHERE ts >= ? GROUP BY ats ORDER BY total DESC",
+            (since or "",),
+        )
+
+    def error_breakdown(self, since: Optional[str] = None, limit: int = 10) -> List[Tuple]:
+        return self._query(
+            "SELECT error_type, COUNT(*) AS occurrences FROM jobs "
+            "WHERE status = 'failed' AND ts >= ? "
+            "GROUP BY error_type ORDER BY occurrences DESC LIMIT ?",
+            (since or "", limit),
+        )
+
+    def daily_counts(self, since: Optional[str] = None) -> List[Tuple]:
+        return self._query(
+            "SELECT substr(ts, 1, 10) AS day, "
+            "SUM(status = 'submitted') AS submitted, "
+            "SUM(status = 'failed') AS failed "
+            "FROM jobs WHERE ts >= ? GROUP BY day ORDER BY day",
+            (since or "",),
+        )
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+    def _query(self, sql: str, params: Tuple) -> List[Tuple]:
+        with self._lock:
+            return self._conn.execute(sql, params).fetchall()
@@ -0,0 +1,144 @@
+import logging
+import os
+import sqlite3
+import threading
+import time
+from typing import Dict, Optional, Set, Tuple
+
+from models.submission.form_schema import SubmissionFormSchema
+
+logger = logging.getLogger(__name__)
+
+
+class SchemaCache:
+    """
+    Persistent cache of extracted Greenhouse form schemas.
+
+    Entries are keyed by (board slug, job id) and store a fingerprint of
+    the form. peek() returns the entry before the page is loaded so the
+    caller can validate it later; a mismatch is dropped with invalidate().
+
+    Jobs on the same board often share a question set, so on a miss the
+    caller reads the live fingerprint and find() returns any entry on the
+    same board with that fingerprint.
+    """
+
+    def __init__(self, path: str = os.path.join("cache", "form_schemas.sqlite")):
+        self.path = path
+
+        self.hits = 0
+        self.misses = 0
+        self.board_hits = 0
+        self.invalidations = 0
+
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS schemas (
+                board TEXT NOT NULL,
+                job_id TEXT NOT NULL,
+                fingerprint TEXT NOT NULL,
+                schema_json TEXT NOT NULL,
+                updated_at REAL NOT NULL,
+                PRIMARY KEY (board, job_id)
+            )
+            """
+        )
+        self._conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_schemas_board_fingerprint "
+            "ON schemas(board, fingerprint)"
+        )
+        self._conn.commit()
+
+    def find(self, board: str, fingerprint: str) -> Optional[SubmissionFormSchema]:
+        """
+        Schema of any job on board whose form has this fingerprint - jobs
+        on the same board often share a question set.
+        """
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT schema_json FROM schemas "
+                "WHERE board = ? AND fingerprint = ? LIMIT 1",
+                (board, fingerprint),
+            ).fetchone()
+
+            if row is None:
+                return None
+            self.board_hits += 1
+
+        return SubmissionFormSchema.model_validate_json(row[0])
+
+    def peek(self, board: str, job_id: str) -> Optional[Tuple[str, SubmissionFormSchema]]:
+        """
+        (fingerprint, schema) stored for exactly this job, without
+        validation - the caller checks the fingerprint once the page is
+        there and calls invalidate() on a mismatch.
+        """
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT fingerprint, schema_json FROM schemas "
+                "WHERE board = ? AND job_id = ?",
+                (board, job_id),
+            ).fetchone()
+
+            if row is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+
+        return row[0], SubmissionFormSchema.model_validate_json(row[1])
+
+    def job_ids(self, board: str) -> Set[str]:
+        """
+        Ids of the jobs on board that have an entry (not counted as lookups).
+        """
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT job_id FROM schemas WHERE board = ?", (board,)
+            ).fetchall()
+        return {row[0] for row in rows}
+
+    def invalidate(self, board: str, job_id: str) -> None:
+        with self._lock:
+            self._conn.execute(
+                "DELETE FROM schemas WHERE board = ? AND job_id = ?",
+                (board, job_id),
+            )
+            self._conn.commit()
+            self.invalidations += 1
+
+        logger.info("Schema cache invalidated | board=%s | job_id=%s", board, job_id)
+
+    def put(
+        self,
+        board: str,
+        job_id: str,
+        fingerprint: str,
+        schema: SubmissionFormSchema,
+    ) -> None:
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO schemas "
+                "(board, job_id, fingerprint, schema_json, updated_at) "
+                "VALUES (?, ?, ?, ?, ?)",
+                (board, job_id, fingerprint, schema.model_dump_json(), time.time()),
+            )
+            self._conn.commit()
+
+    def stats(self) -> Dict[str, int]:
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "board_hits": self.board_hits,
+            "invalidations": self.invalidations,
+        }
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
@@ -0,0 +1,121 @@
+import logging
+import os
+import sqlite3
+import threading
+import time
+from typing import Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+class SelectorStrategyCache:
+    """
+    Persistent memo of which locator strategy fills a field on a board.
+
+    Keyed by (board slug, field id). The Greenhouse filler tries the learned
+    strategy first and skips the slow waits of the ones that lose on that
+    board. When a learned strategy stops working the entry is dropped and
+    the next success is learned instead.
+    """
+
+    def __init__(self, path: str = os.path.join("cache", "selector_strategies.sqlite")):
+        self.path = path
+
+        self.hits = 0
+        self.misses = 0
+        self.relearns = 0
+
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS strategies (
+                board TEXT NOT NULL,
+                field_id TEXT NOT NULL,
+                strategy TEXT NOT NULL,
+                updated_at REAL NOT NULL,
+                PRIMARY KEY (board, field_id)
+            ) WITHOUT ROWID
+            """
+        )
+        self._conn.commit()
+
+        # Read-through memory copy - lookups happen once per field per job
+        self._memo: Dict[Tuple[str, str], str] = dict(
+            ((board, field_id), strategy)
+            for board, field_id, strategy in self._conn.execute(
+                "SELECT board, field_id, strategy FROM strategies"
+            )
+        )
+
+    def get(self, board: str, field_id: str) -> Optional[str]:
+        with self._lock:
+            strategy = self._memo.get((board, field_id))
+            if strategy is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+            return strategy
+
+    def record_success(self, board: str, field_id: str, strategy: str) -> None:
+        with self._lock:
+            if self._memo.get((board, field_id)) == strategy:
+                return
+            self._memo[(board, field_id)] = strategy
+            self._conn.execute(
+                "INSERT OR REPLACE INTO strategies (board, field_id, strategy, updated_at) "
+                "VALUES (?, ?, ?, ?)",
+                (board, field_id, strategy, time.time()),
+            )
+            self._conn.commit()
+
+    def record_failure(self, board: str, field_id: str, strategy: str) -> None:
+        """
+        Forget a learned strategy that no longer works.
+        """
+        with self._lock:
+            if self._memo.get((board, field_id)) != strategy:
+                return
+            del self._memo[(board, field_id)]
+            self._conn.execute(
+                "DELETE FROM strategies WHERE board = ? AND field_id = ?",
+                (board, field_id),
+            )
+            self._conn.commit()
+            self.relearns += 1
+
+        logger.info(
+            "Selector strategy stopped working | board=%s | field=%s | strategy=%s",
+            board,
+            field_id,
+            strategy,
+        )
+
+    def order(self, board: Optional[str], field_id: str, strategies: List[str]) -> List[str]:
+        """
+        strategies with the learned one for (board, field_id) moved first.
+        """
+        if board is None:
+            return list(strategies)
+
+        learned = self.get(board, field_id)
+        if learned not in strategies:
+            return list(strategies)
+        return [learned] + [s for s in strategies if s != learned]
+
+    def stats(self) -> Dict[str, int]:
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "relearns": self.relearns,
+            "entries": len(self._memo),
+        }
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()